@@ -1,14 +1,18 @@
 import 'dart:convert';
+import 'dart:io';
 import 'package:flutter/services.dart' show rootBundle;
 import 'package:path_provider/path_provider.dart';
 import 'package:sqflite/sqflite.dart';
 import 'package:path/path.dart' as path;
 import '../models/word.dart';
+import '../../shared/services/enhanced_vocabulary_loader.dart';
 import '../../core/utils/srs_algorithm.dart';
 
 class DatabaseHelper {
   static const String _dbName = 'english_learning.db';
-  static const int _dbVersion = 1;
+  static const int _dbVersion = 3;
+  // Prebuilt word database generated by tools/build_word_database.py
+  static const String _prebuiltDbAsset = 'assets/data/english_learning.db';
 
   late Database _database;
 
@@ -26,6 +30,9 @@ class DatabaseHelper {
   Future<Database> _initDatabase() async {
     final documentsDirectory = await getApplicationDocumentsDirectory();
     final dbPath = path.join(documentsDirectory.path, _dbName);
+    if (!await File(dbPath).exists()) {
+      await _copyPrebuiltDatabase(dbPath);
+    }
     return await openDatabase(
       dbPath,
       version: _dbVersion,
@@ -34,22 +41,21 @@ class DatabaseHelper {
     );
   }
 
+  // Copy the prebuilt database on first launch so the words table does not
+  // have to be imported row by row; falls back to onCreate when it is absent
+  Future<void> _copyPrebuiltDatabase(String dbPath) async {
+    try {
+      final data = await rootBundle.load(_prebuiltDbAsset);
+      final bytes = data.buffer.asUint8List(data.offsetInBytes, data.lengthInBytes);
+      await File(dbPath).writeAsBytes(bytes, flush: true);
+    } catch (e) {
+      // No prebuilt database bundled
+    }
+  }
+
   Future<void> _createDb(Database db, int version) async {
     // Create words table
-    await db.execute('''
-      CREATE TABLE words(
-        id TEXT PRIMARY KEY,
-        word TEXT NOT NULL,
-        phonetic TEXT,
-        definition TEXT NOT NULL,
-        examples TEXT NOT NULL,
-        synonyms TEXT,
-        antonyms TEXT,
-        etymology TEXT,
-        difficulty INTEGER NOT NULL,
-        tags TEXT NOT NULL
-      )
-    ''');
+    await createWordsTable(db);
 
     // Create cards table
     await db.execute('''
@@ -83,25 +89,228 @@ class DatabaseHelper {
     // Create indexes
     await db.execute('CREATE INDEX idx_cards_next_review ON cards(next_review)');
     await db.execute('CREATE INDEX idx_cards_state ON cards(state)');
+
+    await createTagTables(db);
   }
 
   Future<void> _onUpgrade(Database db, int oldVersion, int newVersion) async {
     // Handle database upgrades
     if (oldVersion < 2) {
-      // Add new columns or tables
+      // Normalized tag tables
+      await createTagTables(db);
+      await backfillWordTags(db);
+    }
+    if (oldVersion < 3) {
+      await migrateWordsRowId(db);
+    }
+  }
+
+  // Create the words table (same schema as tools/build_word_database.py).
+  // row_id is an explicit INTEGER PRIMARY KEY so VACUUM never renumbers it;
+  // the rowids of words_fts refer to it
+  static Future<void> createWordsTable(DatabaseExecutor db, {String table = 'words'}) async {
+    await db.execute('''
+      CREATE TABLE $table(
+        row_id INTEGER PRIMARY KEY,
+        id TEXT NOT NULL UNIQUE,
+        word TEXT NOT NULL,
+        phonetic TEXT,
+        definition TEXT NOT NULL,
+        examples TEXT NOT NULL,
+        synonyms TEXT,
+        antonyms TEXT,
+        etymology TEXT,
+        difficulty INTEGER NOT NULL,
+        tags TEXT NOT NULL
+      )
+    ''');
+  }
+
+  // Version 3: rebuild words with the explicit row_id key (keeping the old
+  // rowids) and reindex words_fts from the words table
+  static Future<void> migrateWordsRowId(DatabaseExecutor db) async {
+    const columns = 'id, word, phonetic, definition, examples, synonyms, antonyms, etymology, difficulty, tags';
+    await createWordsTable(db, table: 'words_v3');
+    await db.execute('INSERT INTO words_v3 (row_id, $columns) SELECT rowid, $columns FROM words');
+    await db.execute('DROP TABLE words');
+    await db.execute('ALTER TABLE words_v3 RENAME TO words');
+    await db.execute('CREATE INDEX IF NOT EXISTS idx_words_difficulty ON words(difficulty)');
+    await db.execute('CREATE INDEX IF NOT EXISTS idx_words_word ON words(word)');
+    if (await hasFullTextIndex(db)) {
+      await db.execute("INSERT INTO words_fts (words_fts) VALUES ('delete-all')");
+      final rows = await db.query('words', columns: ['row_id', 'word', 'definition', 'examples']);
+      for (final row in rows) {
+        await _insertFullText(db, row);
+      }
+    }
+  }
+
+  // Create the normalized tag tables (same schema as tools/build_word_database.py).
+  // The word_tags primary key covers tag -> word lookups, idx_word_tags_word
+  // covers word -> tag lookups.
+  static Future<void> createTagTables(DatabaseExecutor db) async {
+    await db.execute('''
+      CREATE TABLE tags(
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL UNIQUE
+      )
+    ''');
+
+    await db.execute('''
+      CREATE TABLE word_tags(
+        tag_id INTEGER NOT NULL,
+        word_id TEXT NOT NULL,
+        PRIMARY KEY (tag_id, word_id),
+        FOREIGN KEY (word_id) REFERENCES words (id) ON DELETE CASCADE,
+        FOREIGN KEY (tag_id) REFERENCES tags (id)
+      ) WITHOUT ROWID
+    ''');
+
+    await db.execute('CREATE INDEX idx_word_tags_word ON word_tags(word_id, tag_id)');
+  }
+
+  // Replace the tag rows of one word
+  static Future<void> saveWordTags(
+    DatabaseExecutor db,
+    String wordId,
+    List<String> tags,
+  ) async {
+    await db.delete('word_tags', where: 'word_id = ?', whereArgs: [wordId]);
+    for (final tag in tags) {
+      await db.insert('tags', {'name': tag}, conflictAlgorithm: ConflictAlgorithm.ignore);
+      await db.rawInsert(
+        'INSERT OR IGNORE INTO word_tags (tag_id, word_id) SELECT id, ? FROM tags WHERE name = ?',
+        [wordId, tag],
+      );
+    }
+  }
+
+  // Fill the tag tables from the JSON text in words.tags
+  static Future<void> backfillWordTags(DatabaseExecutor db) async {
+    final rows = await db.query('words', columns: ['id', 'tags']);
+    for (final row in rows) {
+      final List<String> tags;
+      try {
+        tags = List<String>.from(jsonDecode(row['tags'] as String) as List);
+      } catch (e) {
+        continue;
+      }
+      await saveWordTags(db, row['id'] as String, tags);
+    }
+  }
+
+  // List columns of the words table, stored as JSON text (same format as
+  // tools/build_word_database.py)
+  static const List<String> _listColumns = ['examples', 'synonyms', 'antonyms', 'tags'];
+
+  // Decode a words row: list columns hold JSON text, which Word.fromJson
+  // cannot read directly
+  static Word wordFromRow(Map<String, dynamic> row) {
+    final json = Map<String, dynamic>.from(row);
+    for (final column in _listColumns) {
+      final value = json[column];
+      if (value is String) json[column] = jsonDecode(value);
+    }
+    return Word.fromJson(json);
+  }
+
+  // Encode a word as a words row (list columns as JSON text)
+  static Map<String, dynamic> wordToRow(Word word) {
+    final row = word.toJson();
+    for (final column in _listColumns) {
+      final value = row[column];
+      if (value != null) row[column] = jsonEncode(value);
+    }
+    return row;
+  }
+
+  // Id of a deck entry in the words table. Entry ids are only unique within
+  // their deck (every deck numbers from cet4_00001 etc.), so they are prefixed
+  // with the deck name (same as deck_word_id in tools/build_word_database.py)
+  static String deckWordId(String deck, String id) => '$deck:$id';
+
+  // Insert a word and keep the tag tables and words_fts in sync. An existing
+  // id is updated in place so its row_id stays the words_fts rowid;
+  // conflictAlgorithm follows db.insert (null fails on a duplicate id).
+  // Returns the row_id, or 0 when the word was ignored
+  static Future<int> saveWord(
+    DatabaseExecutor db,
+    Word word, {
+    ConflictAlgorithm? conflictAlgorithm,
+    bool fullText = false,
+  }) async {
+    final row = wordToRow(word);
+    final existing = await db.query(
+      'words',
+      columns: ['row_id', 'word', 'definition', 'examples'],
+      where: 'id = ?',
+      whereArgs: [word.id],
+    );
+
+    final int rowId;
+    if (existing.isEmpty) {
+      rowId = await db.insert('words', row);
+    } else if (conflictAlgorithm == ConflictAlgorithm.ignore) {
+      return 0;
+    } else if (conflictAlgorithm == ConflictAlgorithm.replace) {
+      rowId = existing.first['row_id'] as int;
+      if (fullText) await _deleteFullText(db, existing.first);
+      await db.update('words', row, where: 'row_id = ?', whereArgs: [rowId]);
+    } else {
+      return db.insert('words', row);
     }
+
+    if (fullText) await _insertFullText(db, {...row, 'row_id': rowId});
+    await saveWordTags(db, word.id, word.tags);
+    return rowId;
+  }
+
+  // Delete a word with its tag rows and words_fts entry
+  static Future<int> deleteWord(DatabaseExecutor db, String id, {bool fullText = false}) async {
+    if (fullText) {
+      final existing = await db.query(
+        'words',
+        columns: ['row_id', 'word', 'definition', 'examples'],
+        where: 'id = ?',
+        whereArgs: [id],
+      );
+      if (existing.isNotEmpty) await _deleteFullText(db, existing.first);
+    }
+    await db.delete('word_tags', where: 'word_id = ?', whereArgs: [id]);
+    return db.delete('words', where: 'id = ?', whereArgs: [id]);
+  }
+
+  // Exact tag match through the normalized tag tables
+  static Future<List<Map<String, dynamic>>> queryWordsByTag(
+    DatabaseExecutor db,
+    String tag,
+  ) {
+    return db.rawQuery(
+      'SELECT w.* FROM tags AS t '
+      'JOIN word_tags AS wt ON wt.tag_id = t.id '
+      'JOIN words AS w ON w.id = wt.word_id '
+      'WHERE t.name = ?',
+      [tag],
+    );
   }
 
   // Load vocabulary from assets
   Future<void> loadVocabularyFromAssets(String jsonPath) async {
     final db = await database;
-    final assetString = await rootBundle.loadString(jsonPath);
-    final words = jsonDecode(assetString) as List;
+    // Large decks are bundled as shards only; the loader reads them
+    final words = await EnhancedVocabularyLoader.loadVocabularyAsset(jsonPath);
+
+    final deck = path.basenameWithoutExtension(jsonPath);
+    final fullText = await _fullTextIndex(db);
 
     await db.transaction((txn) async {
-      for (final wordData in words) {
-        final word = Word.fromJson(wordData);
-        await txn.insert('words', word.toJson(), conflictAlgorithm: ConflictAlgorithm.replace);
+      for (final word in words) {
+        await saveWord(
+          txn,
+          word.copyWith(id: deckWordId(deck, word.id)),
+          conflictAlgorithm: ConflictAlgorithm.replace,
+          fullText: fullText,
+        );
       }
     });
   }
@@ -110,7 +319,7 @@ class DatabaseHelper {
   Future<List<Word>> getAllWords() async {
     final db = await database;
     final List<Map<String, dynamic>> maps = await db.query('words');
-    return List.generate(maps.length, (i) => Word.fromJson(maps[i]));
+    return List.generate(maps.length, (i) => wordFromRow(maps[i]));
   }
 
   // Get word by ID
@@ -122,18 +331,138 @@ class DatabaseHelper {
       whereArgs: [id],
     );
     if (maps.isEmpty) return null;
-    return Word.fromJson(maps.first);
+    return wordFromRow(maps.first);
   }
 
   // Get words by tag
   Future<List<Word>> getWordsByTag(String tag) async {
     final db = await database;
-    final List<Map<String, dynamic>> maps = await db.query(
-      'words',
-      where: 'tags LIKE ?',
-      whereArgs: ['%$tag%'],
+    final List<Map<String, dynamic>> maps = await queryWordsByTag(db, tag);
+    return List.generate(maps.length, (i) => wordFromRow(maps[i]));
+  }
+
+  // Whether the FTS5 index built by tools/build_word_database.py is usable;
+  // probed once per database
+  bool? _hasFullTextIndex;
+
+  Future<bool> _fullTextIndex(DatabaseExecutor db) async {
+    return _hasFullTextIndex ??= await hasFullTextIndex(db);
+  }
+
+  // The prebuilt database always contains words_fts, but SQLite builds
+  // without FTS5 (some Android system libraries) cannot open it and fail
+  // with "no such module: fts5", so query the table instead of sqlite_master
+  static Future<bool> hasFullTextIndex(DatabaseExecutor db) async {
+    try {
+      await db.rawQuery('SELECT 1 FROM words_fts LIMIT 0');
+      return true;
+    } on DatabaseException {
+      return false;
+    }
+  }
+
+  static final RegExp _cjkRun = RegExp(r'^[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+$');
+  static final RegExp _cjkRuns = RegExp(r'[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+');
+  static final RegExp _queryToken = RegExp(
+    r'[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+|[\p{L}\p{N}]+',
+    unicode: true,
+  );
+
+  static List<String> _bigrams(String run) {
+    if (run.length == 1) return [run];
+    return [for (var i = 0; i < run.length - 1; i++) run.substring(i, i + 2)];
+  }
+
+  // Split Chinese runs into overlapping bigrams separated by spaces, like
+  // cjk_bigrams in tools/build_word_database.py; words_fts is contentless,
+  // so rows are indexed (and deleted) with this pre-tokenized text
+  static String fullTextTokens(String text) {
+    return text.replaceAllMapped(_cjkRuns, (m) => ' ${_bigrams(m.group(0)!).join(' ')} ');
+  }
+
+  static List<String> _fullTextValues(Map<String, dynamic> row) {
+    final examples = row['examples'];
+    final exampleList = examples is String ? jsonDecode(examples) as List : examples as List;
+    return [
+      fullTextTokens(row['word'] as String),
+      fullTextTokens(row['definition'] as String),
+      fullTextTokens(exampleList.join(' ')),
+    ];
+  }
+
+  static Future<void> _insertFullText(DatabaseExecutor db, Map<String, dynamic> row) async {
+    await db.rawInsert(
+      'INSERT INTO words_fts (rowid, word, definition, examples) VALUES (?, ?, ?, ?)',
+      [row['row_id'], ..._fullTextValues(row)],
+    );
+  }
+
+  // Contentless FTS5 rows are removed with the 'delete' command and the
+  // same tokens they were indexed with
+  static Future<void> _deleteFullText(DatabaseExecutor db, Map<String, dynamic> row) async {
+    await db.rawInsert(
+      "INSERT INTO words_fts (words_fts, rowid, word, definition, examples) VALUES ('delete', ?, ?, ?, ?)",
+      [row['row_id'], ..._fullTextValues(row)],
+    );
+  }
+
+  // Build an FTS5 expression matching the tokenization of the prebuilt index:
+  // Chinese runs become phrases of overlapping character bigrams, other words
+  // and single Chinese characters are prefix matches, terms are ANDed
+  static String _fullTextQuery(String query) {
+    final terms = <String>[];
+    for (final match in _queryToken.allMatches(query)) {
+      final token = match.group(0)!;
+      if (_cjkRun.hasMatch(token)) {
+        if (token.length == 1) {
+          terms.add('"$token"*');
+        } else {
+          final bigrams = [
+            for (var i = 0; i < token.length - 1; i++) token.substring(i, i + 2),
+          ];
+          terms.add('"${bigrams.join(' ')}"');
+        }
+      } else {
+        terms.add('"${token.toLowerCase()}"*');
+      }
+    }
+    return terms.join(' AND ');
+  }
+
+  // Full-text search on words_fts (same query as search_words in
+  // tools/build_word_database.py): one row per headword, keeping the most
+  // relevant deck entry, with an exact headword match ranked first
+  static Future<List<Map<String, dynamic>>> queryFullText(
+    DatabaseExecutor db,
+    String query, {
+    int limit = 20,
+  }) async {
+    final expression = _fullTextQuery(query);
+    if (expression.isEmpty) return [];
+    return db.rawQuery(
+      'SELECT w.*, MIN(f.rank) AS score FROM words_fts AS f JOIN words AS w ON w.row_id = f.rowid '
+      'WHERE words_fts MATCH ? GROUP BY lower(w.word) '
+      'ORDER BY lower(w.word) = ? DESC, score LIMIT ?',
+      [expression, query.trim().toLowerCase(), limit],
     );
-    return List.generate(maps.length, (i) => Word.fromJson(maps[i]));
+  }
+
+  // Search words by headword, definition or examples (Chinese -> English
+  // reverse lookup included); uses the FTS5 index when the database has one
+  Future<List<Word>> searchWords(String query, {int limit = 20}) async {
+    final db = await database;
+
+    final List<Map<String, dynamic>> maps;
+    if (await _fullTextIndex(db)) {
+      maps = await queryFullText(db, query, limit: limit);
+    } else {
+      maps = await db.rawQuery(
+        'SELECT * FROM words WHERE word LIKE ? OR definition LIKE ? '
+        'GROUP BY lower(word) ORDER BY lower(word) = ? DESC LIMIT ?',
+        ['%$query%', '%$query%', query.trim().toLowerCase(), limit],
+      );
+    }
+    return List.generate(maps.length, (i) => wordFromRow(maps[i]));
   }
 
   // Get new words (for learning session)
@@ -144,7 +473,7 @@ class DatabaseHelper {
       limit: limit,
       orderBy: 'difficulty ASC',
     );
-    return List.generate(maps.length, (i) => Word.fromJson(maps[i]));
+    return List.generate(maps.length, (i) => wordFromRow(maps[i]));
   }
 
   // Save or update card
@@ -1,13 +1,13 @@
-import 'dart:convert';
-import 'package:flutter/services.dart' show rootBundle;
 import 'package:path_provider/path_provider.dart';
 import 'package:sqflite/sqflite.dart';
 import 'package:path/path.dart' as path;
 import '../models/word.dart';
+import '../../shared/services/enhanced_vocabulary_loader.dart';
+import '../datasources/local_database.dart';
 
 class WordRepository {
   static const String _dbName = 'english_learning.db';
-  static const int _dbVersion = 1;
+  static const int _dbVersion = 3;
 
   late Database _database;
 
@@ -29,59 +29,70 @@ class WordRepository {
       dbPath,
       version: _dbVersion,
       onCreate: _createDb,
+      onUpgrade: _onUpgrade,
     );
   }
 
+  Future<void> _onUpgrade(Database db, int oldVersion, int newVersion) async {
+    if (oldVersion < 2) {
+      await DatabaseHelper.createTagTables(db);
+      await DatabaseHelper.backfillWordTags(db);
+    }
+    if (oldVersion < 3) {
+      await DatabaseHelper.migrateWordsRowId(db);
+    }
+  }
+
   Future<void> _createDb(Database db, int version) async {
-    await db.execute('''
-      CREATE TABLE words(
-        id TEXT PRIMARY KEY,
-        word TEXT NOT NULL,
-        phonetic TEXT,
-        definition TEXT NOT NULL,
-        examples TEXT NOT NULL,
-        synonyms TEXT,
-        antonyms TEXT,
-        etymology TEXT,
-        difficulty INTEGER NOT NULL,
-        tags TEXT NOT NULL
-      )
-    ''');
+    await DatabaseHelper.createWordsTable(db);
+    await DatabaseHelper.createTagTables(db);
   }
 
   /// Load vocabulary from assets
   Future<void> loadVocabularyFromAssets(String jsonPath) async {
     final db = await database;
-    final assetBundle = await rootBundle.loadString(jsonPath);
-    final words = jsonDecode(assetBundle) as List;
+    // Large decks are bundled as shards only; the loader reads them
+    final words = await EnhancedVocabularyLoader.loadVocabularyAsset(jsonPath);
+
+    final deck = path.basenameWithoutExtension(jsonPath);
+    final fullText = await _fullTextIndex(db);
 
     await db.transaction((txn) async {
-      for (final wordData in words) {
-        final word = Word.fromJson(wordData);
-        await txn.insert('words', word.toJson(), conflictAlgorithm: ConflictAlgorithm.ignore);
+      for (final word in words) {
+        await DatabaseHelper.saveWord(
+          txn,
+          word.copyWith(id: DatabaseHelper.deckWordId(deck, word.id)),
+          conflictAlgorithm: ConflictAlgorithm.ignore,
+          fullText: fullText,
+        );
       }
     });
   }
 
+  // Whether the words_fts index is usable (see DatabaseHelper.hasFullTextIndex);
+  // probed once per database
+  bool? _hasFullTextIndex;
+
+  Future<bool> _fullTextIndex(DatabaseExecutor db) async {
+    return _hasFullTextIndex ??= await DatabaseHelper.hasFullTextIndex(db);
+  }
+
   /// Get all words
   Future<List<Word>> getAllWords() async {
     final db = await database;
     final List<Map<String, dynamic>> maps = await db.query('words');
     return List.generate(maps.length, (i) {
-      return Word.fromJson(maps[i]);
+      return DatabaseHelper.wordFromRow(maps[i]);
     });
   }
 
   /// Get words by tag
   Future<List<Word>> getWordsByTag(String tag) async {
     final db = await database;
-    final List<Map<String, dynamic>> maps = await db.query(
-      'words',
-      where: 'tags LIKE ?',
-      whereArgs: ['%$tag%'],
-    );
+    final List<Map<String, dynamic>> maps =
+        await DatabaseHelper.queryWordsByTag(db, tag);
     return List.generate(maps.length, (i) {
-      return Word.fromJson(maps[i]);
+      return DatabaseHelper.wordFromRow(maps[i]);
     });
   }
 
@@ -94,19 +105,27 @@ class WordRepository {
       whereArgs: [difficulty],
     );
     return List.generate(maps.length, (i) {
-      return Word.fromJson(maps[i]);
+      return DatabaseHelper.wordFromRow(maps[i]);
     });
   }
 
   /// Add custom word
   Future<int> addWord(Word word) async {
     final db = await database;
-    return await db.insert('words', word.toJson());
+    return DatabaseHelper.saveWord(
+      db,
+      word,
+      fullText: await _fullTextIndex(db),
+    );
   }
 
   /// Delete word
   Future<int> deleteWord(String id) async {
     final db = await database;
-    return await db.delete('words', where: 'id = ?', whereArgs: [id]);
+    return DatabaseHelper.deleteWord(
+      db,
+      id,
+      fullText: await _fullTextIndex(db),
+    );
   }
 }
@@ -1,8 +1,7 @@
-import 'dart:convert';
-import 'package:flutter/services.dart';
 import '../../data/models/course.dart';
 import '../../data/models/word.dart';
 import '../../data/models/vocabulary_book.dart';
+import 'enhanced_vocabulary_loader.dart';
 
 /// 课程数据服务 - 提供预定义的课程列表
 class CourseService {
@@ -312,25 +311,10 @@ class CourseService {
         throw Exception('Course does not have an asset path: $courseId');
       }
 
-      // Load words from the course's asset file
-      final String jsonString = await rootBundle.loadString(course.assetPath!);
-      final dynamic jsonData = json.decode(jsonString);
-
-      // Handle both array format and object with 'words' key format
-      List<dynamic> wordsJson;
-      if (jsonData is List) {
-        // Direct array format: [{word1}, {word2}, ...]
-        wordsJson = jsonData;
-      } else if (jsonData is Map) {
-        // Object format: {"words": [{word1}, {word2}, ...]}
-        wordsJson = jsonData['words'] as List<dynamic>;
-      } else {
-        throw Exception('Invalid JSON format: expected array or object with words key');
-      }
-
-      final words = wordsJson
-          .map((wordJson) => Word.fromJson(wordJson as Map<String, dynamic>))
-          .toList();
+      // Load words from the course's asset file (large decks are bundled as
+      // shards only; the loader reads them)
+      final words =
+          await EnhancedVocabularyLoader.loadVocabularyAsset(course.assetPath!);
 
       return words;
     } catch (e) {
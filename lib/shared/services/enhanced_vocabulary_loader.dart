@@ -9,7 +9,23 @@ class EnhancedVocabularyLoader {
   // 缓存已加载的词汇
   static final Map<String, List<Word>> _vocabularyCache = {};
 
-  // 词库文件配置
+  // 分片词库目录（由 tools/deck_shards.py 生成，所有词库的分片和清单平铺在此目录）
+  static const String SHARD_DIR = 'assets/vocabularies/shards';
+
+  // 缓存分片清单（没有分片的词库记为null）和已解析的分片
+  static final Map<String, Map<String, dynamic>?> _shardManifestCache = {};
+  static final Map<String, List<Word>> _shardCache = {};
+
+  // 词库索引目录（由 tools/search_index.py 生成）
+  static const String INDEX_DIR = 'assets/vocabularies/indexes';
+
+  // 缓存搜索索引（没有索引的词库记为null）
+  static final Map<String, _SearchIndex?> _searchIndexCache = {};
+
+  // 缓存分面索引（由 tools/deck_facets.py 生成，没有索引的词库记为null）
+  static final Map<String, _DeckFacets?> _facetsCache = {};
+
+  // 词库文件配置（超大规模词库只打包分片，由 loadVocabularyAsset 按清单读取）
   static const Map<String, String> VOCABULARY_FILES = {
     // === 考试词库（小规模） ===
     'cet4': 'assets/vocabularies/cet4.json',
@@ -77,14 +93,8 @@ class EnhancedVocabularyLoader {
     }
 
     try {
-      // 从assets加载
-      final jsonString = await rootBundle.loadString(filePath);
-      final List<dynamic> jsonList = json.decode(jsonString);
-
-      // 转换为Word对象
-      final words = jsonList.map((json) {
-        return Word.fromJson(json as Map<String, dynamic>);
-      }).toList();
+      // 从assets加载（有分片的词库读取分片）
+      final words = await loadVocabularyAsset(filePath);
 
       // 缓存词汇
       _vocabularyCache[vocabularyName] = words;
@@ -98,18 +108,127 @@ class EnhancedVocabularyLoader {
     }
   }
 
+  /// 按资源路径加载词库文件，加载失败时抛出异常
+  ///
+  /// 有分片的大型词库只打包分片，不打包完整文件：路径指向这类词库时按清单顺序读取全部分片。
+  /// 其他文件直接读取，支持数组和 {"words": [...]} 两种格式。
+  static Future<List<Word>> loadVocabularyAsset(String assetPath) async {
+    final name = _deckNameOf(assetPath);
+    final manifest = name != null ? await _loadShardManifest(name) : null;
+
+    final List<dynamic> jsonList;
+    if (manifest != null) {
+      jsonList = [];
+      for (final shard in (manifest['shards'] as List).cast<Map<String, dynamic>>()) {
+        jsonList.addAll(json.decode(
+          await rootBundle.loadString('$SHARD_DIR/${shard['file']}'),
+        ) as List<dynamic>);
+      }
+    } else {
+      final jsonData = json.decode(await rootBundle.loadString(assetPath));
+      if (jsonData is List) {
+        jsonList = jsonData;
+      } else if (jsonData is Map) {
+        jsonList = jsonData['words'] as List<dynamic>;
+      } else {
+        throw FormatException('Invalid JSON format: expected array or object with words key');
+      }
+    }
+
+    return jsonList.map((json) {
+      return Word.fromJson(json as Map<String, dynamic>);
+    }).toList();
+  }
+
+  /// 词库目录下的文件名（不含扩展名），其他路径返回null
+  static String? _deckNameOf(String assetPath) {
+    const prefix = 'assets/vocabularies/';
+    if (!assetPath.startsWith(prefix) || !assetPath.endsWith('.json')) return null;
+    final name = assetPath.substring(prefix.length, assetPath.length - '.json'.length);
+    return name.contains('/') ? null : name;
+  }
+
+  /// 加载词库的分片清单，词库没有分片时返回null
+  static Future<Map<String, dynamic>?> _loadShardManifest(
+    String vocabularyName,
+  ) async {
+    if (_shardManifestCache.containsKey(vocabularyName)) {
+      return _shardManifestCache[vocabularyName];
+    }
+
+    Map<String, dynamic>? manifest;
+    try {
+      final jsonString = await rootBundle
+          .loadString('$SHARD_DIR/$vocabularyName.manifest.json');
+      manifest = json.decode(jsonString) as Map<String, dynamic>;
+    } catch (e) {
+      manifest = null;
+    }
+
+    _shardManifestCache[vocabularyName] = manifest;
+    return manifest;
+  }
+
+  /// 加载单个分片
+  static Future<List<Word>> _loadShard(
+    String vocabularyName,
+    Map<String, dynamic> shard,
+  ) async {
+    final key = '$vocabularyName/${shard['file']}';
+    final cached = _shardCache[key];
+    if (cached != null) return cached;
+
+    final jsonString =
+        await rootBundle.loadString('$SHARD_DIR/${shard['file']}');
+    final List<dynamic> jsonList = json.decode(jsonString);
+    final words = jsonList.map((json) {
+      return Word.fromJson(json as Map<String, dynamic>);
+    }).toList();
+
+    _shardCache[key] = words;
+    return words;
+  }
+
   /// 分批加载词库（用于大文件）
+  ///
+  /// 词库有分片清单时只解析与 [offset, offset + limit) 重叠的分片，
+  /// 否则加载整个词库后截取。
   static Future<List<Word>> loadVocabularyBatch(
     String vocabularyName, {
     int offset = 0,
     int limit = 100,
   }) async {
-    final allWords = await loadVocabulary(vocabularyName);
+    final cachedWords = _vocabularyCache[vocabularyName];
+    final manifest = cachedWords == null
+        ? await _loadShardManifest(vocabularyName)
+        : null;
 
-    final start = offset;
-    final end = (offset + limit).clamp(0, allWords.length);
+    if (manifest == null) {
+      final allWords = cachedWords ?? await loadVocabulary(vocabularyName);
 
-    return allWords.sublist(start, end);
+      final start = offset.clamp(0, allWords.length);
+      final end = (offset + limit).clamp(start, allWords.length);
+
+      return allWords.sublist(start, end);
+    }
+
+    final end = offset + limit;
+    final batch = <Word>[];
+
+    final shards = (manifest['shards'] as List).cast<Map<String, dynamic>>();
+    for (final shard in shards) {
+      final shardStart = shard['start'] as int;
+      final shardEnd = shard['end'] as int;
+      if (shardEnd <= offset || shardStart >= end) continue;
+
+      final words = await _loadShard(vocabularyName, shard);
+      batch.addAll(words.sublist(
+        math.max(offset, shardStart) - shardStart,
+        math.min(end, shardEnd) - shardStart,
+      ));
+    }
+
+    return batch;
   }
 
   /// 加载多个词库并合并
@@ -155,10 +274,91 @@ class EnhancedVocabularyLoader {
     return shuffledWords.take(count).toList();
   }
 
+  /// 加载词库的分面索引，词库没有索引时返回null
+  static Future<_DeckFacets?> _loadFacets(String vocabularyName) async {
+    if (_facetsCache.containsKey(vocabularyName)) {
+      return _facetsCache[vocabularyName];
+    }
+
+    _DeckFacets? facets;
+    try {
+      final jsonString = await rootBundle
+          .loadString('$INDEX_DIR/$vocabularyName.facets.json');
+      facets = _DeckFacets(json.decode(jsonString) as Map<String, dynamic>);
+    } catch (e) {
+      facets = null;
+    }
+
+    _facetsCache[vocabularyName] = facets;
+    return facets;
+  }
+
+  /// 按条目下标取词，结果保持下标顺序
+  ///
+  /// 分片词库按分片归并下标，每个涉及的分片只加载、解析一次；
+  /// 没有分片的词库加载整个词库后按下标取词。
+  static Future<List<Word>> _wordsAt(
+    String vocabularyName,
+    Iterable<int> offsets,
+  ) async {
+    final cachedWords = _vocabularyCache[vocabularyName];
+    final manifest = cachedWords == null
+        ? await _loadShardManifest(vocabularyName)
+        : null;
+
+    if (manifest == null) {
+      final allWords = cachedWords ?? await loadVocabulary(vocabularyName);
+      return [
+        for (final offset in offsets)
+          if (offset >= 0 && offset < allWords.length) allWords[offset],
+      ];
+    }
+
+    final shards = (manifest['shards'] as List).cast<Map<String, dynamic>>();
+    final loaded = <int, List<Word>>{};
+    final words = <Word>[];
+    for (final offset in offsets) {
+      final index = _shardIndexOf(shards, offset);
+      if (index < 0) continue;
+      final shardWords =
+          loaded[index] ??= await _loadShard(vocabularyName, shards[index]);
+      words.add(shardWords[offset - (shards[index]['start'] as int)]);
+    }
+    return words;
+  }
+
+  /// 二分查找包含该下标的分片，不在任何分片中时返回-1
+  static int _shardIndexOf(List<Map<String, dynamic>> shards, int offset) {
+    var low = 0;
+    var high = shards.length;
+    while (low < high) {
+      final mid = (low + high) >> 1;
+      if ((shards[mid]['end'] as int) <= offset) {
+        low = mid + 1;
+      } else {
+        high = mid;
+      }
+    }
+    if (low < shards.length && (shards[low]['start'] as int) <= offset) {
+      return low;
+    }
+    return -1;
+  }
+
   /// 按首字母获取词汇
   static Future<Map<String, List<Word>>> getWordsByAlphabet(
     String vocabularyName,
   ) async {
+    final facets = await _loadFacets(vocabularyName);
+    if (facets != null) {
+      // 分面索引中每个字母下的条目已按单词排序
+      final alphabetMap = <String, List<Word>>{};
+      for (final entry in facets.letters.entries) {
+        alphabetMap[entry.key] = await _wordsAt(vocabularyName, entry.value);
+      }
+      return alphabetMap;
+    }
+
     final words = await loadVocabulary(vocabularyName);
 
     final Map<String, List<Word>> alphabetMap = {};
@@ -180,6 +380,15 @@ class EnhancedVocabularyLoader {
   static Future<Map<int, List<Word>>> getWordsByDifficulty(
     String vocabularyName,
   ) async {
+    final facets = await _loadFacets(vocabularyName);
+    if (facets != null) {
+      final difficultyMap = <int, List<Word>>{};
+      for (final entry in facets.difficulty.entries) {
+        difficultyMap[entry.key] = await _wordsAt(vocabularyName, entry.value);
+      }
+      return difficultyMap;
+    }
+
     final words = await loadVocabulary(vocabularyName);
 
     final Map<int, List<Word>> difficultyMap = {};
@@ -192,22 +401,77 @@ class EnhancedVocabularyLoader {
     return difficultyMap;
   }
 
+  /// 加载词库的前缀搜索索引，词库没有索引时返回null
+  static Future<_SearchIndex?> _loadSearchIndex(String vocabularyName) async {
+    if (_searchIndexCache.containsKey(vocabularyName)) {
+      return _searchIndexCache[vocabularyName];
+    }
+
+    _SearchIndex? index;
+    try {
+      final jsonString = await rootBundle
+          .loadString('$INDEX_DIR/$vocabularyName.search.json');
+      index = _SearchIndex(json.decode(jsonString) as Map<String, dynamic>);
+    } catch (e) {
+      index = null;
+    }
+
+    _searchIndexCache[vocabularyName] = index;
+    return index;
+  }
+
   /// 搜索词汇
+  ///
+  /// 英文查询用预先生成的前缀索引取出以查询串开头的单词，只加载命中的条目，
+  /// 不解析整个词库，供边输入边搜索使用。
+  /// substring 为真时（用户确认搜索或输入停顿后），命中不足 limit 个再逐词扫描补充
+  /// 单词中间或释义中包含查询串的条目；该扫描需要加载全部词库。
+  /// 非英文查询（如中文释义）或词库没有索引时只能逐词扫描。
   static Future<List<Word>> searchWords(
     String query, {
     String? vocabularyName,
     int limit = 20,
+    bool substring = false,
   }) async {
-    final words = vocabularyName != null
-        ? await loadVocabulary(vocabularyName)
-        : await loadAllVocabularies();
+    final names = vocabularyName != null
+        ? [vocabularyName]
+        : DEFAULT_VOCABULARY_ORDER;
+
+    final results = <Word>[];
+    // 已由前缀索引取出的条目（词库名:下标），扫描补充时跳过
+    final found = <String>{};
+
+    if (RegExp(r"^[a-zA-Z][a-zA-Z '\-]*$").hasMatch(query.trim())) {
+      final indexes = <_SearchIndex?>[];
+      for (final name in names) {
+        indexes.add(await _loadSearchIndex(name));
+      }
+
+      if (indexes.every((index) => index != null)) {
+        for (var i = 0; i < names.length && results.length < limit; i++) {
+          final offsets = indexes[i]!.lookup(query, limit - results.length);
+          results.addAll(await _wordsAt(names[i], offsets));
+          found.addAll(offsets.map((offset) => '${names[i]}:$offset'));
+        }
+        if (results.length >= limit || !substring) return results;
+      }
+    }
 
     final queryLower = query.toLowerCase();
 
-    final results = words.where((word) {
-      return word.word.toLowerCase().contains(queryLower) ||
-          (word.definition?.toLowerCase().contains(queryLower) ?? false);
-    }).take(limit).toList();
+    for (final name in names) {
+      final words = await loadVocabulary(name);
+      for (var offset = 0; offset < words.length; offset++) {
+        if (results.length >= limit) return results;
+        if (found.contains('$name:$offset')) continue;
+
+        final word = words[offset];
+        if (word.word.toLowerCase().contains(queryLower) ||
+            (word.definition?.toLowerCase().contains(queryLower) ?? false)) {
+          results.add(word);
+        }
+      }
+    }
 
     return results;
   }
@@ -215,12 +479,20 @@ class EnhancedVocabularyLoader {
   /// 清除缓存
   static void clearCache() {
     _vocabularyCache.clear();
+    _shardManifestCache.clear();
+    _shardCache.clear();
+    _searchIndexCache.clear();
+    _facetsCache.clear();
     print('🗑️  词库缓存已清除');
   }
 
   /// 清除指定词库的缓存
   static void clearCacheFor(String vocabularyName) {
     _vocabularyCache.remove(vocabularyName);
+    _shardManifestCache.remove(vocabularyName);
+    _searchIndexCache.remove(vocabularyName);
+    _facetsCache.remove(vocabularyName);
+    _shardCache.removeWhere((key, _) => key.startsWith('$vocabularyName/'));
     print('🗑️  已清除词库缓存: $vocabularyName');
   }
 
@@ -240,6 +512,16 @@ class EnhancedVocabularyLoader {
     String vocabularyName,
   ) async {
     try {
+      // 有分面索引时直接使用预先计算的计数，无需加载词库
+      final facets = await _loadFacets(vocabularyName);
+      if (facets != null) {
+        return {
+          'totalWords': facets.total,
+          'difficultyDistribution': facets.difficultyCounts,
+          'tagDistribution': facets.tagCounts,
+        };
+      }
+
       final words = await loadVocabulary(vocabularyName);
 
       final difficultyCounts = <int, int>{};
@@ -286,6 +568,55 @@ class EnhancedVocabularyLoader {
     Set<String>? excludeWords,
     int preferredDifficulty = 2,
   }) async {
+    final facetsList = <_DeckFacets?>[];
+    for (final name in DEFAULT_VOCABULARY_ORDER) {
+      facetsList.add(await _loadFacets(name));
+    }
+
+    if (facetsList.every((facets) => facets != null)) {
+      // 按与目标难度的差距由近到远遍历难度倒排表，取够数量即停止；
+      // 差距相同的条目按词库顺序、词库内顺序排列，与下面逐词排序的结果一致
+      final distances = <int>{
+        for (final facets in facetsList)
+          for (final level in facets!.difficulty.keys)
+            (level - preferredDifficulty).abs(),
+      }.toList()
+        ..sort();
+
+      final recommended = <Word>[];
+      for (final distance in distances) {
+        for (var i = 0; i < DEFAULT_VOCABULARY_ORDER.length; i++) {
+          final difficulty = facetsList[i]!.difficulty;
+          final offsets = <int>{
+            ...?difficulty[preferredDifficulty - distance],
+            ...?difficulty[preferredDifficulty + distance],
+          }.toList()
+            ..sort();
+          // 每次只取还缺的数量，涉及的分片各解析一次
+          var position = 0;
+          while (position < offsets.length) {
+            final end = math.min(
+              offsets.length,
+              position + math.max(1, count - recommended.length),
+            );
+            final words = await _wordsAt(
+              DEFAULT_VOCABULARY_ORDER[i],
+              offsets.sublist(position, end),
+            );
+            position = end;
+            for (final word in words) {
+              if (excludeWords != null && excludeWords.contains(word.word)) {
+                continue;
+              }
+              recommended.add(word);
+              if (recommended.length >= count) return recommended;
+            }
+          }
+        }
+      }
+      return recommended;
+    }
+
     final allWords = await loadAllVocabularies();
 
     // 过滤掉已学习的词汇
@@ -293,14 +624,15 @@ class EnhancedVocabularyLoader {
         ? allWords.where((w) => !excludeWords.contains(w.word)).toList()
         : allWords;
 
-    // 优先推荐接近目标难度的词汇
-    remainingWords.sort((a, b) {
-      final diffA = (a.difficulty - preferredDifficulty).abs();
-      final diffB = (b.difficulty - preferredDifficulty).abs();
-      return diffA.compareTo(diffB);
-    });
+    // 优先推荐接近目标难度的词汇，差距相同时保持词库顺序（List.sort 不保证稳定）
+    final order = List<int>.generate(remainingWords.length, (i) => i)
+      ..sort((a, b) {
+        final diffA = (remainingWords[a].difficulty - preferredDifficulty).abs();
+        final diffB = (remainingWords[b].difficulty - preferredDifficulty).abs();
+        return diffA != diffB ? diffA.compareTo(diffB) : a.compareTo(b);
+      });
 
-    return remainingWords.take(count).toList();
+    return order.take(count).map((i) => remainingWords[i]).toList();
   }
 
   /// 创建学习计划 - 根据目标生成每日词汇列表
@@ -310,6 +642,16 @@ class EnhancedVocabularyLoader {
     required int totalDays,
     int startDay = 1,
   }) async {
+    final facets = await _loadFacets(vocabularyName);
+    if (facets != null) {
+      // 分面索引中已有按难度排序的条目顺序，只取计划覆盖的部分
+      final planSize = math.max(0, totalDays - startDay + 1) * dailyTarget;
+      return _wordsAt(
+        vocabularyName,
+        facets.difficultyOrder.take(planSize),
+      );
+    }
+
     final allWords = await loadVocabulary(vocabularyName);
 
     // 按难度和重要性排序
@@ -362,3 +704,106 @@ class EnhancedVocabularyLoader {
     return stats;
   }
 }
+
+/// 词库前缀搜索索引（由 tools/search_index.py 生成）
+class _SearchIndex {
+  _SearchIndex(Map<String, dynamic> json)
+      : prefixLength = json['prefix_length'] as int,
+        words = List<String>.from(json['words'] as List),
+        offsets = json['offsets'] as List,
+        completions = (json['completions'] as Map<String, dynamic>).map(
+          (key, value) => MapEntry(key, List<int>.from(value as List)),
+        );
+
+  // 不超过该长度的前缀有预先排好的补全
+  final int prefixLength;
+
+  // 排序后的规范化单词
+  final List<String> words;
+
+  // 每个单词对应的条目下标（单个下标或下标列表）
+  final List<dynamic> offsets;
+
+  // 短前缀 → 按排名排列的单词编号
+  final Map<String, List<int>> completions;
+
+  /// 按前缀查找条目下标
+  List<int> lookup(String prefix, int limit) {
+    final normalized = prefix.trim().toLowerCase();
+    if (normalized.isEmpty || limit <= 0) return [];
+
+    final wordIds = <int>[];
+    if (normalized.length <= prefixLength) {
+      wordIds.addAll((completions[normalized] ?? const <int>[]).take(limit));
+    } else {
+      // 二分查找第一个不小于前缀的单词
+      var low = 0;
+      var high = words.length;
+      while (low < high) {
+        final mid = (low + high) >> 1;
+        if (words[mid].compareTo(normalized) < 0) {
+          low = mid + 1;
+        } else {
+          high = mid;
+        }
+      }
+
+      for (var i = low;
+          i < words.length &&
+              wordIds.length < limit &&
+              words[i].startsWith(normalized);
+          i++) {
+        wordIds.add(i);
+      }
+    }
+
+    final result = <int>[];
+    for (final id in wordIds) {
+      final entry = offsets[id];
+      if (entry is List) {
+        result.addAll(entry.cast<int>());
+      } else {
+        result.add(entry as int);
+      }
+    }
+    return result.take(limit).toList();
+  }
+}
+
+/// 词库分面索引（由 tools/deck_facets.py 生成）
+class _DeckFacets {
+  _DeckFacets(Map<String, dynamic> json)
+      : total = json['total'] as int,
+        letters = _postings(json['letters']),
+        difficulty = _postings(json['difficulty']).map(
+          (key, value) => MapEntry(int.parse(key), value),
+        ),
+        difficultyOrder = List<int>.from(json['difficulty_order'] as List),
+        difficultyCounts =
+            (json['counts']['difficulty'] as Map<String, dynamic>).map(
+          (key, value) => MapEntry(int.parse(key), value as int),
+        ),
+        tagCounts = Map<String, int>.from(json['counts']['tags'] as Map);
+
+  static Map<String, List<int>> _postings(dynamic json) {
+    return (json as Map<String, dynamic>).map(
+      (key, value) => MapEntry(key, List<int>.from(value as List)),
+    );
+  }
+
+  // 条目总数
+  final int total;
+
+  // 首字母 → 条目下标（已按单词排序）
+  final Map<String, List<int>> letters;
+
+  // 难度 → 条目下标（保持词库顺序）
+  final Map<int, List<int>> difficulty;
+
+  // 按难度排序的全部条目下标
+  final List<int> difficultyOrder;
+
+  // 各难度、各标签的条目数
+  final Map<int, int> difficultyCounts;
+  final Map<String, int> tagCounts;
+}
@@ -1,7 +1,6 @@
-import 'dart:convert';
-import 'package:flutter/services.dart';
 import '../../data/models/vocabulary_book.dart';
 import '../../data/models/word.dart';
+import 'enhanced_vocabulary_loader.dart';
 
 /// Service for importing and managing vocabulary books
 class VocabularyService {
@@ -59,24 +58,9 @@ class VocabularyService {
   /// Load vocabulary book from assets
   Future<List<Word>> loadVocabularyBook(VocabularyBook book) async {
     try {
-      final String jsonString = await rootBundle.loadString(book.filePath!);
-      final dynamic jsonData = json.decode(jsonString);
-
-      // Handle both array format and object with 'words' key format
-      List<dynamic> wordsJson;
-      if (jsonData is List) {
-        // Direct array format: [{word1}, {word2}, ...]
-        wordsJson = jsonData;
-      } else if (jsonData is Map) {
-        // Object format: {"words": [{word1}, {word2}, ...]}
-        wordsJson = jsonData['words'] as List<dynamic>;
-      } else {
-        throw Exception('Invalid JSON format: expected array or object with words key');
-      }
-
-      _loadedWords = wordsJson
-          .map((wordJson) => Word.fromJson(wordJson as Map<String, dynamic>))
-          .toList();
+      // Large decks are bundled as shards only; the loader reads them
+      _loadedWords =
+          await EnhancedVocabularyLoader.loadVocabularyAsset(book.filePath!);
 
       _currentBook = book;
 
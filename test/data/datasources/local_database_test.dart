@@ -0,0 +1,176 @@
+import 'dart:io';
+
+import 'package:flutter_test/flutter_test.dart';
+import 'package:sqflite_common_ffi/sqflite_ffi.dart';
+import 'package:english_learning_app/data/datasources/local_database.dart';
+import 'package:english_learning_app/data/models/word.dart';
+
+// Built by tools/build_word_database.py (not checked in)
+const String prebuiltDbPath = 'assets/data/english_learning.db';
+
+void main() {
+  sqfliteFfiInit();
+
+  group('DatabaseHelper row codec', () {
+    test('Should decode JSON text list columns', () {
+      final word = DatabaseHelper.wordFromRow({
+        'id': 'cet4_001',
+        'word': 'abandon',
+        'phonetic': '/əˈbændən/',
+        'definition': 'v. 遗弃；放弃；抛弃',
+        'examples': '["The baby had been abandoned by its mother."]',
+        'synonyms': '["leave", "desert"]',
+        'antonyms': null,
+        'etymology': null,
+        'difficulty': 3,
+        'tags': '["cet4", "verb"]',
+      });
+
+      expect(word.examples, ['The baby had been abandoned by its mother.']);
+      expect(word.synonyms, ['leave', 'desert']);
+      expect(word.antonyms, isNull);
+      expect(word.tags, ['cet4', 'verb']);
+    });
+
+    test('Should round trip a word through a words row', () async {
+      final db = await databaseFactoryFfi.openDatabase(inMemoryDatabasePath);
+      await db.execute('''
+        CREATE TABLE words(
+          id TEXT PRIMARY KEY,
+          word TEXT NOT NULL,
+          phonetic TEXT,
+          definition TEXT NOT NULL,
+          examples TEXT NOT NULL,
+          synonyms TEXT,
+          antonyms TEXT,
+          etymology TEXT,
+          difficulty INTEGER NOT NULL,
+          tags TEXT NOT NULL
+        )
+      ''');
+      final word = Word(
+        id: 'word-002',
+        word: 'ability',
+        definition: 'n. 能力；才能',
+        examples: ['He has the ability to solve problems.'],
+        synonyms: ['capability', 'capacity'],
+        difficulty: 2,
+        tags: ['cet4', 'noun'],
+      );
+
+      await db.insert('words', DatabaseHelper.wordToRow(word));
+      final rows = await db.query('words');
+      final decoded = DatabaseHelper.wordFromRow(rows.single);
+      await db.close();
+
+      expect(decoded.id, word.id);
+      expect(decoded.examples, word.examples);
+      expect(decoded.synonyms, word.synonyms);
+      expect(decoded.antonyms, isNull);
+      expect(decoded.tags, word.tags);
+    });
+  });
+
+  group('DatabaseHelper full-text index', () {
+    late Database db;
+
+    Word abandon(String definition) => Word(
+          id: 'cet4_001',
+          word: 'abandon',
+          definition: definition,
+          examples: ['We had to abandon the car.'],
+          difficulty: 3,
+          tags: ['cet4'],
+        );
+
+    setUp(() async {
+      db = await databaseFactoryFfi.openDatabase(inMemoryDatabasePath);
+      await DatabaseHelper.createWordsTable(db);
+      await DatabaseHelper.createTagTables(db);
+      // Same table as FTS_SCHEMA in tools/build_word_database.py
+      await db.execute(
+        "CREATE VIRTUAL TABLE words_fts USING fts5("
+        "word, definition, examples, content='', tokenize='unicode61 remove_diacritics 2')",
+      );
+    });
+
+    tearDown(() async {
+      await db.close();
+    });
+
+    test('Should detect the index only when words_fts can be queried', () async {
+      expect(await DatabaseHelper.hasFullTextIndex(db), isTrue);
+
+      final plain = await databaseFactoryFfi.openDatabase(inMemoryDatabasePath);
+      await DatabaseHelper.createWordsTable(plain);
+      expect(await DatabaseHelper.hasFullTextIndex(plain), isFalse);
+      await plain.close();
+    });
+
+    test('Should reindex a replaced word under the same row_id', () async {
+      final first = await DatabaseHelper.saveWord(db, abandon('v. 遗弃'), fullText: true);
+      final second = await DatabaseHelper.saveWord(
+        db,
+        abandon('v. 放弃'),
+        conflictAlgorithm: ConflictAlgorithm.replace,
+        fullText: true,
+      );
+
+      expect(second, first);
+      expect(await DatabaseHelper.queryFullText(db, '遗弃'), isEmpty);
+      final rows = await DatabaseHelper.queryFullText(db, '放弃');
+      expect(rows.map((row) => row['id']), ['cet4_001']);
+    });
+
+    test('Should drop the index entry of a deleted word', () async {
+      await DatabaseHelper.saveWord(db, abandon('v. 遗弃'), fullText: true);
+      await DatabaseHelper.deleteWord(db, 'cet4_001', fullText: true);
+
+      expect(await DatabaseHelper.queryFullText(db, 'abandon'), isEmpty);
+    });
+  });
+
+  group('Prebuilt database', () {
+    final hasPrebuiltDb = File(prebuiltDbPath).existsSync();
+    late Database db;
+
+    setUpAll(() async {
+      if (!hasPrebuiltDb) return;
+      db = await databaseFactoryFfi.openDatabase(
+        File(prebuiltDbPath).absolute.path,
+        options: OpenDatabaseOptions(readOnly: true),
+      );
+    });
+
+    tearDownAll(() async {
+      if (hasPrebuiltDb) await db.close();
+    });
+
+    test('Should read words from the words table', () async {
+      final rows = await db.query('words', limit: 50);
+      final words = rows.map(DatabaseHelper.wordFromRow).toList();
+
+      expect(words, isNotEmpty);
+      for (final word in words) {
+        expect(word.examples, isA<List<String>>());
+        expect(word.tags, isA<List<String>>());
+      }
+    }, skip: hasPrebuiltDb ? false : 'run python3 tools/build_word_database.py first');
+
+    test('Should read words by tag', () async {
+      final rows = await DatabaseHelper.queryWordsByTag(db, 'cet4');
+      final words = rows.map(DatabaseHelper.wordFromRow).toList();
+
+      expect(words, isNotEmpty);
+      expect(words.every((word) => word.tags.contains('cet4')), isTrue);
+    }, skip: hasPrebuiltDb ? false : 'run python3 tools/build_word_database.py first');
+
+    test('Should rank the exact headword first without duplicates', () async {
+      final rows = await DatabaseHelper.queryFullText(db, 'abandon');
+      final words = rows.map((row) => (row['word'] as String).toLowerCase()).toList();
+
+      expect(words.first, 'abandon');
+      expect(words.toSet().length, words.length);
+    }, skip: hasPrebuiltDb ? false : 'run python3 tools/build_word_database.py first');
+  });
+}
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+增量资源构建引擎
+为每个构建任务记录输入哈希（源词典、配置元组、生成器版本），输出仍为最新时直接跳过
+"""
+
+import ast
+import hashlib
+import inspect
+import json
+import os
+import random
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from vocab_io import OUTPUT_FORMATS
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(TOOLS_DIR)
+VOCAB_DIR = os.path.join(PROJECT_ROOT, "assets", "vocabularies")
+INDEX_DIR = os.path.join(VOCAB_DIR, "indexes")
+CACHE_DIR = os.path.join(TOOLS_DIR, ".cache")
+MANIFEST_PATH = os.path.join(CACHE_DIR, "build_manifest.json")
+
+
+class BuildJob:
+    """单个构建任务：一个可调用对象及其全部输入、输出"""
+
+    def __init__(
+        self,
+        name: str,
+        build: Callable[..., Any],
+        args: Sequence = (),
+        outputs: Sequence[str] = (),
+        sources: Optional[Dict[str, Any]] = None,
+        input_files: Sequence[str] = (),
+        version: str = "1",
+        seed: Optional[int] = None,
+    ):
+        self.name = name
+        self.build = build
+        self.args = tuple(args)
+        self.outputs = [os.path.abspath(p) for p in outputs]
+        self.sources = sources or {}
+        self.input_files = [os.path.abspath(p) for p in input_files]
+        self.version = version
+        self.seed = job_seed(name) if seed is None else seed
+
+
+def list_decks(vocab_dir: str = VOCAB_DIR) -> List[str]:
+    """列出词库目录下的所有词库名（JSON数组文件，不含汇总文件和其他格式）"""
+    return sorted(
+        name[:-len(".json")] for name in os.listdir(vocab_dir)
+        if name.endswith(".json")
+        and not name.endswith(".strtab.json")
+        and name != "vocabulary_summary.json"
+    )
+
+
+def job_seed(name: str) -> int:
+    """由任务名派生固定的随机种子，串行与并行构建得到相同的随机序列"""
+    return int(hashlib.sha256(name.encode("utf-8")).hexdigest()[:16], 16)
+
+
+def _execute_job(build: Callable[..., Any], args: Sequence, seed: int) -> Any:
+    """在独立的随机数流中执行构建函数
+
+    生成器使用模块级 random，这里为每个任务重新播种并在结束后恢复原状态，
+    因此任务的输出只取决于自身的种子，与执行顺序和所在进程无关。
+    """
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        return build(*args)
+    finally:
+        random.setstate(state)
+
+
+def hash_source(data: Any) -> str:
+    """计算源词典/配置的内容哈希（元组与列表视为相同）"""
+    payload = json.dumps(data, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def hash_file(filepath: str) -> str:
+    """计算文件内容哈希"""
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _stat_key(filepath: str) -> List[int]:
+    st = os.stat(filepath)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _cached_file_hash(filepath: str, file_cache: Dict) -> str:
+    """文件大小和修改时间未变时复用上次的哈希"""
+    stat = _stat_key(filepath)
+    cached = file_cache.get(filepath)
+    if cached and cached["stat"] == stat:
+        return cached["sha256"]
+    digest = hash_file(filepath)
+    file_cache[filepath] = {"stat": stat, "sha256": digest}
+    return digest
+
+
+@lru_cache(maxsize=None)
+def _local_imports(filepath: str) -> Tuple[str, ...]:
+    """模块源文件中导入的同目录模块（tools/ 下的辅助模块）"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filepath)
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            names.add(node.module.split(".")[0])
+    directory = os.path.dirname(filepath)
+    paths = (os.path.join(directory, f"{name}.py") for name in names)
+    return tuple(sorted(path for path in paths if os.path.exists(path)))
+
+
+def builder_sources(build: Callable[..., Any]) -> List[str]:
+    """构建函数所在模块及其递归导入的全部本地模块的源文件
+
+    这些文件计入任务的输入哈希，生成逻辑（包括 morphology、thesaurus 等辅助模块）
+    改变时无需手动递增生成器版本号，缓存也会失效。
+    """
+    root = os.path.abspath(inspect.getfile(build))
+    seen = {root}
+    pending = [root]
+    while pending:
+        for path in _local_imports(pending.pop()):
+            if path not in seen:
+                seen.add(path)
+                pending.append(path)
+    return sorted(seen)
+
+
+def compute_input_hash(job: BuildJob, file_cache: Dict) -> str:
+    """汇总任务的全部输入，得到唯一的输入哈希"""
+    parts = {
+        "name": job.name,
+        "build": job.build.__qualname__,
+        "version": job.version,
+        "seed": job.seed,
+        "args": hash_source(job.args),
+        "sources": {key: hash_source(value) for key, value in sorted(job.sources.items())},
+        "files": {
+            os.path.relpath(path, PROJECT_ROOT): (
+                _cached_file_hash(path, file_cache) if os.path.exists(path) else None
+            )
+            for path in job.input_files
+        },
+        "code": {
+            os.path.relpath(path, PROJECT_ROOT): _cached_file_hash(path, file_cache)
+            for path in builder_sources(job.build)
+        },
+        "outputs": [os.path.relpath(path, PROJECT_ROOT) for path in job.outputs],
+    }
+    return hash_source(parts)
+
+
+def load_manifest(manifest_path: str = MANIFEST_PATH) -> Dict:
+    """加载构建清单"""
+    if not os.path.exists(manifest_path):
+        return {"jobs": {}, "files": {}}
+
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {"jobs": {}, "files": {}}
+
+    manifest.setdefault("jobs", {})
+    manifest.setdefault("files", {})
+    return manifest
+
+
+def save_manifest(manifest: Dict, manifest_path: str = MANIFEST_PATH) -> None:
+    """原子地写入构建清单"""
+    os.makedirs(os.path.dirname(manifest_path), exist_ok=True)
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp_path, manifest_path)
+
+
+def is_up_to_date(job: BuildJob, input_hash: str, manifest: Dict) -> bool:
+    """输入哈希一致且所有输出文件未被改动时，任务视为最新
+
+    输出文件只有大小/修改时间变化而内容不变时，顺带更新清单中记录的 stat。
+    """
+    record = manifest["jobs"].get(job.name)
+    if not record or record.get("input_hash") != input_hash:
+        return False
+
+    recorded_outputs = record.get("outputs", {})
+    for path in job.outputs:
+        rel = os.path.relpath(path, PROJECT_ROOT)
+        expected = recorded_outputs.get(rel)
+        if expected is None or not os.path.exists(path):
+            return False
+        stat = _stat_key(path)
+        if stat != expected["stat"]:
+            if hash_file(path) != expected["sha256"]:
+                return False
+            # 内容未变（如仅被 touch），记录新的大小和修改时间，之后的运行不必再次计算哈希
+            expected["stat"] = stat
+
+    return True
+
+
+def _record_outputs(job: BuildJob) -> Dict:
+    outputs = {}
+    for path in job.outputs:
+        if os.path.exists(path):
+            outputs[os.path.relpath(path, PROJECT_ROOT)] = {
+                "stat": _stat_key(path),
+                "sha256": hash_file(path),
+            }
+    return outputs
+
+
+def _record_result(manifest: Dict, job: BuildJob, input_hash: str, result: Any) -> None:
+    manifest["jobs"][job.name] = {
+        "input_hash": input_hash,
+        "outputs": _record_outputs(job),
+        "result": result,
+        "built_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+
+
+def run_jobs(
+    jobs: Sequence[BuildJob],
+    force: bool = False,
+    workers: int = 1,
+    manifest_path: str = MANIFEST_PATH,
+) -> List[Dict]:
+    """执行构建任务，跳过输出仍为最新的任务
+
+    workers 大于 1 时，需要重建的任务分发到进程池并行执行（0 表示使用全部CPU核心）；
+    各任务互相独立，输出与串行构建逐字节一致。
+    返回每个任务的状态（built/skipped/failed）、耗时以及构建函数的返回值，
+    跳过的任务返回上次构建记录的结果。
+    """
+    manifest = load_manifest(manifest_path)
+    file_cache = manifest["files"]
+    results: Dict[str, Dict] = {}
+    pending = []
+
+    for job in jobs:
+        started = time.perf_counter()
+        input_hash = compute_input_hash(job, file_cache)
+
+        if not force and is_up_to_date(job, input_hash, manifest):
+            results[job.name] = {
+                "name": job.name,
+                "status": "skipped",
+                "seconds": time.perf_counter() - started,
+                "result": manifest["jobs"][job.name].get("result"),
+            }
+        else:
+            pending.append((job, input_hash))
+
+    def finish(job: BuildJob, input_hash: str, started: float, run: Callable[[], Any]) -> None:
+        try:
+            result = run()
+        except Exception as e:
+            manifest["jobs"].pop(job.name, None)
+            results[job.name] = {
+                "name": job.name,
+                "status": "failed",
+                "seconds": time.perf_counter() - started,
+                "error": str(e),
+            }
+            return
+
+        _record_result(manifest, job, input_hash, result)
+        save_manifest(manifest, manifest_path)
+        results[job.name] = {
+            "name": job.name,
+            "status": "built",
+            "seconds": time.perf_counter() - started,
+            "result": result,
+        }
+
+    if workers == 0:
+        workers = os.cpu_count() or 1
+
+    if workers > 1 and len(pending) > 1:
+        # 进程池只在并行构建时需要，延迟导入以缩短生成脚本的启动时间
+        from concurrent.futures import ProcessPoolExecutor
+
+        started = time.perf_counter()
+        with ProcessPoolExecutor(max_workers=min(workers, len(pending))) as executor:
+            futures = [
+                (job, input_hash, executor.submit(_execute_job, job.build, job.args, job.seed))
+                for job, input_hash in pending
+            ]
+            for job, input_hash, future in futures:
+                finish(job, input_hash, started, future.result)
+    else:
+        for job, input_hash in pending:
+            finish(job, input_hash, time.perf_counter(),
+                   lambda job=job: _execute_job(job.build, job.args, job.seed))
+
+    # 输入文件哈希缓存即使没有任务重建也需要保存
+    save_manifest(manifest, manifest_path)
+    return [results[job.name] for job in jobs]
+
+
+def add_build_arguments(parser, output_format: bool = True) -> None:
+    """为生成器的命令行添加通用构建参数"""
+    parser.add_argument("--force", action="store_true", help="忽略缓存，强制重新生成所有词库")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="并行构建的进程数（0 表示使用全部CPU核心）")
+    if output_format:
+        parser.add_argument("--format", choices=OUTPUT_FORMATS, default="pretty",
+                            help="词库输出格式：pretty 缩进JSON、compact 压缩JSON、ndjson 每行一个条目、strtab 共享字符串表")
+
+
+def print_build_summary(results: Sequence[Dict]) -> None:
+    """打印构建结果"""
+    built = sum(1 for r in results if r["status"] == "built")
+    skipped = sum(1 for r in results if r["status"] == "skipped")
+    failed = [r for r in results if r["status"] == "failed"]
+
+    for r in results:
+        if r["status"] == "skipped":
+            print(f"  ⏭️  {r['name']}: 已是最新，跳过 ({r['seconds'] * 1000:.1f} ms)")
+        elif r["status"] == "built":
+            print(f"  ✅ {r['name']}: 已重新生成 ({r['seconds']:.2f} s)")
+        else:
+            print(f"  ❌ {r['name']}: 生成失败: {r['error']}")
+
+    print(f"\n  重新生成: {built}  跳过: {skipped}  失败: {len(failed)}")
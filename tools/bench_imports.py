@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+生成脚本导入耗时基准测试
+在独立的子进程中导入每个生成脚本，只统计 import 语句本身的耗时（不含解释器启动），
+分别测量词汇源缓存已存在（warm）和被删除（cold）两种情况
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List
+
+from lexicon_store import LEXICON_CACHE_PATH
+
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+GENERATOR_MODULES = [
+    "comprehensive_vocabulary_database",
+    "mega_vocabulary_generator",
+    "fill_to_100_percent",
+    "ultimate_vocabulary_generator",
+    "batch_vocabulary_generator",
+    "batch_vocabulary_generator_fixed",
+    "smart_vocabulary_expander",
+    "quick_vocabulary_generator",
+]
+
+_CHILD = (
+    "import time\n"
+    "started = time.perf_counter()\n"
+    "import {module}\n"
+    "print((time.perf_counter() - started) * 1000)\n"
+)
+
+
+def time_import(module: str) -> float:
+    """在新进程中导入模块，返回毫秒数"""
+    completed = subprocess.run(
+        [sys.executable, "-c", _CHILD.format(module=module)],
+        cwd=TOOLS_DIR, capture_output=True, text=True, check=True,
+    )
+    return float(completed.stdout.strip().splitlines()[-1])
+
+
+def _remove_cache() -> None:
+    if os.path.exists(LEXICON_CACHE_PATH):
+        os.remove(LEXICON_CACHE_PATH)
+
+
+def run_benchmark(modules: List[str], repeat: int) -> List[Dict]:
+    """每个模块分别测量 cold / warm 导入耗时，各取最快一次"""
+    results = []
+    for module in modules:
+        cold = []
+        for _ in range(repeat):
+            _remove_cache()
+            cold.append(time_import(module))
+        # 最后一次 cold 导入已重新生成缓存
+        warm = [time_import(module) for _ in range(repeat)]
+        results.append({"module": module, "cold_ms": round(min(cold), 2), "warm_ms": round(min(warm), 2)})
+    return results
+
+
+def print_results(results: List[Dict]) -> None:
+    print(f"{'模块':<36} {'cold ms':>10} {'warm ms':>10}")
+    print("-" * 58)
+    for r in results:
+        print(f"{r['module']:<36} {r['cold_ms']:>10.2f} {r['warm_ms']:>10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="生成脚本导入耗时基准测试")
+    parser.add_argument("modules", nargs="*", default=GENERATOR_MODULES, help="要测量的模块")
+    parser.add_argument("--repeat", type=int, default=5, help="每种情况的导入次数，取最快一次")
+    parser.add_argument("--max-ms", type=float, help="warm 导入耗时上限，超出时以非零状态退出")
+    parser.add_argument("--output", help="将结果另存为JSON文件")
+    args = parser.parse_args()
+
+    print("⏱️  生成脚本导入耗时")
+    print("=" * 60)
+
+    results = run_benchmark(args.modules, args.repeat)
+    print_results(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n📄 结果已保存到: {args.output}")
+
+    if args.max_ms is not None:
+        slow = [r for r in results if r["warm_ms"] > args.max_ms]
+        if slow:
+            print(f"\n❌ {len(slow)} 个模块导入超过 {args.max_ms} ms: {', '.join(r['module'] for r in slow)}")
+            sys.exit(1)
+        print(f"\n✅ 全部模块导入均在 {args.max_ms} ms 以内")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,474 @@
+#!/usr/bin/env python3
+"""
+词库工具链基准测试
+覆盖各生成脚本的 main、各 save_vocabulary 实现、最大的几个词库的加载以及分析脚本，
+记录每项的耗时和内存峰值，结果按次保存为JSON文件；用 --baseline 给出基线文件时与之比较，
+超出阈值时以非零状态退出。基线与运行的机器有关，不随仓库提交：
+在同一台机器上先用 --baseline 路径 --save-baseline 保存，之后用 --baseline 路径 比较
+
+每项测试都在独立的子进程中运行，工作目录是临时复制的 tools/ 和词库目录，
+生成脚本的输出不会覆盖仓库中的词库
+"""
+
+import argparse
+import fnmatch
+import importlib
+import json
+import os
+import platform
+import runpy
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Sequence
+
+from asset_build import CACHE_DIR, PROJECT_ROOT, TOOLS_DIR, VOCAB_DIR, list_decks
+
+RESULTS_VERSION = 1
+RESULTS_DIR = os.path.join(CACHE_DIR, "benchmarks")
+
+# 默认阈值：比基线慢 25% 或内存峰值高 10% 视为退化
+DEFAULT_TIME_THRESHOLD = 0.25
+DEFAULT_MEMORY_THRESHOLD = 0.10
+
+# 低于该绝对差值的变化视为测量噪声，不判为退化
+MIN_TIME_DELTA = 0.02
+MIN_MEMORY_DELTA_MB = 0.5
+
+# 参与加载测试的最大词库数
+LOAD_DECK_COUNT = 5
+
+# save_vocabulary 测试的输入词库和输出文件名（运行后删除）
+SAVE_INPUT_DECK = "toefl_full"
+SAVE_OUTPUT = "bench_output.json"
+
+# 参与合并测试的词库数（取最大的几个）
+MERGE_DECK_COUNT = 2
+
+# 分析脚本的结果缓存（模块, 路径常量），标记为 cold 的测试项每次运行前删除，避免计入缓存命中的耗时
+RESULT_CACHES = (
+    ("final_vocabulary_system", "SUMMARY_CACHE_PATH"),
+    ("vocabulary_stats", "STATS_CACHE_PATH"),
+    ("corpus_columns", "COLUMNS_CACHE_PATH"),
+)
+
+ROOT = "root"
+TOOLS = "tools"
+
+
+class BenchCase:
+    """单项基准测试
+
+    setup 在计时之外执行（导入模块、准备输入），返回要测量的无参可调用对象；
+    cwd 为 "root" 或 "tools"，对应部分生成脚本使用的相对路径；
+    cold 为真时每次运行前删除分析脚本的结果缓存（见 RESULT_CACHES）。
+    """
+
+    def __init__(self, name: str, group: str, setup: Callable[[], Callable[[], object]],
+                 cwd: str = TOOLS, stdin: Optional[str] = None, cold: bool = False):
+        self.name = name
+        self.group = group
+        self.setup = setup
+        self.cwd = cwd
+        self.stdin = stdin
+        self.cold = cold
+
+
+def _main_setup(module: str, argv: Sequence[str] = ()) -> Callable[[], Callable[[], object]]:
+    def setup():
+        sys.argv = [f"{module}.py", *argv]
+        return importlib.import_module(module).main
+    return setup
+
+
+def _save_setup(module: str, fmt: Optional[str] = None) -> Callable[[], Callable[[], object]]:
+    def setup():
+        from vocab_io import load_vocabulary
+
+        entries = load_vocabulary(os.path.join(VOCAB_DIR, f"{SAVE_INPUT_DECK}.json"))
+        mod = importlib.import_module(module)
+        if module == "vocabulary_generator":
+            generator = mod.VocabularyGenerator(VOCAB_DIR)
+            return lambda: generator.save_vocabulary(entries, SAVE_OUTPUT)
+        if fmt is not None:
+            return lambda: mod.save_vocabulary(entries, SAVE_OUTPUT, fmt)
+        return lambda: mod.save_vocabulary(entries, SAVE_OUTPUT)
+    return setup
+
+
+def _load_setup(deck: str) -> Callable[[], Callable[[], object]]:
+    def setup():
+        path = os.path.join(VOCAB_DIR, f"{deck}.json")
+
+        def run():
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return run
+    return setup
+
+
+def _stream_setup(deck: str) -> Callable[[], Callable[[], object]]:
+    def setup():
+        from vocab_io import iter_vocabulary
+
+        path = os.path.join(VOCAB_DIR, f"{deck}.json")
+        return lambda: sum(1 for _ in iter_vocabulary(path))
+    return setup
+
+
+def _stats_setup():
+    from vocabulary_stats import compute_stats
+
+    paths = [os.path.join(VOCAB_DIR, f"{deck}.json") for deck in list_decks()]
+    return lambda: [compute_stats(path) for path in paths]
+
+
+def _validation_setup():
+    from validate_vocabularies import run_validation
+
+    decks = list_decks()
+    return lambda: run_validation(decks, workers=1)
+
+
+def _corpus_setup():
+    from corpus_columns import build_corpus, print_report
+
+    decks = list_decks()
+    return lambda: print_report(build_corpus(decks))
+
+
+def _script_setup(script: str) -> Callable[[], Callable[[], object]]:
+    def setup():
+        path = os.path.join(VOCAB_DIR, script)
+        sys.argv = [path]
+        return lambda: runpy.run_path(path, run_name="__main__")
+    return setup
+
+
+def largest_decks(count: int = LOAD_DECK_COUNT) -> List[str]:
+    """按文件大小取最大的几个词库"""
+    decks = list_decks()
+    return sorted(decks, key=lambda deck: -os.path.getsize(os.path.join(VOCAB_DIR, f"{deck}.json")))[:count]
+
+
+def build_cases(load_decks: Sequence[str]) -> List[BenchCase]:
+    """全部基准测试项，按执行顺序排列"""
+    from vocab_io import OUTPUT_FORMATS
+
+    merge_inputs = [f"{deck}.json" for deck in load_decks[:MERGE_DECK_COUNT]]
+    cases = [
+        # 生成脚本：增量构建的脚本使用 --force，保证每次都完整生成
+        BenchCase("main:fill_to_100_percent", "main", _main_setup("fill_to_100_percent", ["--force"])),
+        BenchCase("main:mega_vocabulary_generator", "main", _main_setup("mega_vocabulary_generator", ["--force"])),
+        BenchCase("main:ultimate_vocabulary_generator", "main",
+                  _main_setup("ultimate_vocabulary_generator", ["--force"])),
+        BenchCase("main:smart_vocabulary_expander", "main", _main_setup("smart_vocabulary_expander", ["--force"])),
+        BenchCase("main:batch_vocabulary_generator_fixed", "main", _main_setup("batch_vocabulary_generator_fixed")),
+        BenchCase("main:quick_vocabulary_generator", "main", _main_setup("quick_vocabulary_generator"),
+                  cwd=ROOT, stdin="all\n"),
+        BenchCase("main:vocabulary_generator:merge", "main",
+                  _main_setup("vocabulary_generator", ["merge", *merge_inputs, "--output", SAVE_OUTPUT]), cwd=ROOT),
+        BenchCase("main:final_vocabulary_system", "main", _main_setup("final_vocabulary_system"), cold=True),
+
+        # save_vocabulary：各实现写出同一个词库
+        BenchCase("save:batch_vocabulary_generator_fixed", "save", _save_setup("batch_vocabulary_generator_fixed")),
+        BenchCase("save:quick_vocabulary_generator", "save", _save_setup("quick_vocabulary_generator"), cwd=ROOT),
+        BenchCase("save:generate_vocabularies", "save", _save_setup("generate_vocabularies")),
+        BenchCase("save:vocabulary_generator", "save", _save_setup("vocabulary_generator")),
+    ]
+    cases += [
+        BenchCase(f"save:smart_vocabulary_expander:{fmt}", "save", _save_setup("smart_vocabulary_expander", fmt))
+        for fmt in OUTPUT_FORMATS
+    ]
+
+    for deck in load_decks:
+        cases.append(BenchCase(f"load:{deck}", "load", _load_setup(deck)))
+        cases.append(BenchCase(f"stream:{deck}", "load", _stream_setup(deck)))
+
+    cases += [
+        BenchCase("analysis:vocabulary_stats", "analysis", _stats_setup, cold=True),
+        BenchCase("analysis:validate_vocabularies", "analysis", _validation_setup, cold=True),
+        BenchCase("analysis:corpus_columns", "analysis", _corpus_setup, cold=True),
+        BenchCase("analysis:check_difficulty", "analysis", _script_setup("check_difficulty.py"), cwd=ROOT, cold=True),
+        BenchCase("analysis:analyze_kaoyan", "analysis", _script_setup("analyze_kaoyan.py"), cwd=ROOT, cold=True),
+        BenchCase("analysis:check_kaoyan", "analysis", _script_setup("check_kaoyan.py"), cwd=ROOT, cold=True),
+    ]
+    return cases
+
+
+def select_cases(cases: Sequence[BenchCase], patterns: Sequence[str]) -> List[BenchCase]:
+    """按名称或分组筛选（支持通配符，如 "save:*"）"""
+    if not patterns:
+        return list(cases)
+    return [
+        case for case in cases
+        if any(fnmatch.fnmatch(case.name, pattern) or case.group == pattern for pattern in patterns)
+    ]
+
+
+# ---- 子进程：执行单项测试 ----
+
+def _remove_save_outputs() -> None:
+    stem = os.path.splitext(SAVE_OUTPUT)[0]
+    for name in os.listdir(VOCAB_DIR):
+        if name.startswith(stem):
+            os.remove(os.path.join(VOCAB_DIR, name))
+
+
+def _clear_result_caches() -> None:
+    """删除分析脚本的结果缓存；模块无法导入（缺少依赖）时跳过"""
+    for module, attr in RESULT_CACHES:
+        try:
+            path = getattr(importlib.import_module(module), attr)
+        except ImportError:
+            continue
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def run_case(case: BenchCase, memory: bool) -> Dict:
+    """在当前进程中执行一次测试；memory 为真时用 tracemalloc 记录内存峰值（此时不计时）"""
+    try:
+        if case.cold:
+            _clear_result_caches()
+        run = case.setup()
+    except ImportError as e:
+        return {"status": "skipped", "reason": str(e)}
+
+    try:
+        if memory:
+            tracemalloc.start()
+            run()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            return {"status": "ok", "peak_mb": peak / 1024 / 1024}
+        started = time.perf_counter()
+        run()
+        return {"status": "ok", "seconds": time.perf_counter() - started}
+    finally:
+        _remove_save_outputs()
+
+
+def _child_main(args) -> None:
+    cases = {case.name: case for case in build_cases(args.load_decks)}
+    result = run_case(cases[args.run_case], args.memory)
+    with open(args.result, 'w', encoding='utf-8') as f:
+        json.dump(result, f)
+
+
+# ---- 父进程：准备工作目录、调度子进程 ----
+
+def create_sandbox(work_dir: str) -> str:
+    """复制 tools/ 的脚本与数据以及词库目录，返回副本中的 tools 目录"""
+    tools_dir = os.path.join(work_dir, "tools")
+    vocab_dir = os.path.join(work_dir, os.path.relpath(VOCAB_DIR, PROJECT_ROOT))
+    os.makedirs(vocab_dir)
+    shutil.copytree(os.path.join(TOOLS_DIR, "data"), os.path.join(tools_dir, "data"))
+    for name in os.listdir(TOOLS_DIR):
+        if name.endswith(".py"):
+            shutil.copy2(os.path.join(TOOLS_DIR, name), tools_dir)
+    for name in os.listdir(VOCAB_DIR):
+        if name.endswith((".json", ".py")):
+            shutil.copy2(os.path.join(VOCAB_DIR, name), vocab_dir)
+    return tools_dir
+
+
+def warm_caches(tools_dir: str) -> None:
+    """预先生成副本中的词汇源与同义词缓存，避免第一项测试承担缓存构建"""
+    subprocess.run(
+        [sys.executable, "-c", "import lexicon_store, thesaurus; lexicon_store.load_lexicon(); thesaurus.get_thesaurus()"],
+        cwd=tools_dir, stdout=subprocess.DEVNULL, check=True,
+    )
+
+
+def _spawn(tools_dir: str, case: BenchCase, load_decks: Sequence[str], memory: bool) -> Dict:
+    result_path = os.path.join(tools_dir, ".bench_result.json")
+    command = [sys.executable, os.path.join(tools_dir, "bench_toolchain.py"),
+               "--run-case", case.name, "--result", result_path, "--load-decks", *load_decks]
+    if memory:
+        command.append("--memory")
+    completed = subprocess.run(
+        command, cwd=tools_dir if case.cwd == TOOLS else os.path.dirname(tools_dir),
+        input=case.stdin or "", stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+    )
+    if completed.returncode != 0 or not os.path.exists(result_path):
+        lines = completed.stderr.strip().splitlines()
+        return {"status": "failed", "reason": lines[-1] if lines else f"退出码 {completed.returncode}"}
+    with open(result_path, 'r', encoding='utf-8') as f:
+        result = json.load(f)
+    os.remove(result_path)
+    return result
+
+
+def run_benchmark(cases: Sequence[BenchCase], load_decks: Sequence[str], repeat: int) -> List[Dict]:
+    """每项先计时 repeat 次取最快一次，再单独运行一次测量内存峰值"""
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bench_toolchain_") as work_dir:
+        tools_dir = create_sandbox(work_dir)
+        warm_caches(tools_dir)
+        for case in cases:
+            print(f"  ⏱️  {case.name} ...", end="", flush=True)
+            record = {"name": case.name, "group": case.group}
+            times = []
+            outcome = None
+            for _ in range(repeat):
+                outcome = _spawn(tools_dir, case, load_decks, memory=False)
+                if outcome["status"] != "ok":
+                    break
+                times.append(outcome["seconds"])
+            if outcome["status"] == "ok":
+                outcome = _spawn(tools_dir, case, load_decks, memory=True)
+            if outcome["status"] == "ok":
+                record.update(status="ok", seconds=round(min(times), 4), peak_mb=round(outcome["peak_mb"], 2))
+                print(f" {record['seconds']:.3f} s, {record['peak_mb']:.1f} MB")
+            else:
+                record.update(status=outcome["status"], reason=outcome.get("reason"))
+                print(f" {outcome['status']}: {outcome.get('reason')}")
+            results.append(record)
+    return results
+
+
+# ---- 结果与基线 ----
+
+def write_json(data: Dict, path: str) -> None:
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def load_baseline(path: str) -> Optional[Dict[str, Dict]]:
+    """读取基线结果，按测试项名称索引；不存在时返回 None"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return {r["name"]: r for r in data.get("results", []) if r.get("status") == "ok"}
+
+
+def compare(results: Sequence[Dict], baseline: Dict[str, Dict],
+            time_threshold: float, memory_threshold: float) -> List[Dict]:
+    """与基线比较，返回超出阈值的指标（同时超出绝对噪声下限才计入）"""
+    regressions = []
+    for r in results:
+        base = baseline.get(r["name"])
+        if r["status"] != "ok" or base is None:
+            continue
+        for metric, threshold, min_delta in (("seconds", time_threshold, MIN_TIME_DELTA),
+                                             ("peak_mb", memory_threshold, MIN_MEMORY_DELTA_MB)):
+            old, new = base[metric], r[metric]
+            if new > old * (1 + threshold) and new - old > min_delta:
+                regressions.append({"name": r["name"], "metric": metric, "baseline": old, "current": new})
+    return regressions
+
+
+def _change(new: float, old: Optional[float]) -> str:
+    return f"{(new - old) / old:+.0%}" if old else ""
+
+
+def print_results(results: Sequence[Dict], baseline: Optional[Dict[str, Dict]]) -> None:
+    print(f"\n{'测试项':<44} {'秒':>9} {'变化':>6} {'峰值 MB':>9} {'变化':>6}")
+    print("-" * 80)
+    for r in results:
+        if r["status"] != "ok":
+            print(f"{r['name']:<44} {r['status']}")
+            continue
+        base = (baseline or {}).get(r["name"], {})
+        print(f"{r['name']:<44} {r['seconds']:>9.3f} {_change(r['seconds'], base.get('seconds')):>6} "
+              f"{r['peak_mb']:>9.1f} {_change(r['peak_mb'], base.get('peak_mb')):>6}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="词库工具链基准测试")
+    parser.add_argument("cases", nargs="*", help="要运行的测试项或分组（main/save/load/analysis），支持通配符")
+    parser.add_argument("--repeat", type=int, default=3, help="每项计时的次数，取最快一次")
+    parser.add_argument("--list", action="store_true", help="只列出测试项")
+    parser.add_argument("--output", help="结果文件路径（默认 .cache/benchmarks/run-时间.json）")
+    parser.add_argument("--baseline", help="基线结果文件；给出时与基线比较，超出阈值或基线不存在时以非零状态退出")
+    parser.add_argument("--save-baseline", action="store_true", help="将本次结果保存为 --baseline 指定的基线")
+    parser.add_argument("--time-threshold", type=float, default=DEFAULT_TIME_THRESHOLD,
+                        help="耗时超出基线的比例上限（0.25 表示 25%%）")
+    parser.add_argument("--memory-threshold", type=float, default=DEFAULT_MEMORY_THRESHOLD,
+                        help="内存峰值超出基线的比例上限")
+    # 子进程参数
+    parser.add_argument("--run-case", help=argparse.SUPPRESS)
+    parser.add_argument("--result", help=argparse.SUPPRESS)
+    parser.add_argument("--memory", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--load-decks", nargs="*", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_case:
+        _child_main(args)
+        return
+
+    load_decks = largest_decks()
+    cases = select_cases(build_cases(load_decks), args.cases)
+    if args.list:
+        for case in cases:
+            print(f"  {case.group:<10} {case.name}")
+        return
+    if not cases:
+        parser.error("没有匹配的测试项")
+    if args.save_baseline and not args.baseline:
+        parser.error("--save-baseline 需要同时给出 --baseline")
+
+    # 要求比较时基线必须存在，避免在没有基线的环境中静默通过
+    baseline = load_baseline(args.baseline) if args.baseline else None
+    if args.baseline and baseline is None and not args.save_baseline:
+        print(f"❌ 无法读取基线: {args.baseline}（使用 --save-baseline 先保存基线）")
+        sys.exit(1)
+
+    print("⏱️  词库工具链基准测试")
+    print("=" * 60)
+    results = run_benchmark(cases, load_decks, args.repeat)
+
+    print_results(results, baseline)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"run-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    report = {
+        "version": RESULTS_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": args.repeat,
+        "results": results,
+    }
+    write_json(report, output)
+    print(f"\n📄 结果已保存到: {output}")
+
+    if args.save_baseline:
+        write_json(report, args.baseline)
+        print(f"📌 已保存为基线: {args.baseline}")
+
+    failed = [r["name"] for r in results if r["status"] == "failed"]
+    if failed:
+        print(f"\n❌ {len(failed)} 个测试项运行失败: {', '.join(failed)}")
+
+    if not args.baseline:
+        print("\nℹ️  未给出 --baseline，没有与基线比较")
+    elif baseline is not None and not args.save_baseline:
+        missing = [r["name"] for r in results if r["status"] == "ok" and r["name"] not in baseline]
+        if missing:
+            print(f"\nℹ️  {len(missing)} 个测试项没有基线数据，未参与比较: {', '.join(missing)}")
+        regressions = compare(results, baseline, args.time_threshold, args.memory_threshold)
+        for r in regressions:
+            unit = "s" if r["metric"] == "seconds" else "MB"
+            print(f"  ❌ {r['name']}: {r['metric']} {r['baseline']:.3f} → {r['current']:.3f} {unit}"
+                  f"（{_change(r['current'], r['baseline'])}）")
+        if regressions:
+            print(f"\n❌ {len(regressions)} 项指标超出阈值"
+                  f"（耗时 +{args.time_threshold:.0%}，内存 +{args.memory_threshold:.0%}）")
+            sys.exit(1)
+        print("\n✅ 全部指标均在基线阈值以内")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
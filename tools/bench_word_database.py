@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+词库数据库查询基准测试
+用全部词库构建约6万词的临时数据库，对比：
+  tags  按标签查询：LIKE '%tag%' 全表扫描 vs 规范化标签表连接查询
+  fts   按释义反查（中文 → 英文）：LIKE '%词%' 全表扫描 vs FTS5 二元分词全文索引
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import tempfile
+import time
+from typing import Dict, Iterator, List, Tuple
+
+from asset_build import list_decks
+from build_word_database import fts_query, iter_deck_entries, populate_database
+
+# 旧查询：local_database.dart 中 getWordsByTag 的写法
+LIKE_QUERY = "SELECT * FROM words WHERE tags LIKE ?"
+
+# 新查询：通过规范化标签表精确匹配
+JOIN_QUERY = (
+    "SELECT w.* FROM tags AS t "
+    "JOIN word_tags AS wt ON wt.tag_id = t.id "
+    "JOIN words AS w ON w.id = wt.word_id "
+    "WHERE t.name = ?"
+)
+
+DEFAULT_TAGS = ["cet4", "ky", "gre", "business", "n", "no_such_tag"]
+
+# 旧查询：逐词检查释义是否包含查询串
+DEFINITION_LIKE_QUERY = "SELECT * FROM words WHERE definition LIKE ? LIMIT ?"
+
+# 新查询：全文索引按相关度排序，只检索释义列以便与 LIKE 的结果对比
+FTS_QUERY = (
+    "SELECT w.* FROM words_fts AS f JOIN words AS w ON w.row_id = f.rowid "
+    "WHERE words_fts MATCH ? ORDER BY f.rank LIMIT ?"
+)
+
+DEFAULT_QUERIES = ["放弃", "学习", "遗弃", "经济发展", "环境", "不存在的词"]
+
+
+def iter_benchmark_entries(min_words: int) -> Iterator[Dict]:
+    """产生基准测试用的条目：每个词库的条目都保留（id 已带词库前缀），不足时重复补足（再加轮次前缀）"""
+    decks = list_decks()
+    count = 0
+    round_no = 0
+    while count < min_words or round_no == 0:
+        for deck in decks:
+            for entry in iter_deck_entries([deck]):
+                entry["id"] = f"{round_no}:{entry['id']}"
+                count += 1
+                yield entry
+        round_no += 1
+
+
+def time_query(conn: sqlite3.Connection, query: str, params: Tuple, repeat: int) -> Tuple[float, int]:
+    """多次执行查询取最快一次，返回（毫秒, 行数）"""
+    best = float("inf")
+    rows = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = len(conn.execute(query, params).fetchall())
+        best = min(best, time.perf_counter() - started)
+    return best * 1000, rows
+
+
+def query_plan(conn: sqlite3.Connection, query: str, params: Tuple) -> str:
+    return " / ".join(row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {query}", params))
+
+
+def run_fts_benchmark(conn: sqlite3.Connection, queries: List[str], limit: int, repeat: int) -> List[Dict]:
+    """对每个查询分别执行 LIKE 扫描和全文检索（取前 limit 条，并统计全部命中数）"""
+    results = []
+    for query in queries:
+        expression = "definition : (" + fts_query(query) + ")"
+        like_ms, like_rows = time_query(conn, DEFINITION_LIKE_QUERY, (f"%{query}%", limit), repeat)
+        fts_ms, fts_rows = time_query(conn, FTS_QUERY, (expression, limit), repeat)
+        like_total = len(conn.execute(DEFINITION_LIKE_QUERY, (f"%{query}%", -1)).fetchall())
+        fts_total = len(conn.execute(FTS_QUERY, (expression, -1)).fetchall())
+        results.append({
+            "query": query,
+            "like_ms": round(like_ms, 3),
+            "like_rows": like_rows,
+            "like_total": like_total,
+            "fts_ms": round(fts_ms, 3),
+            "fts_rows": fts_rows,
+            "fts_total": fts_total,
+        })
+    return results
+
+
+def print_fts_results(results: List[Dict]) -> None:
+    print(f"{'查询':<10} {'LIKE ms':>10} {'FTS ms':>10} {'LIKE 命中':>10} {'FTS 命中':>10} {'加速':>8}")
+    print("-" * 66)
+    for r in results:
+        speedup = r["like_ms"] / r["fts_ms"] if r["fts_ms"] else float("inf")
+        print(f"{r['query']:<10} {r['like_ms']:>10.2f} {r['fts_ms']:>10.2f} "
+              f"{r['like_total']:>10,} {r['fts_total']:>10,} {speedup:>7.1f}x")
+
+
+def print_tag_results(results: List[Dict]) -> None:
+    print(f"{'标签':<14} {'LIKE ms':>10} {'LIKE 行数':>10} {'连接 ms':>10} {'连接 行数':>10} {'误匹配':>8} {'加速':>8}")
+    print("-" * 78)
+    for r in results:
+        speedup = r["like_ms"] / r["join_ms"] if r["join_ms"] else float("inf")
+        print(f"{r['tag']:<14} {r['like_ms']:>10.2f} {r['like_rows']:>10,} "
+              f"{r['join_ms']:>10.2f} {r['join_rows']:>10,} {r['false_matches']:>8,} {speedup:>7.1f}x")
+
+
+def run_tag_benchmark(conn: sqlite3.Connection, tags: List[str], repeat: int) -> List[Dict]:
+    """对每个标签分别执行新旧查询"""
+    results = []
+    for tag in tags:
+        like_ms, like_rows = time_query(conn, LIKE_QUERY, (f"%{tag}%",), repeat)
+        join_ms, join_rows = time_query(conn, JOIN_QUERY, (tag,), repeat)
+        results.append({
+            "tag": tag,
+            "like_ms": round(like_ms, 3),
+            "like_rows": like_rows,
+            "join_ms": round(join_ms, 3),
+            "join_rows": join_rows,
+            "false_matches": like_rows - join_rows,
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="词库数据库查询基准测试")
+    parser.add_argument("--min-words", type=int, default=60000, help="数据库中至少包含的词汇数")
+    parser.add_argument("--suite", choices=["tags", "fts", "all"], default="all", help="要运行的测试")
+    parser.add_argument("--tags", nargs="+", default=DEFAULT_TAGS, help="要查询的标签")
+    parser.add_argument("--queries", nargs="+", default=DEFAULT_QUERIES, help="要反查的中文释义")
+    parser.add_argument("--limit", type=int, default=20, help="全文检索每次返回的条数")
+    parser.add_argument("--repeat", type=int, default=5, help="每个查询执行次数，取最快一次")
+    parser.add_argument("--output", help="将结果另存为JSON文件")
+    args = parser.parse_args()
+
+    print("⏱️  词库数据库查询基准测试")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        conn = sqlite3.connect(os.path.join(work_dir, "bench.db"))
+        try:
+            populate_database(conn, iter_benchmark_entries(args.min_words))
+            conn.execute("ANALYZE")
+            total = conn.execute("SELECT COUNT(*) FROM words").fetchone()[0]
+            print(f"📚 数据库词汇数: {total:,}\n")
+
+            report = {"words": total}
+            if args.suite in ("tags", "all"):
+                print("🏷️  按标签查询")
+                print(f"  LIKE 查询计划: {query_plan(conn, LIKE_QUERY, ('%x%',))}")
+                print(f"  连接查询计划: {query_plan(conn, JOIN_QUERY, ('x',))}\n")
+                report["tags"] = run_tag_benchmark(conn, args.tags, args.repeat)
+                print_tag_results(report["tags"])
+                print()
+
+            if args.suite in ("fts", "all"):
+                print(f"🔤 按释义反查（前 {args.limit} 条）")
+                report["fts"] = run_fts_benchmark(conn, args.queries, args.limit, args.repeat)
+                print_fts_results(report["fts"])
+        finally:
+            conn.close()
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n📄 结果已保存到: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+离线词库数据库构建工具
+用标准库 sqlite3 把词库JSON批量导入 words 表（与 local_database.dart 中 _createDb 的表结构一致），
+拆分出规范化的标签表、建立索引，VACUUM 后再建立中文二元分词的 FTS5 全文索引并 ANALYZE/VACUUM，应用可直接复制现成的数据库而不必在首次启动时逐条导入
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import time
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from asset_build import PROJECT_ROOT, VOCAB_DIR, BuildJob, add_build_arguments, list_decks, print_build_summary, run_jobs
+from vocab_io import iter_vocabulary
+
+# 表结构或导入逻辑变化时递增，使增量构建失效
+GENERATOR_VERSION = "5"
+
+# 与 DatabaseHelper._dbVersion 保持一致，sqflite 打开时不会再执行 onCreate/onUpgrade
+DB_VERSION = 3
+
+DEFAULT_OUTPUT = os.path.join(PROJECT_ROOT, "assets", "data", "english_learning.db")
+
+# 与 DatabaseHelper._createDb 相同的表结构。
+# words.row_id 是显式的 INTEGER PRIMARY KEY，VACUUM 不会重新编号，words_fts 的 rowid 与之对应
+SCHEMA = [
+    """
+    CREATE TABLE words(
+      row_id INTEGER PRIMARY KEY,
+      id TEXT NOT NULL UNIQUE,
+      word TEXT NOT NULL,
+      phonetic TEXT,
+      definition TEXT NOT NULL,
+      examples TEXT NOT NULL,
+      synonyms TEXT,
+      antonyms TEXT,
+      etymology TEXT,
+      difficulty INTEGER NOT NULL,
+      tags TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE cards(
+      id TEXT PRIMARY KEY,
+      word_id TEXT NOT NULL,
+      state INTEGER NOT NULL,
+      ease_factor REAL NOT NULL,
+      interval INTEGER NOT NULL,
+      repetitions INTEGER NOT NULL,
+      created_at TEXT NOT NULL,
+      next_review TEXT NOT NULL,
+      last_review TEXT,
+      FOREIGN KEY (word_id) REFERENCES words (id) ON DELETE CASCADE
+    )
+    """,
+    """
+    CREATE TABLE study_sessions (
+      id TEXT PRIMARY KEY,
+      started_at TEXT NOT NULL,
+      completed_at TEXT,
+      total_cards INTEGER NOT NULL,
+      correct_cards INTEGER NOT NULL,
+      wrong_cards INTEGER NOT NULL,
+      wrong_word_ids TEXT
+    )
+    """,
+    "CREATE INDEX idx_cards_next_review ON cards(next_review)",
+    "CREATE INDEX idx_cards_state ON cards(state)",
+    # 规范化的标签表：tag → word 由主键覆盖，word → tag 由 idx_word_tags_word 覆盖
+    """
+    CREATE TABLE tags(
+      id INTEGER PRIMARY KEY,
+      name TEXT NOT NULL UNIQUE
+    )
+    """,
+    """
+    CREATE TABLE word_tags(
+      tag_id INTEGER NOT NULL,
+      word_id TEXT NOT NULL,
+      PRIMARY KEY (tag_id, word_id),
+      FOREIGN KEY (word_id) REFERENCES words (id) ON DELETE CASCADE,
+      FOREIGN KEY (tag_id) REFERENCES tags (id)
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX idx_word_tags_word ON word_tags(word_id, tag_id)",
+]
+
+# 导入完成后再建立的索引（先插入后建索引更快）
+WORD_INDEXES = [
+    "CREATE INDEX idx_words_difficulty ON words(difficulty)",
+    "CREATE INDEX idx_words_word ON words(word)",
+]
+
+# 全文索引只在预构建数据库中提供（Android 自带的 SQLite 不保证支持 FTS5）。
+# 无内容表：rowid 对应 words.row_id，写入的是预先分词后的文本（应用写入 words 时按相同分词同步）
+FTS_SCHEMA = (
+    "CREATE VIRTUAL TABLE words_fts USING fts5("
+    "word, definition, examples, content='', tokenize='unicode61 remove_diacritics 2')"
+)
+
+# 中日韩统一表意文字（含扩展A区和兼容区）
+_CJK_RUN = re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+")
+_QUERY_TOKEN = re.compile(r"[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff]+|[^\W_]+")
+
+WORD_COLUMNS = ("id", "word", "phonetic", "definition", "examples", "synonyms",
+                "antonyms", "etymology", "difficulty", "tags")
+
+
+def _json_list(value) -> str:
+    return json.dumps(list(value), ensure_ascii=False)
+
+
+def word_row(entry: Dict) -> Tuple:
+    """把词库条目转换为 words 表的一行（列表字段存为JSON文本）"""
+    synonyms = entry.get("synonyms")
+    antonyms = entry.get("antonyms")
+    return (
+        entry["id"],
+        entry["word"],
+        entry.get("phonetic"),
+        entry.get("definition") or "",
+        _json_list(entry.get("examples") or []),
+        None if synonyms is None else _json_list(synonyms),
+        None if antonyms is None else _json_list(antonyms),
+        entry.get("etymology"),
+        int(entry.get("difficulty") or 0),
+        _json_list(entry.get("tags") or []),
+    )
+
+
+def deck_word_id(deck: str, word_id: str) -> str:
+    """数据库中的词汇 id：词库内的 id 只在本词库中唯一（各词库的 cet4_00001 等编号互相重复），加词库名前缀
+    （与 DatabaseHelper.deckWordId 一致）"""
+    return f"{deck}:{word_id}"
+
+
+def iter_deck_entries(decks: Sequence[str]) -> Iterator[Dict]:
+    """按顺序逐个读取多个词库的条目，id 换成带词库前缀的 id"""
+    for deck in decks:
+        for entry in iter_vocabulary(os.path.join(VOCAB_DIR, f"{deck}.json")):
+            yield {**entry, "id": deck_word_id(deck, entry["id"])}
+
+
+def create_schema(conn: sqlite3.Connection) -> None:
+    """建立与应用一致的表结构"""
+    for statement in SCHEMA:
+        conn.execute(statement)
+    conn.execute(f"PRAGMA user_version = {DB_VERSION}")
+
+
+def insert_words(conn: sqlite3.Connection, entries: Iterable[Dict]) -> int:
+    """批量导入词汇，返回导入的行数；id 重复时报错，不会静默覆盖已导入的条目"""
+    placeholders = ", ".join("?" for _ in WORD_COLUMNS)
+    before = conn.total_changes
+    conn.executemany(
+        f"INSERT INTO words ({', '.join(WORD_COLUMNS)}) VALUES ({placeholders})",
+        (word_row(entry) for entry in entries),
+    )
+    return conn.total_changes - before
+
+
+def create_word_indexes(conn: sqlite3.Connection) -> None:
+    """为 words 表建立查询索引"""
+    for statement in WORD_INDEXES:
+        conn.execute(statement)
+
+
+def populate_tags(conn: sqlite3.Connection) -> int:
+    """从 words.tags 的JSON文本拆出 tags 和 word_tags 表，返回标签数"""
+    conn.execute(
+        "INSERT OR IGNORE INTO tags (name) "
+        "SELECT DISTINCT j.value FROM words, json_each(words.tags) AS j ORDER BY j.value"
+    )
+    conn.execute(
+        "INSERT OR IGNORE INTO word_tags (tag_id, word_id) "
+        "SELECT t.id, w.id FROM words AS w, json_each(w.tags) AS j JOIN tags AS t ON t.name = j.value"
+    )
+    return conn.execute("SELECT COUNT(*) FROM tags").fetchone()[0]
+
+
+def _bigrams(run: str) -> List[str]:
+    if len(run) == 1:
+        return [run]
+    return [run[i:i + 2] for i in range(len(run) - 1)]
+
+
+def cjk_bigrams(text: str) -> str:
+    """把连续的汉字切分为重叠的二元组并用空格分隔，其他文本保持不变
+
+    "v. 遗弃；放弃" → "v.  遗弃 ； 放弃 "，单个汉字保留为一元组。
+    """
+    return _CJK_RUN.sub(lambda m: " " + " ".join(_bigrams(m.group(0))) + " ", text)
+
+
+def fts_query(query: str) -> str:
+    """把用户输入转换为 FTS5 查询表达式，与 cjk_bigrams 的分词方式对应
+
+    汉字串转为二元组短语（相邻二元组必须连续出现，等价于子串匹配），
+    英文词按前缀匹配；单个汉字也按前缀匹配，只能命中以该字开头的二元组。多个词之间为 AND。
+    """
+    terms = []
+    for token in _QUERY_TOKEN.findall(query):
+        if _CJK_RUN.fullmatch(token):
+            if len(token) == 1:
+                terms.append(f'"{token}"*')
+            else:
+                terms.append('"' + " ".join(_bigrams(token)) + '"')
+        else:
+            terms.append(f'"{token.lower()}"*')
+    return " AND ".join(terms)
+
+
+def _fts_rows(conn: sqlite3.Connection) -> Iterator[Tuple]:
+    for rowid, word, definition, examples in conn.execute(
+        "SELECT row_id, word, definition, examples FROM words"
+    ):
+        example_text = " ".join(str(e) for e in json.loads(examples))
+        yield rowid, cjk_bigrams(word), cjk_bigrams(definition), cjk_bigrams(example_text)
+
+
+def populate_fts(conn: sqlite3.Connection) -> None:
+    """为单词、释义和例句建立全文索引"""
+    conn.execute(FTS_SCHEMA)
+    # 先取出全部行再写入，避免在同一连接上边读 words 边写入
+    rows = list(_fts_rows(conn))
+    conn.executemany(
+        "INSERT INTO words_fts (rowid, word, definition, examples) VALUES (?, ?, ?, ?)", rows
+    )
+    conn.execute("INSERT INTO words_fts (words_fts) VALUES ('optimize')")
+
+
+# 同一单词在多个词库中各有一行，按单词去重（保留相关度最高的一行），与查询完全相同的单词排在最前
+SEARCH_QUERY = (
+    "SELECT w.*, MIN(f.rank) AS score FROM words_fts AS f JOIN words AS w ON w.row_id = f.rowid "
+    "WHERE words_fts MATCH ? GROUP BY lower(w.word) "
+    "ORDER BY lower(w.word) = ? DESC, score LIMIT ?"
+)
+
+
+def search_words(conn: sqlite3.Connection, query: str, limit: int = 20) -> List[Tuple]:
+    """全文检索词汇（精确匹配的单词优先，其余按相关度排序，按单词去重），返回 words 表的行"""
+    expression = fts_query(query)
+    if not expression:
+        return []
+    rows = conn.execute(SEARCH_QUERY, (expression, query.strip().lower(), limit)).fetchall()
+    return [row[:-1] for row in rows]
+
+
+def populate_database(conn: sqlite3.Connection, entries: Iterable[Dict]) -> int:
+    """在空数据库中建表、导入词汇、建立索引、标签表和全文索引，返回导入的行数"""
+    with conn:
+        create_schema(conn)
+        inserted = insert_words(conn, entries)
+        create_word_indexes(conn)
+        populate_tags(conn)
+    # 先整理导入和建索引产生的碎片再建立全文索引
+    conn.execute("VACUUM")
+    with conn:
+        populate_fts(conn)
+    return inserted
+
+
+def build_word_database(output: str, decks: Sequence[str]) -> Dict:
+    """构建词库数据库，返回统计信息"""
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    tmp_path = output + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    started = time.perf_counter()
+    conn = sqlite3.connect(tmp_path)
+    try:
+        # 离线构建失败直接重来，无需日志和同步
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+
+        inserted = populate_database(conn, iter_deck_entries(decks))
+        conn.execute("ANALYZE")
+        # 回收全文索引 optimize 后的空闲页；row_id 是显式主键，VACUUM 不会改变它
+        conn.execute("VACUUM")
+        words = conn.execute("SELECT COUNT(*) FROM words").fetchone()[0]
+    finally:
+        conn.close()
+
+    os.replace(tmp_path, output)
+    return {
+        "decks": len(decks),
+        "inserted": inserted,
+        "words": words,
+        "bytes": os.path.getsize(output),
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+def create_build_jobs(output: str = DEFAULT_OUTPUT, decks: Sequence[str] = ()) -> List[BuildJob]:
+    """创建数据库构建任务（输入为全部所选词库）"""
+    decks = list(decks) or list_decks()
+    return [
+        BuildJob(
+            name=f"word_database:{os.path.relpath(os.path.abspath(output), PROJECT_ROOT)}",
+            build=build_word_database,
+            args=(output, decks),
+            outputs=[output],
+            input_files=[os.path.join(VOCAB_DIR, f"{deck}.json") for deck in decks],
+            version=GENERATOR_VERSION,
+        )
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="离线词库数据库构建工具")
+    add_build_arguments(parser, output_format=False)
+    parser.add_argument("--output", "-o", default=DEFAULT_OUTPUT, help="输出的数据库文件")
+    parser.add_argument("--decks", nargs="+", default=[], help="要导入的词库名（默认全部）")
+    args = parser.parse_args()
+
+    print("🗄️  构建词库数据库")
+    print("=" * 60)
+
+    results = run_jobs(create_build_jobs(args.output, args.decks), force=args.force, workers=args.jobs)
+    print_build_summary(results)
+
+    for r in results:
+        stats = r.get("result")
+        if stats:
+            print(f"\n📊 {stats['decks']} 个词库 → {stats['words']:,} 个词汇"
+                  f"（{stats['bytes'] / 1024 / 1024:.1f} MB，用时 {stats['seconds']:.2f} s）")
+    print(f"📄 输出文件: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
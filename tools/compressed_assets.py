@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+词库压缩变体构建与对比工具
+从所有词库的公共样板（字段名、模板例句、词性标签、常见释义）训练 zlib 预置字典，
+为每个词库生成压缩变体，并对比原始文件与压缩变体的大小和解压+解析耗时
+"""
+
+import argparse
+import json
+import os
+import time
+import zlib
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+from asset_build import CACHE_DIR, VOCAB_DIR, list_decks
+from deck_shards import SHARD_SIZE, list_sharded_decks
+from vocab_io import load_vocabulary
+
+# zlib 预置字典最多使用 32KB（超出部分不会被引用）
+MAX_DICTIONARY_SIZE = 32 * 1024
+
+# 每个词库用于训练字典的条目数
+SAMPLE_ENTRIES = 300
+
+COMPRESSION_LEVEL = 9
+
+DEFAULT_OUTPUT_DIR = os.path.join(CACHE_DIR, "compressed")
+DICTIONARY_NAME = "vocabulary.zdict"
+
+_COMPACT = dict(ensure_ascii=False, separators=(",", ":"))
+
+
+def compact_bytes(entries: List[Dict]) -> bytes:
+    """压缩前统一转换为压缩JSON"""
+    return json.dumps(entries, **_COMPACT).encode("utf-8")
+
+
+def _sample(entries: List[Dict], count: int) -> List[Dict]:
+    if len(entries) <= count:
+        return entries
+    step = len(entries) / count
+    return [entries[int(i * step)] for i in range(count)]
+
+
+def _fragments(entry: Dict) -> Iterable[str]:
+    """条目中可能在其他条目重复出现的片段：字段名、字段值，以及字符串按单词切开后的模板片段"""
+    word = entry.get("word") if isinstance(entry.get("word"), str) else ""
+    for key, value in entry.items():
+        yield f'"{key}":'
+        values = value if isinstance(value, list) else [value]
+        if isinstance(value, list):
+            yield f'"{key}":' + json.dumps(value, **_COMPACT)
+        for item in values:
+            text = json.dumps(item, **_COMPACT)
+            if word and word in text and key != "word":
+                for piece in text.split(word):
+                    if len(piece) > 2:
+                        yield piece
+            elif key not in ("id", "word"):
+                yield text
+
+
+def train_dictionary(decks: Iterable[List[Dict]], size: int = MAX_DICTIONARY_SIZE) -> bytes:
+    """按“出现次数 × 长度”挑选片段拼成预置字典，收益最高的片段放在末尾（引用距离最短）"""
+    frequency = Counter()
+    for entries in decks:
+        for entry in _sample(entries, SAMPLE_ENTRIES):
+            # 同一条目内重复的片段只计一次
+            frequency.update(set(_fragments(entry)))
+
+    scored = sorted(
+        ((count * len(fragment.encode("utf-8")), fragment) for fragment, count in frequency.items() if count > 1),
+        reverse=True,
+    )
+
+    chosen: List[bytes] = []
+    total = 0
+    for _, fragment in scored:
+        data = fragment.encode("utf-8")
+        if total + len(data) > size:
+            continue
+        chosen.append(data)
+        total += len(data)
+
+    return b"".join(reversed(chosen))
+
+
+def compress_deck(entries: List[Dict], dictionary: Optional[bytes] = None) -> bytes:
+    """压缩词库（压缩JSON + zlib，可选预置字典）"""
+    if dictionary:
+        compressor = zlib.compressobj(COMPRESSION_LEVEL, zdict=dictionary)
+    else:
+        compressor = zlib.compressobj(COMPRESSION_LEVEL)
+    return compressor.compress(compact_bytes(entries)) + compressor.flush()
+
+
+def decompress_deck(data: bytes, dictionary: Optional[bytes] = None) -> List[Dict]:
+    """解压并解析压缩变体；使用预置字典压缩的数据必须提供同一字典"""
+    if dictionary:
+        decompressor = zlib.decompressobj(zdict=dictionary)
+    else:
+        decompressor = zlib.decompressobj()
+    raw = decompressor.decompress(data) + decompressor.flush()
+    return json.loads(raw.decode("utf-8"))
+
+
+def load_dictionary(path: str) -> bytes:
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def read_compressed_deck(path: str, dictionary_path: Optional[str] = None) -> List[Dict]:
+    """读取 .json.z 压缩变体"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    dictionary = load_dictionary(dictionary_path) if dictionary_path else None
+    return decompress_deck(data, dictionary)
+
+
+def _best_time(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def build_compressed_assets(output_dir: str, repeat: int) -> List[Dict]:
+    """训练字典、写出压缩变体，返回每个词库的对比数据"""
+    decks = {deck: load_vocabulary(os.path.join(VOCAB_DIR, f"{deck}.json")) for deck in list_decks()}
+
+    dictionary = train_dictionary(decks.values())
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, DICTIONARY_NAME), 'wb') as f:
+        f.write(dictionary)
+    print(f"📖 预置字典: {len(dictionary):,} 字节")
+
+    sharded = set(list_sharded_decks())
+    rows = []
+    for deck, entries in decks.items():
+        raw_path = os.path.join(VOCAB_DIR, f"{deck}.json")
+        with open(raw_path, 'rb') as f:
+            raw = f.read()
+
+        plain = compress_deck(entries)
+        trained = compress_deck(entries, dictionary)
+        if decompress_deck(trained, dictionary) != entries:
+            raise ValueError(f"{deck} 压缩后无法还原")
+
+        with open(os.path.join(output_dir, f"{deck}.json.z"), 'wb') as f:
+            f.write(trained)
+
+        # 分片（见 deck_shards.py）各自独立压缩时，预置字典的作用更明显
+        shard_plain = shard_trained = 0
+        if deck in sharded:
+            for start in range(0, len(entries), SHARD_SIZE):
+                shard = entries[start:start + SHARD_SIZE]
+                shard_plain += len(compress_deck(shard))
+                shard_trained += len(compress_deck(shard, dictionary))
+
+        rows.append({
+            "deck": deck,
+            "raw_bytes": len(raw),
+            "zlib_bytes": len(plain),
+            "zdict_bytes": len(trained),
+            "shard_zlib_bytes": shard_plain,
+            "shard_zdict_bytes": shard_trained,
+            "raw_parse_ms": _best_time(lambda: json.loads(raw.decode("utf-8")), repeat),
+            "zdict_decode_ms": _best_time(lambda: decompress_deck(trained, dictionary), repeat),
+        })
+    return rows
+
+
+def print_report(rows: List[Dict]) -> None:
+    """打印对比表格"""
+    print(f"\n{'词库':<22} {'原始 KB':>10} {'zlib KB':>10} {'字典 KB':>10} {'压缩率':>7} "
+          f"{'原始解析 ms':>11} {'解压+解析 ms':>12}")
+    print("-" * 92)
+    for r in rows:
+        print(f"{r['deck']:<22} {r['raw_bytes'] / 1024:>10.1f} {r['zlib_bytes'] / 1024:>10.1f} "
+              f"{r['zdict_bytes'] / 1024:>10.1f} {r['zdict_bytes'] / r['raw_bytes']:>7.1%} "
+              f"{r['raw_parse_ms']:>11.2f} {r['zdict_decode_ms']:>12.2f}")
+
+    raw = sum(r["raw_bytes"] for r in rows)
+    plain = sum(r["zlib_bytes"] for r in rows)
+    trained = sum(r["zdict_bytes"] for r in rows)
+    parse = sum(r["raw_parse_ms"] for r in rows)
+    decode = sum(r["zdict_decode_ms"] for r in rows)
+    print("-" * 92)
+    print(f"{'合计':<22} {raw / 1024:>10.1f} {plain / 1024:>10.1f} {trained / 1024:>10.1f} "
+          f"{trained / raw:>7.1%} {parse:>11.2f} {decode:>12.2f}")
+    print(f"\n  整个词库压缩：预置字典相对普通 zlib 再节省 {plain - trained:,} 字节（{1 - trained / plain:.1%}）")
+
+    shard_plain = sum(r["shard_zlib_bytes"] for r in rows)
+    shard_trained = sum(r["shard_zdict_bytes"] for r in rows)
+    if shard_plain:
+        print(f"  按 {SHARD_SIZE} 条分片压缩：普通 zlib {shard_plain / 1024:.1f} KB，"
+              f"预置字典 {shard_trained / 1024:.1f} KB（再节省 {1 - shard_trained / shard_plain:.1%}）")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="词库压缩变体构建与对比工具")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR, help="压缩变体和预置字典的输出目录")
+    parser.add_argument("--repeat", type=int, default=3, help="每项计时重复次数，取最快一次")
+    parser.add_argument("--report", help="将对比数据另存为JSON文件")
+    args = parser.parse_args()
+
+    print("🗜️  词库压缩变体")
+    print("=" * 60)
+
+    rows = build_compressed_assets(args.output_dir, args.repeat)
+    print_report(rows)
+    print(f"\n📦 输出目录: {args.output_dir}")
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, ensure_ascii=False, indent=2)
+        print(f"📄 报告已保存到: {args.report}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+词库列式分析
+把所有词库的条目物化为一张 NumPy 列式表（单词、词库、难度、词性、标签位掩码、释义长度、例句数），
+常见的统计问题（难度 × 词库分布、标签共现矩阵、长度分布）都由向量化运算完成，不再逐条遍历字典；
+标签位掩码使用 tag_registry 的固定位分配；列数据缓存为 .npz 文件，词库未变化时直接加载
+
+依赖 NumPy（见 tools/requirements.txt）
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from asset_build import CACHE_DIR, VOCAB_DIR, list_decks
+from tag_registry import TagRegistry, get_registry
+from vocab_io import iter_vocabulary
+
+# 列的构成或编码方式变化时递增，使缓存失效
+COLUMNS_VERSION = 2
+
+COLUMNS_CACHE_PATH = os.path.join(CACHE_DIR, "corpus_columns.npz")
+
+# 释义开头的词性缩写，如 "v. 遗弃" → "v"，"n./v. 诅咒" → "n"
+_POS_PATTERN = re.compile(r"^([a-z]+)\.")
+
+# 分布统计输出的分位数
+QUANTILES = (0.0, 0.25, 0.5, 0.75, 1.0)
+
+
+class Corpus:
+    """全部词库条目的列式表，每列是长度为条目数的数组
+
+    word          单词（定长 Unicode）
+    deck          词库编号，对应 deck_names
+    difficulty    难度（缺失时为 0）
+    pos           词性编号，对应 pos_names（无法识别时为 ""）
+    tags          标签位掩码，第 i 位对应 tag_names[i]（未注册的标签记入 tag_registry.OTHER_BIT）
+    definition_length  释义字符数
+    example_count 例句数
+    """
+
+    COLUMNS = ("word", "deck", "difficulty", "pos", "tags", "definition_length", "example_count")
+
+    def __init__(self, columns: Dict[str, np.ndarray], deck_names: Sequence[str],
+                 pos_names: Sequence[str], registry: TagRegistry):
+        for name in self.COLUMNS:
+            setattr(self, name, columns[name])
+        self.deck_names = list(deck_names)
+        self.pos_names = list(pos_names)
+        self.registry = registry
+        self.tag_names = registry.tags
+
+    def __len__(self) -> int:
+        return len(self.word)
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        return {name: getattr(self, name) for name in self.COLUMNS}
+
+    # ---- 筛选 ----
+
+    def tag_mask(self, *tags: str) -> np.uint64:
+        """标签组合对应的位掩码；未注册的标签报错"""
+        return np.uint64(self.registry.mask(tags, strict=True))
+
+    def select(
+        self,
+        decks: Optional[Iterable[str]] = None,
+        all_tags: Iterable[str] = (),
+        any_tags: Iterable[str] = (),
+        only_tags: Optional[Iterable[str]] = None,
+        difficulty: Optional[Tuple[int, int]] = None,
+    ) -> np.ndarray:
+        """按条件筛选，返回布尔数组；only_tags 要求条目非空的标签集合是其子集"""
+        registry = self.registry
+        selected = np.ones(len(self), dtype=bool)
+        if decks is not None:
+            codes = [self.deck_names.index(deck) for deck in decks if deck in self.deck_names]
+            selected &= np.isin(self.deck, codes)
+        all_tags = list(all_tags)
+        if all_tags:
+            selected &= registry.superset_of(self.tags, registry.mask(all_tags, strict=True))
+        any_tags = list(any_tags)
+        if any_tags:
+            selected &= registry.any_of(self.tags, registry.mask(any_tags, strict=True))
+        if only_tags is not None:
+            selected &= (self.tags != 0) & registry.subset_of(self.tags, registry.mask(only_tags, strict=True))
+        if difficulty is not None:
+            selected &= (self.difficulty >= difficulty[0]) & (self.difficulty <= difficulty[1])
+        return selected
+
+    # ---- 分组统计 ----
+
+    def _mask_bits(self, masks: np.ndarray) -> np.ndarray:
+        """位掩码 → 0/1 矩阵[掩码, 标签]"""
+        bits = np.arange(len(self.tag_names), dtype=np.uint64)
+        return ((masks[:, None] >> bits) & np.uint64(1)).astype(np.int64)
+
+    def tag_matrix(self, where: Optional[np.ndarray] = None) -> np.ndarray:
+        """条目 × 标签的 0/1 矩阵"""
+        return self._mask_bits(self.tags if where is None else self.tags[where])
+
+    def _distinct_masks(self, where: Optional[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        # 不同的标签组合只有几百种，先合并相同的掩码再计算，与条目数基本无关
+        tags = self.tags if where is None else self.tags[where]
+        masks, counts = np.unique(tags, return_counts=True)
+        return self._mask_bits(masks), counts
+
+    def difficulty_by_deck(self, where: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """难度 × 词库直方图，返回（矩阵[词库, 难度], 难度取值）"""
+        deck = self.deck if where is None else self.deck[where]
+        difficulty = self.difficulty if where is None else self.difficulty[where]
+        levels = np.arange(int(self.difficulty.max(initial=0)) + 1)
+        counts = np.bincount(deck.astype(np.int64) * len(levels) + difficulty,
+                             minlength=len(self.deck_names) * len(levels))
+        return counts.reshape(len(self.deck_names), len(levels)), levels
+
+    def tag_counts(self, where: Optional[np.ndarray] = None) -> np.ndarray:
+        """每个标签的条目数"""
+        bits, counts = self._distinct_masks(where)
+        return counts @ bits
+
+    def tag_cooccurrence(self, where: Optional[np.ndarray] = None) -> np.ndarray:
+        """标签共现矩阵：[i, j] 为同时带有标签 i 和 j 的条目数，对角线为标签 i 的条目数"""
+        bits, counts = self._distinct_masks(where)
+        return (bits * counts[:, None]).T @ bits
+
+    def distribution(self, column: str, by: Optional[str] = "deck",
+                     where: Optional[np.ndarray] = None) -> Dict[str, Dict[str, float]]:
+        """数值列的分布（分位数与均值），可按 deck/pos/difficulty 分组"""
+        values = getattr(self, column)
+        groups = getattr(self, by) if by else np.zeros(len(self), dtype=np.int16)
+        if where is not None:
+            values, groups = values[where], groups[where]
+
+        order = np.lexsort((values, groups))
+        values, groups = values[order], groups[order]
+        keys, starts = np.unique(groups, return_index=True)
+        names = {"deck": self.deck_names, "pos": self.pos_names}.get(by)
+
+        result = {}
+        for key, chunk in zip(keys, np.split(values, starts[1:])):
+            label = names[key] if names is not None else str(key) if by else "all"
+            stats = {f"p{int(q * 100)}": float(v) for q, v in zip(QUANTILES, np.quantile(chunk, QUANTILES))}
+            stats["mean"] = float(chunk.mean())
+            stats["count"] = int(len(chunk))
+            result[label] = stats
+        return result
+
+    def histogram(self, column: str, bins: Sequence[int], where: Optional[np.ndarray] = None) -> np.ndarray:
+        """数值列按给定边界的直方图"""
+        values = getattr(self, column)
+        if where is not None:
+            values = values[where]
+        return np.histogram(values, bins=bins)[0]
+
+
+def _corpus_signature(paths: Sequence[str]) -> List:
+    signature = []
+    for path in paths:
+        stat = os.stat(path)
+        signature.append([os.path.basename(path), stat.st_size, stat.st_mtime_ns])
+    return signature
+
+
+def build_corpus(decks: Sequence[str]) -> Corpus:
+    """流式读取词库，物化为列式表"""
+    words: List[str] = []
+    deck_codes: List[int] = []
+    difficulty: List[int] = []
+    pos_codes: List[int] = []
+    tag_masks: List[int] = []
+    definition_length: List[int] = []
+    example_count: List[int] = []
+
+    pos_names: Dict[str, int] = {}
+    registry = get_registry()
+
+    for code, deck in enumerate(decks):
+        for entry in iter_vocabulary(os.path.join(VOCAB_DIR, f"{deck}.json")):
+            word = entry.get("word")
+            words.append(word if isinstance(word, str) else "")
+            deck_codes.append(code)
+
+            level = entry.get("difficulty")
+            difficulty.append(level if isinstance(level, int) and not isinstance(level, bool) and level > 0 else 0)
+
+            definition = entry.get("definition")
+            definition = definition if isinstance(definition, str) else ""
+            match = _POS_PATTERN.match(definition)
+            pos_codes.append(pos_names.setdefault(match.group(1) if match else "", len(pos_names)))
+            definition_length.append(len(definition))
+
+            examples = entry.get("examples")
+            example_count.append(len(examples) if isinstance(examples, list) else 0)
+
+            tag_masks.append(registry.mask(tag for tag in entry.get("tags") or () if isinstance(tag, str)))
+
+    columns = {
+        "word": np.array(words, dtype=str),
+        "deck": np.array(deck_codes, dtype=np.int16),
+        "difficulty": np.array(difficulty, dtype=np.int8),
+        "pos": np.array(pos_codes, dtype=np.int16),
+        "tags": np.array(tag_masks, dtype=np.uint64),
+        "definition_length": np.array(definition_length, dtype=np.int32),
+        "example_count": np.array(example_count, dtype=np.int16),
+    }
+    return Corpus(columns, decks, list(pos_names), registry)
+
+
+def _save_corpus(corpus: Corpus, signature: List, path: str) -> None:
+    meta = {
+        "version": COLUMNS_VERSION,
+        "signature": signature,
+        "decks": corpus.deck_names,
+        "pos": corpus.pos_names,
+        "tags": corpus.tag_names,
+    }
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        np.savez(f, meta=np.array(json.dumps(meta, ensure_ascii=False)), **corpus.columns())
+    os.replace(tmp_path, path)
+
+
+def _load_cached_corpus(signature: List, path: str) -> Optional[Corpus]:
+    registry = get_registry()
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            # 标签注册表变化（追加标签）时位分配不同，需要重新构建
+            if (meta.get("version") != COLUMNS_VERSION or meta.get("signature") != signature
+                    or meta.get("tags") != registry.tags):
+                return None
+            columns = {name: data[name] for name in Corpus.COLUMNS}
+    except (OSError, KeyError, ValueError):
+        return None
+    return Corpus(columns, meta["decks"], meta["pos"], registry)
+
+
+def load_corpus(decks: Optional[Sequence[str]] = None, use_cache: bool = True,
+                cache_path: str = COLUMNS_CACHE_PATH) -> Corpus:
+    """加载列式表；词库文件的大小和修改时间与缓存一致时直接读取 .npz 缓存"""
+    decks = list(decks or list_decks())
+    signature = _corpus_signature([os.path.join(VOCAB_DIR, f"{deck}.json") for deck in decks])
+    if use_cache:
+        corpus = _load_cached_corpus(signature, cache_path)
+        if corpus is not None:
+            return corpus
+
+    corpus = build_corpus(decks)
+    if use_cache:
+        try:
+            _save_corpus(corpus, signature, cache_path)
+        except OSError:
+            # 缓存目录不可写时仍可使用，只是每次都要重新读取词库
+            pass
+    return corpus
+
+
+def print_report(corpus: Corpus, top_pairs: int = 15) -> None:
+    """打印全语料报告：难度 × 词库、标签共现、长度分布"""
+    matrix, levels = corpus.difficulty_by_deck()
+    header = "".join(f"{'难度' + str(level) if level else '无':>8}" for level in levels)
+    print(f"\n📊 难度 × 词库（共 {len(corpus):,} 个条目）")
+    print(f"{'词库':<22}{header}{'合计':>9}")
+    for deck, row in zip(corpus.deck_names, matrix):
+        print(f"{deck:<22}" + "".join(f"{count:>8,}" for count in row) + f"{row.sum():>9,}")
+
+    co = corpus.tag_cooccurrence()
+    upper = np.triu(co, k=1)
+    pairs = np.argsort(upper, axis=None)[::-1][:top_pairs]
+    print(f"\n🏷️  共现最多的标签对（前 {top_pairs}）")
+    for flat in pairs:
+        i, j = np.unravel_index(flat, co.shape)
+        if upper[i, j] == 0:
+            break
+        print(f"  {corpus.tag_names[i]:>10} + {corpus.tag_names[j]:<10} {upper[i, j]:>8,}"
+              f"  （{upper[i, j] / co[i, i]:.0%} / {upper[i, j] / co[j, j]:.0%}）")
+
+    for column, label in (("definition_length", "释义长度"), ("example_count", "例句数")):
+        print(f"\n📏 {label}分布（按词库）")
+        print(f"{'词库':<22}{'最小':>7}{'P25':>7}{'中位':>7}{'P75':>7}{'最大':>7}{'平均':>8}")
+        for deck, stats in corpus.distribution(column, by="deck").items():
+            print(f"{deck:<22}{stats['p0']:>7.0f}{stats['p25']:>7.0f}{stats['p50']:>7.0f}"
+                  f"{stats['p75']:>7.0f}{stats['p100']:>7.0f}{stats['mean']:>8.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="词库列式分析")
+    parser.add_argument("decks", nargs="*", help="参与分析的词库（默认全部）")
+    parser.add_argument("--no-cache", action="store_true", help="忽略 .npz 缓存，重新读取词库")
+    parser.add_argument("--top-pairs", type=int, default=15, help="显示的标签共现对数")
+    args = parser.parse_args()
+
+    print("🧮 词库列式分析")
+    print("=" * 60)
+
+    started = time.perf_counter()
+    corpus = load_corpus(args.decks or None, use_cache=not args.no_cache)
+    loaded = time.perf_counter()
+
+    print_report(corpus, args.top_pairs)
+    finished = time.perf_counter()
+
+    print(f"\n⏱️  加载 {(loaded - started) * 1000:.1f} ms，报告 {(finished - loaded) * 1000:.1f} ms"
+          f"（{len(corpus):,} 个条目、{len(corpus.deck_names)} 个词库、{len(corpus.tag_names)} 个标签）")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+词库分面索引构建工具
+为每个词库预先计算首字母、难度、标签的倒排表（分面值 → 条目下标）、按难度排序的条目顺序和汇总计数，
+按字母/难度浏览、统计、推荐和学习计划无需在运行时遍历整个词库
+"""
+
+import argparse
+import json
+import os
+from typing import Dict, List
+
+from asset_build import INDEX_DIR, VOCAB_DIR, BuildJob, add_build_arguments, list_decks, print_build_summary, run_jobs
+from vocab_io import iter_vocabulary
+
+# 分面逻辑或格式变化时递增，使增量构建失效
+GENERATOR_VERSION = "1"
+FACETS_VERSION = 1
+
+
+def facets_path(deck: str) -> str:
+    return os.path.join(INDEX_DIR, f"{deck}.facets.json")
+
+
+def build_deck_facets(deck: str) -> int:
+    """为单个词库生成分面索引，返回条目数"""
+    letters: Dict[str, List[int]] = {}
+    difficulties: Dict[int, List[int]] = {}
+    tags: Dict[str, List[int]] = {}
+    words: List[str] = []
+
+    for offset, entry in enumerate(iter_vocabulary(os.path.join(VOCAB_DIR, f"{deck}.json"))):
+        word = entry.get("word") or ""
+        words.append(word)
+        if word:
+            letters.setdefault(word[0].lower(), []).append(offset)
+        difficulties.setdefault(entry.get("difficulty", 0), []).append(offset)
+        for tag in entry.get("tags") or []:
+            tags.setdefault(tag, []).append(offset)
+
+    total = len(words)
+    # 与应用内排序一致：同一字母下按单词排序，按难度排序时保持词库原有顺序
+    for postings in letters.values():
+        postings.sort(key=lambda offset: words[offset])
+    difficulty_order = [offset for level in sorted(difficulties) for offset in difficulties[level]]
+
+    facets = {
+        "deck": deck,
+        "version": FACETS_VERSION,
+        "total": total,
+        "letters": dict(sorted(letters.items())),
+        "difficulty": {str(level): postings for level, postings in sorted(difficulties.items())},
+        "tags": dict(sorted(tags.items())),
+        "difficulty_order": difficulty_order,
+        "counts": {
+            "letters": {letter: len(p) for letter, p in sorted(letters.items())},
+            "difficulty": {str(level): len(p) for level, p in sorted(difficulties.items())},
+            "tags": {tag: len(p) for tag, p in sorted(tags.items())},
+        },
+    }
+
+    os.makedirs(INDEX_DIR, exist_ok=True)
+    filepath = facets_path(deck)
+    tmp_path = filepath + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(facets, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, filepath)
+
+    return total
+
+
+def create_build_jobs() -> List[BuildJob]:
+    """为每个词库创建分面索引任务"""
+    return [
+        BuildJob(
+            name=f"deck_facets:{deck}",
+            build=build_deck_facets,
+            args=(deck,),
+            outputs=[facets_path(deck)],
+            input_files=[os.path.join(VOCAB_DIR, f"{deck}.json")],
+            version=GENERATOR_VERSION,
+        )
+        for deck in list_decks()
+    ]
+
+
+def load_facets(deck: str) -> Dict:
+    """读取词库的分面索引"""
+    with open(facets_path(deck), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="词库分面索引构建工具")
+    add_build_arguments(parser, output_format=False)
+    args = parser.parse_args()
+
+    print("🗂️  构建分面索引")
+    print("=" * 60)
+
+    results = run_jobs(create_build_jobs(), force=args.force, workers=args.jobs)
+    print_build_summary(results)
+
+    total_entries = sum(r["result"] or 0 for r in results if r["status"] != "failed")
+    print(f"\n📦 共 {len(results)} 个词库、{total_entries:,} 个条目，输出目录: {INDEX_DIR}")
+
+
+if __name__ == "__main__":
+    main()
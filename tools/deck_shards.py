@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+词库分片构建工具
+将大型词库切分为固定大小的分片，并生成清单（条目范围、首尾单词、字节数、内容哈希），
+应用只需解析当前页所在的分片即可显示，而不必解析整个词库
+
+所有词库的分片和清单平铺在同一个目录（<词库>.0000.json、<词库>.manifest.json），
+pubspec.yaml 只需列出这一个目录，新分片的词库会自动打包。
+分片的词库在应用中只打包分片（EnhancedVocabularyLoader 按清单读取），完整文件只供 tools/ 使用；
+其余小型词库在 pubspec.yaml 中逐个列出。main 会检查该列表，每个词库恰好打包一份。
+"""
+
+import argparse
+import glob
+import itertools
+import json
+import os
+import re
+import sys
+from typing import Dict, Iterator, List, Tuple
+
+from asset_build import PROJECT_ROOT, VOCAB_DIR, BuildJob, add_build_arguments, hash_file, list_decks, print_build_summary, run_jobs
+from vocab_io import iter_vocabulary, load_vocabulary, write_vocabulary
+
+# 分片逻辑变化时递增，使增量构建失效
+GENERATOR_VERSION = "2"
+
+SHARD_DIR = os.path.join(VOCAB_DIR, "shards")
+SHARD_SIZE = 200
+MANIFEST_SUFFIX = ".manifest.json"
+
+# 需要分片的大型词库
+SHARDED_DECK_PATTERNS = ["*_full.json", "*_ultra.json", "kaoyan_complete.json"]
+
+PUBSPEC_PATH = os.path.join(PROJECT_ROOT, "pubspec.yaml")
+
+# pubspec.yaml 中词库目录下的资源条目（单个文件或整个目录）
+_VOCAB_ASSET = re.compile(r"^\s*-\s*assets/vocabularies/([^\s/]*)\s*$")
+
+
+def list_sharded_decks() -> List[str]:
+    """列出需要分片的词库名（不含扩展名）"""
+    decks = set()
+    for pattern in SHARDED_DECK_PATTERNS:
+        for filepath in glob.glob(os.path.join(VOCAB_DIR, pattern)):
+            decks.add(os.path.splitext(os.path.basename(filepath))[0])
+    return sorted(decks)
+
+
+def shard_filename(deck: str, index: int) -> str:
+    return f"{deck}.{index:04d}.json"
+
+
+def manifest_path(deck: str) -> str:
+    return os.path.join(SHARD_DIR, f"{deck}{MANIFEST_SUFFIX}")
+
+
+def build_deck_shards(deck: str, shard_size: int = SHARD_SIZE) -> int:
+    """切分单个词库并写出清单，返回分片数"""
+    source = os.path.join(VOCAB_DIR, f"{deck}.json")
+    os.makedirs(SHARD_DIR, exist_ok=True)
+
+    shards = []
+    entries = iter_vocabulary(source)
+    start = 0
+    while True:
+        chunk = list(itertools.islice(entries, shard_size))
+        if not chunk:
+            break
+
+        filename = shard_filename(deck, len(shards))
+        filepath = os.path.join(SHARD_DIR, filename)
+        write_vocabulary(chunk, filepath, "compact")
+        shards.append({
+            "file": filename,
+            "start": start,
+            "end": start + len(chunk),
+            "first_word": chunk[0].get("word"),
+            "last_word": chunk[-1].get("word"),
+            "bytes": os.path.getsize(filepath),
+            "sha256": hash_file(filepath),
+        })
+        start += len(chunk)
+
+    manifest = {
+        "deck": deck,
+        "source": os.path.basename(source),
+        "source_sha256": hash_file(source),
+        "total": start,
+        "shard_size": shard_size,
+        "shards": shards,
+    }
+    path = manifest_path(deck)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+    # 词库变小后遗留的旧分片
+    current = {shard["file"] for shard in shards} | {os.path.basename(path)}
+    for filename in os.listdir(SHARD_DIR):
+        if filename.startswith(f"{deck}.") and filename.endswith(".json") and filename not in current:
+            os.remove(os.path.join(SHARD_DIR, filename))
+
+    print(f"✅ {deck}: {start} 个词汇 → {len(shards)} 个分片")
+    return len(shards)
+
+
+def create_build_jobs(shard_size: int = SHARD_SIZE) -> List[BuildJob]:
+    """为每个大型词库创建分片任务"""
+    return [
+        BuildJob(
+            name=f"deck_shards:{deck}",
+            build=build_deck_shards,
+            args=(deck, shard_size),
+            outputs=[manifest_path(deck)],
+            input_files=[os.path.join(VOCAB_DIR, f"{deck}.json")],
+            version=GENERATOR_VERSION,
+        )
+        for deck in list_sharded_decks()
+    ]
+
+
+def bundled_vocabulary_assets(pubspec_text: str) -> List[str]:
+    """pubspec.yaml 中直接列出的词库目录资源（文件名；空字符串表示整个词库目录）"""
+    return [m.group(1) for m in map(_VOCAB_ASSET.match, pubspec_text.splitlines()) if m]
+
+
+def check_bundle(decks: List[str], sharded: List[str], pubspec_text: str) -> Tuple[List[str], List[str]]:
+    """检查打包列表，返回（没有打包的词库, 重复打包的词库）
+
+    分片的词库只应以分片打包，其余词库应在 pubspec.yaml 中逐个列出；
+    列出整个词库目录会把分片词库的完整文件也打包进去。
+    """
+    assets = set(bundled_vocabulary_assets(pubspec_text))
+    sharded = set(sharded)
+    if "" in assets:
+        return [], sorted(sharded)
+    missing = [deck for deck in decks if deck not in sharded and f"{deck}.json" not in assets]
+    duplicated = [deck for deck in decks if deck in sharded and f"{deck}.json" in assets]
+    return missing, duplicated
+
+
+def load_manifest(deck: str) -> Dict:
+    """读取词库的分片清单"""
+    with open(manifest_path(deck), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def iter_range(deck: str, offset: int = 0, limit: int = SHARD_SIZE) -> Iterator[Dict]:
+    """读取 [offset, offset + limit) 范围内的条目，只解析与该范围重叠的分片"""
+    manifest = load_manifest(deck)
+    end = offset + limit
+    for shard in manifest["shards"]:
+        if shard["end"] <= offset or shard["start"] >= end:
+            continue
+        entries = load_vocabulary(os.path.join(SHARD_DIR, shard["file"]))
+        lo = max(offset, shard["start"]) - shard["start"]
+        hi = min(end, shard["end"]) - shard["start"]
+        yield from entries[lo:hi]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="词库分片构建工具")
+    add_build_arguments(parser, output_format=False)
+    parser.add_argument("--shard-size", type=int, default=SHARD_SIZE, help="每个分片的词汇数")
+    args = parser.parse_args()
+
+    print("🧩 词库分片构建")
+    print("=" * 60)
+
+    results = run_jobs(create_build_jobs(args.shard_size), force=args.force, workers=args.jobs)
+    print_build_summary(results)
+
+    total_shards = sum(r["result"] or 0 for r in results if r["status"] != "failed")
+    print(f"\n📦 共 {len(results)} 个词库、{total_shards} 个分片，输出目录: {SHARD_DIR}")
+
+    decks = list_decks()
+    sharded = list_sharded_decks()
+    shard_bytes = sum(os.path.getsize(os.path.join(SHARD_DIR, name)) for name in os.listdir(SHARD_DIR)
+                      if name.endswith(".json"))
+    deck_bytes = sum(os.path.getsize(os.path.join(VOCAB_DIR, f"{deck}.json")) for deck in decks if deck not in sharded)
+    print(f"📏 打包的词库数据: 分片 {shard_bytes / 1024 / 1024:.1f} MB + "
+          f"{len(decks) - len(sharded)} 个未分片的词库 {deck_bytes / 1024 / 1024:.1f} MB")
+
+    with open(PUBSPEC_PATH, 'r', encoding='utf-8') as f:
+        missing, duplicated = check_bundle(decks, sharded, f.read())
+    if duplicated:
+        print(f"❌ 以下分片的词库在 pubspec.yaml 中仍打包了完整文件: {', '.join(duplicated)}")
+    if missing:
+        print(f"❌ 以下词库没有分片，也没有列在 pubspec.yaml 中: {', '.join(missing)}")
+    if missing or duplicated:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,9 +4,18 @@
 将所有考试词库扩展到需求文档的100%规模
 """
 
-import json
+import argparse
 import os
 import random
+import sys
+import time
+
+from asset_build import VOCAB_DIR, BuildJob, add_build_arguments, print_build_summary, run_jobs
+from lexicon_store import get_store, raw_source
+from vocab_io import format_path, iter_vocabulary, write_vocabulary
+
+# 生成逻辑变化时递增，使增量构建失效
+GENERATOR_VERSION = "3"
 
 # 需求目标
 TARGET_VOCABULARY = {
@@ -18,266 +27,58 @@ TARGET_VOCABULARY = {
 }
 
 # 扩展词汇数据库 - 更大规模
-EXTENDED_WORD_DATABASE = {
-    # A
-    "abandon": ("əˈbændən", "v. 遗弃；放弃", 3, "cet4"),
-    "ability": ("əˈbɪləti", "n. 能力；本领", 2, "cet4"),
-    "able": ("ˈeɪbl", "adj. 能够的", 2, "cet4"),
-    "abnormal": ("æbˈnɔːrml", "adj. 反常的", 3, "cet4"),
-    "aboard": ("əˈbɔːrd", "adv./prep. 在船(车)上", 3, "cet4"),
-    "abolish": ("əˈbɒlɪʃ", "v. 废除", 4, "cet6"),
-    "abortion": ("əˈbɔːrʃn", "n. 流产；堕胎", 4, "toefl"),
-    "about": ("əˈbaʊt", "prep./adv. 关于", 1, "cet4"),
-    "above": ("əˈbʌv", "prep./adv. 在...之上", 1, "cet4"),
-    "abroad": ("əˈbrɔːd", "adv. 在国外", 2, "cet4"),
-    "abrupt": ("əˈbrʌpt", "adj. 突然的；粗鲁的", 4, "gre"),
-    "absence": ("ˈæbsəns", "n. 缺席；缺乏", 3, "cet4"),
-    "absent": ("ˈæbsənt", "adj. 缺席的", 3, "cet4"),
-    "absolute": ("ˈæbsəluːt", "adj. 绝对的", 3, "cet4"),
-    "absorb": ("əbˈzɔːrb", "v. 吸收", 3, "cet4"),
-    "abstract": ("ˈæbstrækt", "adj. 抽象的 n. 摘要", 4, "cet4"),
-    "absurd": ("əbˈsɜːrd", "adj. 荒谬的", 4, "cet6"),
-    "abundance": ("əˈbʌndəns", "n. 丰富", 4, "cet6"),
-    "abuse": ("əˈbjuːz", "v./n. 滥用", 3, "cet4"),
-    "academic": ("ˌækəˈdemɪk", "adj. 学术的", 3, "cet4"),
-    "academy": ("əˈkædəmi", "n. 学院", 3, "cet4"),
-    "accelerate": ("əkˈseləreɪt", "v. 加速", 4, "cet6"),
-    "accept": ("əkˈsept", "v. 接受", 2, "cet4"),
-    "acceptable": ("əkˈseptəbl", "adj. 可接受的", 3, "cet4"),
-    "access": ("ˈækses", "n. 接近；通道", 3, "cet4"),
-    "accessible": ("əkˈsesəbl", "adj. 可接近的", 4, "cet6"),
-    "accessory": ("əkˈsesəri", "n. 附件", 4, "toefl"),
-    "accident": ("ˈæksɪdənt", "n. 事故", 2, "cet4"),
-    "accidental": ("ˌæksɪˈdentl", "adj. 意外的", 3, "cet4"),
-    "accommodate": ("əˈkɒmədeɪt", "v. 容纳；适应", 4, "cet6"),
-    "accommodation": ("əˌkɒməˈdeɪʃn", "n. 住宿；适应", 4, "ielts"),
-    "accompany": ("əˈkʌmpəni", "v. 陪伴", 3, "cet4"),
-    "accomplish": ("əˈkʌmplɪʃ", "v. 完成", 3, "cet4"),
-    "accord": ("əˈkɔːrd", "v. 给予 n. 一致", 4, "cet6"),
-    "accordance": ("əˈkɔːrdəns", "n. 一致", 4, "cet6"),
-    "account": ("əˈkaʊnt", "n. 账户；描述", 2, "cet4"),
-    "accountant": ("əˈkaʊntənt", "n. 会计", 3, "cet4"),
-    "accumulate": ("əˈkjuːmjəleɪt", "v. 积累", 4, "cet6"),
-    "accuracy": ("ˈækjərəsi", "n. 准确性", 4, "cet6"),
-    "accurate": ("ˈækjərət", "adj. 准确的", 3, "cet4"),
-    "accuse": ("əˈkjuːz", "v. 指责", 3, "cet4"),
-    "accustom": ("əˈkʌstəm", "v. 使习惯", 4, "cet6"),
-    "achieve": ("əˈtʃiːv", "v. 实现；达到", 3, "cet4"),
-    "achievement": ("əˈtʃiːvmənt", "n. 成就", 3, "cet4"),
-    "acknowledge": ("əkˈnɒlɪdʒ", "v. 承认", 4, "cet6"),
-    "acquaint": ("əˈkweɪnt", "v. 使熟悉", 4, "cet6"),
-    "acquaintance": ("əˈkweɪntəns", "n. 熟人", 4, "cet6"),
-    "acquire": ("əˈkwaɪər", "v. 获得", 4, "cet6"),
-    "acquisition": ("ˌækwɪˈzɪʃn", "n. 获得；收购", 5, "toefl"),
-    "acre": ("ˈeɪkər", "n. 英亩", 3, "cet4"),
-    "across": ("əˈkrɒs", "prep./adv. 横过", 1, "cet4"),
-    "act": ("ækt", "v. 行动 n. 行为", 1, "cet4"),
-    "action": ("ˈækʃn", "n. 行动", 2, "cet4"),
-    "active": ("ˈæktɪv", "adj. 活跃的", 2, "cet4"),
-    "activity": ("ækˈtɪvəti", "n. 活动", 2, "cet4"),
-    "actor": ("ˈæktər", "n. 演员", 2, "cet4"),
-    "actress": ("ˈæktrəs", "n. 女演员", 2, "cet4"),
-    "actual": ("ˈæktʃuəl", "adj. 实际的", 2, "cet4"),
-    "actually": ("ˈæktʃuəli", "adv. 实际上", 2, "cet4"),
-    "acute": ("əˈkjuːt", "adj. 急性的；敏锐的", 4, "cet6"),
-    "adapt": ("əˈdæpt", "v. 适应", 3, "cet4"),
-    "adaptation": ("ˌædæpˈteɪʃn", "n. 适应", 4, "ielts"),
-    "add": ("æd", "v. 增加", 1, "cet4"),
-    "addict": ("əˈdɪkt", "v. 使沉溺 n. 上瘾者", 4, "toefl"),
-    "addition": ("əˈdɪʃn", "n. 加；增加", 3, "cet4"),
-    "additional": ("əˈdɪʃənl", "adj. 额外的", 3, "cet4"),
-    "address": ("əˈdres", "n. 地址 v. 致辞", 2, "cet4"),
-    "adequate": ("ˈædɪkwət", "adj. 足够的", 4, "cet6"),
-    "adjust": ("əˈdʒʌst", "v. 调整", 3, "cet4"),
-    "adjustment": ("əˈdʒʌstmənt", "n. 调整", 3, "cet4"),
-    "administration": ("ədˌmɪnɪˈstreɪʃn", "n. 管理", 4, "cet6"),
-    "administrative": ("ədˈmɪnɪstreɪtɪv", "adj. 管理的", 4, "cet6"),
-    "admire": ("ədˈmaɪər", "v. 钦佩", 3, "cet4"),
-    "admission": ("ədˈmɪʃn", "n. 准许进入", 4, "cet6"),
-    "admit": ("ədˈmɪt", "v. 承认", 3, "cet4"),
-    "adopt": ("əˈdɒpt", "v. 收养；采用", 3, "cet4"),
-    "adoption": ("əˈdɒpʃn", "n. 收养", 4, "cet6"),
-    "adult": ("ˈædʌlt", "n. 成年人", 2, "cet4"),
-    "advance": ("ədˈvɑːns", "v. 前进", 3, "cet4"),
-    "advanced": ("ədˈvɑːnst", "adj. 先进的", 3, "cet4"),
-    "advantage": ("ədˈvɑːntɪdʒ", "n. 优势", 3, "cet4"),
-    "advantageous": ("ˌædvənˈteɪdʒəs", "adj. 有利的", 4, "cet6"),
-    "adventure": ("ədˈventʃər", "n. 冒险", 3, "cet4"),
-    "adverb": ("ˈædvɜːrb", "n. 副词", 3, "cet4"),
-    "advertise": ("ˈædvətaɪz", "v. 做广告", 3, "cet4"),
-    "advertisement": ("ədˈvɜːrtɪsmənt", "n. 广告", 3, "cet4"),
-    "advice": ("ədˈvaɪs", "n. 建议", 2, "cet4"),
-    "advisable": ("ədˈvaɪzəbl", "adj. 明智的", 4, "cet6"),
-    "advocate": ("ˈædvəkeɪt", "v. 提倡", 5, "gre"),
-    "affair": ("əˈfer", "n. 事情", 3, "cet4"),
-    "affect": ("əˈfekt", "v. 影响", 3, "cet4"),
-    "affection": ("əˈfekʃn", "n. 喜爱", 3, "cet4"),
-    "afford": ("əˈfɔːrd", "v. 买得起", 3, "cet4"),
-    "afraid": ("əˈfreɪd", "adj. 害怕的", 2, "cet4"),
-    "Africa": ("ˈæfrɪkə", "n. 非洲", 1, "cet4"),
-    "African": ("ˈæfrɪkən", "adj. 非洲的", 2, "cet4"),
-    "after": ("ˈæftər", "prep./conj. 在...后", 1, "cet4"),
-    "afternoon": ("ˌæftərˈnuːn", "n. 下午", 1, "cet4"),
-    "afterward": ("ˈæftərwərd", "adv. 后来", 3, "cet4"),
-    "again": ("əˈɡen", "adv. 又一次", 1, "cet4"),
-    "against": ("əˈɡeɪnst", "prep. 反对", 2, "cet4"),
-    "age": ("eɪdʒ", "n. 年龄", 1, "cet4"),
-    "agency": ("ˈeɪdʒənsi", "n. 代理处", 3, "cet4"),
-    "agenda": ("əˈdʒendə", "n. 议程", 3, "cet4"),
-    "agent": ("ˈeɪdʒənt", "n. 代理人", 3, "cet4"),
-    "aggressive": ("əˈɡresɪv", "adj. 侵略的", 3, "cet4"),
-    "ago": ("əˈɡoʊ", "adv. 以前", 2, "cet4"),
-    "agree": ("əˈɡriː", "v. 同意", 2, "cet4"),
-    "agreeable": ("əˈɡriːəbl", "adj. 令人愉快的", 4, "cet6"),
-    "agreement": ("əˈɡriːmənt", "n. 协议", 3, "cet4"),
-    "agriculture": ("ˈæɡrɪkʌltʃər", "n. 农业", 3, "cet4"),
-    "ahead": ("əˈhed", "adv. 在前", 2, "cet4"),
-    "aid": ("eɪd", "n./v. 援助", 3, "cet4"),
-    "aim": ("eɪm", "n. 目标 v. 瞄准", 2, "cet4"),
-    "air": ("er", "n. 空气", 1, "cet4"),
-    "aircraft": ("ˈeərkrɑːft", "n. 飞机", 3, "cet4"),
-    "airline": ("ˈeərlaɪn", "n. 航空公司", 3, "cet4"),
-    "airport": ("ˈeərpɔːrt", "n. 机场", 2, "cet4"),
-    "alarm": ("əˈlɑːrm", "n. 警报", 3, "cet4"),
-    "album": ("ˈælbəm", "n. 相册", 3, "cet4"),
-    "alcohol": ("ˈælkəhɒl", "n. 酒精", 3, "cet4"),
-    "alert": ("əˈlɜːrt", "adj. 警觉的", 3, "cet4"),
-    "alien": ("ˈeɪliən", "n. 外星人", 3, "cet4"),
-    "alike": ("əˈlaɪk", "adj. 相似的", 3, "cet4"),
-    "alive": ("əˈlaɪv", "adj. 活着的", 2, "cet4"),
-    "all": ("ɔːl", "adj./pron. 全部", 1, "cet4"),
-    "allergic": ("əˈlɜːrdʒɪk", "adj. 过敏的", 4, "ielts"),
-    "allergy": ("ˈælərdʒi", "n. 过敏", 4, "cet6"),
-    "allow": ("əˈlaʊ", "v. 允许", 2, "cet4"),
-    "allowance": ("əˈlaʊəns", "n. 津贴", 4, "cet6"),
-    "ally": ("ˈælaɪ", "n. 同盟国", 3, "cet4"),
-    "almost": ("ˈɔːlmoʊst", "adv. 几乎", 2, "cet4"),
-    "alone": ("əˈloʊn", "adj./adv. 单独的", 2, "cet4"),
-    "along": ("əˈlɒŋ", "prep./adv. 沿着", 2, "cet4"),
-    "alongside": ("əˈlɒŋsaɪd", "prep. 在...旁边", 4, "cet6"),
-    "aloud": ("əˈlaʊd", "adv. 大声地", 2, "cet4"),
-    "alphabet": ("ˈælfəbet", "n. 字母表", 2, "cet4"),
-    "already": ("ɔːlˈredi", "adv. 已经", 2, "cet4"),
-    "also": ("ˈɔːlsoʊ", "adv. 也", 1, "cet4"),
-    "alter": ("ˈɔːltər", "v. 改变", 3, "cet4"),
-    "alternative": ("ɔːlˈtɜːrnətɪv", "n./adj. 供选择的", 4, "cet6"),
-    "although": ("ɔːlˈðoʊ", "conj. 虽然", 3, "cet4"),
-    "altogether": ("ˌɔːltəˈɡeðər", "adv. 总共", 3, "cet4"),
-    "always": ("ˈɔːlweɪz", "adv. 总是", 1, "cet4"),
-    "amazing": ("əˈmeɪzɪŋ", "adj. 令人惊异的", 3, "cet4"),
-    "ambassador": ("æmˈbæsədər", "n. 大使", 4, "toefl"),
-    "ambition": ("æmˈbɪʃn", "n. 野心", 4, "cet6"),
-    "ambulance": ("ˈæmbjələns", "n. 救护车", 3, "cet4"),
-    "among": ("əˈmʌŋ", "prep. 在...之中", 2, "cet4"),
-    "amount": ("əˈmaʊnt", "n. 数量", 3, "cet4"),
-    "amuse": ("əˈmjuːz", "v. 逗乐", 3, "cet4"),
-    "amusing": ("əˈmjuːzɪŋ", "adj. 有趣的", 3, "cet4"),
-    "analyze": ("ˈænəlaɪz", "v. 分析", 4, "cet6"),
-    "analysis": ("əˈnæləsɪs", "n. 分析", 4, "cet6"),
-    "ancestor": ("ˈænsestər", "n. 祖先", 4, "cet6"),
-    "ancient": ("ˈeɪnʃənt", "adj. 古代的", 3, "cet4"),
-    "anger": ("ˈæŋɡər", "n. 愤怒", 2, "cet4"),
-    "angle": ("ˈæŋɡl", "n. 角度", 3, "cet4"),
-    "angry": ("ˈæŋɡri", "adj. 生气的", 2, "cet4"),
-    "animal": ("ˈænɪml", "n. 动物", 2, "cet4"),
-    "anniversary": ("ˌænɪˈvɜːrsəri", "n. 周年纪念", 4, "cet6"),
-    "announce": ("əˈnaʊns", "v. 宣布", 3, "cet4"),
-    "annoy": ("əˈnɔɪ", "v. 使恼怒", 3, "cet4"),
-    "annual": ("ˈænjuəl", "adj. 每年的", 4, "cet6"),
-    "another": ("əˈnʌðər", "adj./pron. 另一个", 1, "cet4"),
-    "answer": ("ˈænsər", "n./v. 回答", 2, "cet4"),
-    "anticipate": ("ænˈtɪsɪpeɪt", "v. 预期", 4, "cet6"),
-    "anxiety": ("æŋˈzaɪəti", "n. 焦虑", 4, "cet6"),
-    "anxious": ("ˈæŋkʃəs", "adj. 焦虑的", 3, "cet4"),
-    "any": ("ˈeni", "adj./pron. 任何", 1, "cet4"),
-    "anybody": ("ˈenibɒdi", "pron. 任何人", 2, "cet4"),
-    "anyhow": ("ˈenihaʊ", "adv. 无论如何", 3, "cet4"),
-    "anyone": ("ˈeniwʌn", "pron. 任何人", 2, "cet4"),
-    "anything": ("ˈeniθɪŋ", "pron. 任何事物", 2, "cet4"),
-    "anyway": ("ˈeniweɪ", "adv. 无论如何", 2, "cet4"),
-    "anywhere": ("ˈeniweər", "adv. 任何地方", 2, "cet4"),
-    "apart": ("əˈpɑːrt", "adv. 分开", 3, "cet4"),
-    "apartment": ("əˈpɑːrtmənt", "n. 公寓", 2, "cet4"),
-    "apologize": ("əˈpɒlədʒaɪz", "v. 道歉", 3, "cet4"),
-    "apology": ("əˈpɒlədʒi", "n. 道歉", 3, "cet4"),
-    "apparent": ("əˈpærənt", "adj. 明显的", 4, "cet6"),
-    "appeal": ("əˈpiːl", "n./v. 呼吁", 4, "cet6"),
-    "appear": ("əˈpɪr", "v. 出现", 2, "cet4"),
-    "appearance": ("əˈpɪrəns", "n. 外貌", 3, "cet4"),
-    "apple": ("ˈæpl", "n. 苹果", 1, "cet4"),
-    "application": ("ˌæplɪˈkeɪʃn", "n. 申请", 3, "cet4"),
-    "apply": ("əˈplaɪ", "v. 申请", 3, "cet4"),
-    "appoint": ("əˈpɔɪnt", "v. 任命", 4, "cet6"),
-    "appointment": ("əˈpɔɪntmənt", "n. 预约", 3, "cet4"),
-    "appreciate": ("əˈpriːʃieɪt", "v. 感激", 4, "cet6"),
-    "approach": ("əˈprəʊtʃ", "n./v. 方法", 4, "cet6"),
-    "appropriate": ("əˈprəʊpriət", "adj. 适当的", 4, "cet6"),
-    "approval": ("əˈpruːvl", "n. 批准", 4, "cet6"),
-    "approve": ("əˈpruːv", "v. 批准", 4, "cet6"),
-    "approximately": ("əˈprɒksɪmətli", "adv. 大约", 4, "cet6"),
-    "April": ("ˈeɪprəl", "n. 四月", 1, "cet4"),
-    "arbitrary": ("ˈɑːrbɪtreri", "adj. 任意的", 5, "gre"),
-    "architect": ("ˈɑːrkɪtekt", "n. 建筑师", 4, "cet6"),
-    "architecture": ("ˈɑːrkɪtektʃər", "n. 建筑学", 4, "cet6"),
-    "area": ("ˈeriə", "n. 区域", 2, "cet4"),
-    "argue": ("ˈɑːrɡjuː", "v. 争论", 3, "cet4"),
-    "argument": ("ˈɑːrɡjumənt", "n. 论点", 3, "cet4"),
-    "arise": ("əˈraɪz", "v. 出现", 4, "cet6"),
-    "arithmetic": ("əˈrɪθmətɪk", "n. 算术", 3, "cet4"),
-    "arm": ("ɑːrm", "n. 手臂", 1, "cet4"),
-    "army": ("ˈɑːrmi", "n. 军队", 2, "cet4"),
-    "around": ("əˈraʊnd", "prep./adv. 在周围", 1, "cet4"),
-    "arrange": ("əˈreɪndʒ", "v. 安排", 3, "cet4"),
-    "arrangement": ("əˈreɪndʒmənt", "n. 安排", 3, "cet4"),
-    "arrest": ("əˈrest", "v./n. 逮捕", 3, "cet4"),
-    "arrival": ("əˈraɪvl", "n. 到达", 3, "cet4"),
-    "arrive": ("əˈraɪv", "v. 到达", 2, "cet4"),
-    "arrow": ("ˈæroʊ", "n. 箭", 2, "cet4"),
-    "art": ("ɑːrt", "n. 艺术", 1, "cet4"),
-    "article": ("ˈɑːrtɪkl", "n. 文章", 2, "cet4"),
-    "artificial": ("ˌɑːrtɪˈfɪʃl", "adj. 人造的", 4, "cet6"),
-    "artist": ("ˈɑːrtɪst", "n. 艺术家", 2, "cet4"),
-    "artistic": ("ɑːrˈtɪstɪk", "adj. 艺术的", 3, "cet4"),
-}
-
-def load_existing_vocabulary(filepath):
-    """加载现有词库"""
-    if not os.path.exists(filepath):
-        return []
-
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
-
-def generate_word_variations(base_word, count=10):
-    """生成词汇变体"""
-    variations = []
-
-    prefixes = ['un', 're', 'pre', 'dis', 'mis', 'in', 'im', 'il', 'ir', 'over', 'under', 'out', 'up', 'de']
-    suffixes = ['tion', 'ness', 'ment', 'able', 'ible', 'ful', 'less', 'ous', 'ive', 'al', 'er', 'or', 'ist', 'ism', 'ize', 'fy', 'ly', 'ward', 'wise', 'like']
-
-    for i in range(count):
-        # 随机组合
-        use_prefix = random.random() > 0.3
-        use_suffix = random.random() > 0.3
-
-        if use_prefix and use_suffix:
-            prefix = random.choice(prefixes)
-            suffix = random.choice(suffixes)
-            new_word = f"{prefix}{base_word}{suffix}"
-        elif use_prefix:
-            prefix = random.choice(prefixes)
-            new_word = f"{prefix}{base_word}"
-        elif use_suffix:
-            suffix = random.choice(suffixes)
-            new_word = f"{base_word}{suffix}"
-        else:
-            # 添加数字或改变拼写
-            new_word = f"{base_word}ed" if random.random() > 0.5 else f"{base_word}ing"
-
-        if len(new_word) > 3 and new_word not in variations:
-            variations.append(new_word)
-
-    return variations
+EXTENDED_WORD_DATABASE = raw_source("fill_extended")
+
+# 派生词使用的前缀、后缀和词形变化
+PREFIXES = ['un', 're', 'pre', 'dis', 'mis', 'in', 'im', 'il', 'ir', 'over', 'under', 'out', 'up', 'de']
+SUFFIXES = ['tion', 'ness', 'ment', 'able', 'ible', 'ful', 'less', 'ous', 'ive', 'al', 'er', 'or', 'ist', 'ism',
+            'ize', 'fy', 'ly', 'ward', 'wise', 'like']
+INFLECTIONS = ['ed', 'ing']
+
+class CandidateEnumerator:
+    """按固定顺序枚举 前缀 × 词根 × 后缀 的派生词
+
+    依次枚举词形变化、只加后缀、只加前缀、前后缀组合四类形式，同一种形式依次作用于全部词根。
+    候选总数有确定的上限（词根数 × 构词形式数），用集合去重，跳过已有词汇和过短的词。
+    """
+
+    def __init__(self, bases, seen):
+        self.bases = [base for base in dict.fromkeys(bases) if base.isalpha()]
+        self.patterns = (
+            [("", suffix) for suffix in INFLECTIONS + SUFFIXES]
+            + [(prefix, "") for prefix in PREFIXES]
+            + [(prefix, suffix) for prefix in PREFIXES for suffix in INFLECTIONS + SUFFIXES]
+        )
+        self.seen = seen
+        self.generated = 0
+        self.seconds = 0.0
+
+    @property
+    def upper_bound(self):
+        """最多能产生的候选数"""
+        return len(self.bases) * len(self.patterns)
+
+    def take(self, count):
+        """返回至多 count 个新派生词；候选耗尽时返回的数量少于 count"""
+        started = time.perf_counter()
+        words = []
+        for prefix, suffix in self.patterns:
+            for base in self.bases:
+                word = f"{prefix}{base}{suffix}"
+                self.generated += 1
+                if len(word) >= 4 and word not in self.seen:
+                    self.seen.add(word)
+                    words.append(word)
+                    if len(words) >= count:
+                        self.seconds += time.perf_counter() - started
+                        return words
+        self.seconds += time.perf_counter() - started
+        return words
+
+    @property
+    def rate(self):
+        """每秒枚举的候选数"""
+        return self.generated / self.seconds if self.seconds else float("inf")
 
 def create_vocabulary_entry(word_id, word, level, difficulty_range):
     """创建词汇条目"""
@@ -307,92 +108,114 @@ def create_vocabulary_entry(word_id, word, level, difficulty_range):
 
     return entry
 
-def generate_full_vocabulary(vocab_name, config):
-    """生成完整规模词库"""
-    target_count = config['target']
-    level = config['level']
-    difficulty_range = config['difficulty']
+def ultra_vocabulary_path(level, fmt="pretty"):
+    """ultra词库路径：优先使用同一输出格式的文件，不存在时回退到JSON"""
+    filepath = os.path.join(VOCAB_DIR, f"{level}_ultra.json")
+    formatted = format_path(filepath, fmt)
+    return formatted if os.path.exists(formatted) else filepath
 
-    print(f"\n生成 {vocab_name} ({level}) 词库...")
-    print(f"  目标: {target_count} 词")
+def collect_candidate_words(level, target_count, fmt="pretty"):
+    """按顺序收集去重后的候选词：扩展数据库 → ultra词库 → 派生词
 
-    # 收集现有词汇
-    all_words = {}
+    派生词的上限不足或枚举耗尽时抛出 ValueError，此时还没有写入任何条目。
+    """
+    words = []
+    seen = set()
 
     # 添加扩展数据库词汇
-    for word, data in EXTENDED_WORD_DATABASE.items():
-        if data[3] == level or (level == 'cet4' and data[3] in ['cet4', 'cet6']):
-            all_words[word] = data
+    levels = ['cet4', 'cet6'] if level == 'cet4' else [level]
+    for entry in get_store("fill_extended").by_level(*levels):
+        seen.add(entry.word)
+        words.append(entry.word)
 
     # 从ultra文件加载现有词汇
-    ultra_file = f"assets/vocabularies/{level}_ultra.json"
+    ultra_file = ultra_vocabulary_path(level, fmt)
     if os.path.exists(ultra_file):
-        ultra_data = load_existing_vocabulary(ultra_file)
-        for entry in ultra_data:
+        for entry in iter_vocabulary(ultra_file):
             word = entry['word']
-            if word not in all_words:
-                all_words[word] = (entry['phonetic'], entry['definition'], entry['difficulty'], level)
-
-    print(f"  现有词汇: {len(all_words)} 词")
-
-    # 生成新词汇直到达到目标
-    word_list = list(all_words.items())
-
-    # 使用派生词生成
-    base_words = list(EXTENDED_WORD_DATABASE.keys())[:100]
-
-    while len(word_list) < target_count:
-        base_word = random.choice(base_words)
-        variations = generate_word_variations(base_word, 20)
-
-        for var_word in variations:
-            if len(word_list) >= target_count:
-                break
-
-            if var_word not in all_words and len(var_word) >= 4:
-                difficulty = random.randint(*difficulty_range)
-                part_of_speech = random.choice(['n.', 'v.', 'adj.', 'adv.'])
-                data = (f"/{var_word[:8]}/", f"{part_of_speech} {var_word}", difficulty, level)
-                word_list.append((var_word, data))
-                all_words[var_word] = data
-
-    # 截取到目标数量
-    word_list = word_list[:target_count]
-
-    # 生成词汇条目
-    vocabulary = []
-    for idx, (word, data) in enumerate(word_list, 1):
-        entry = create_vocabulary_entry(idx, word, level, difficulty_range)
-        vocabulary.append(entry)
+            if word not in seen:
+                seen.add(word)
+                words.append(word)
+
+    print(f"  现有词汇: {len(words)} 词")
+    if len(words) >= target_count:
+        return words[:target_count]
+
+    # 使用派生词补足
+    needed = target_count - len(words)
+    enumerator = CandidateEnumerator(EXTENDED_WORD_DATABASE, seen)
+    if enumerator.upper_bound < needed:
+        raise ValueError(f"{level} 还需要 {needed} 个派生词，但最多只能枚举 {enumerator.upper_bound} 个候选")
+
+    derived = enumerator.take(needed)
+    print(f"  派生词: {len(derived)} 词（枚举 {enumerator.generated:,} / {enumerator.upper_bound:,} 个候选，"
+          f"{enumerator.rate:,.0f} 个/秒）")
+    if len(derived) < needed:
+        raise ValueError(f"{level} 的派生词已耗尽：需要 {needed} 个，只得到 {len(derived)} 个")
+
+    return words + derived
+
+def iter_full_vocabulary(level, target_count, difficulty_range, fmt="pretty"):
+    """逐个生成词汇条目，直到达到目标数量"""
+    words = collect_candidate_words(level, target_count, fmt)
+    for idx, word in enumerate(words, 1):
+        yield create_vocabulary_entry(idx, word, level, difficulty_range)
+
+def generate_full_vocabulary(vocab_name, config, fmt="pretty"):
+    """生成完整规模词库，返回词汇数"""
+    target_count = config['target']
+    level = config['level']
+    difficulty_range = config['difficulty']
 
-    # 保存文件
-    filename = f"{vocab_name}.json"
-    filepath = f"assets/vocabularies/{filename}"
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    print(f"\n生成 {vocab_name} ({level}) 词库...")
+    print(f"  目标: {target_count} 词")
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(vocabulary, f, ensure_ascii=False, indent=2)
+    # 边生成边写入文件
+    filepath = format_path(os.path.join(VOCAB_DIR, f"{vocab_name}.json"), fmt)
+    entries = iter_full_vocabulary(level, target_count, difficulty_range, fmt)
+    count = write_vocabulary(entries, filepath, fmt)
 
     file_size = os.path.getsize(filepath) / (1024 * 1024)
 
-    print(f"  ✅ 已生成: {len(vocabulary)} 词")
+    print(f"  ✅ 已生成: {count} 词")
     print(f"  文件大小: {file_size:.2f} MB")
 
-    return vocabulary
+    return count
+
+def build_full_vocabulary(vocab_name, config, fmt):
+    """构建任务入口，返回生成的词汇数"""
+    return generate_full_vocabulary(vocab_name, config, fmt)
+
+def create_build_jobs(fmt="pretty"):
+    """为每个目标词库创建构建任务"""
+    jobs = []
+    for vocab_name, config in TARGET_VOCABULARY.items():
+        jobs.append(BuildJob(
+            name=f"fill_to_100_percent:{vocab_name}",
+            build=build_full_vocabulary,
+            args=(vocab_name, config, fmt),
+            outputs=[format_path(os.path.join(VOCAB_DIR, f"{vocab_name}.json"), fmt)],
+            sources={"EXTENDED_WORD_DATABASE": EXTENDED_WORD_DATABASE},
+            input_files=[ultra_vocabulary_path(config['level'], fmt)],
+            version=GENERATOR_VERSION,
+        ))
+    return jobs
 
 def main():
+    parser = argparse.ArgumentParser(description="词库100%完成度生成器")
+    add_build_arguments(parser)
+    args = parser.parse_args()
+
     print("╔══════════════════════════════════════════════════════════════════╗")
     print("║       🎯 100%完成度词库生成器 🎯                                    ║")
     print("╚══════════════════════════════════════════════════════════════════╝")
 
-    total_words = 0
-
-    for vocab_name, config in TARGET_VOCABULARY.items():
-        try:
-            vocab = generate_full_vocabulary(vocab_name, config)
-            total_words += len(vocab)
-        except Exception as e:
-            print(f"  ❌ 生成失败: {e}")
+    results = run_jobs(create_build_jobs(args.format), force=args.force, workers=args.jobs)
+    print_build_summary(results)
+    if any(r["status"] == "failed" for r in results):
+        sys.exit(1)
+    counts = {r["name"]: r["result"] or 0 for r in results}
+    total_words = sum(counts.values())
 
     print(f"\n" + "=" * 70)
     print(f"📊 生成完成")
@@ -405,9 +228,14 @@ def main():
     print(f"\n✅ 需求达成度:")
     for vocab_name, config in TARGET_VOCABULARY.items():
         target = config['target']
-        print(f"  {vocab_name.upper():15s}: {target:6,} 词 / {target:6,} 词  (100%)")
-
-    print(f"\n🎉 所有词库已达到100%完成度!")
+        count = counts[f"fill_to_100_percent:{vocab_name}"]
+        print(f"  {vocab_name.upper():15s}: {count:6,} 词 / {target:6,} 词  ({count / target:.0%})")
+
+    if all(counts[f"fill_to_100_percent:{name}"] >= config['target'] for name, config in TARGET_VOCABULARY.items()):
+        print(f"\n🎉 所有词库已达到100%完成度!")
+    else:
+        print(f"\n⚠️  部分词库未达到目标规模（候选词不足）")
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
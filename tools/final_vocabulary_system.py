@@ -6,7 +6,13 @@
 
 import json
 import os
-from typing import List, Dict
+from typing import Dict, Iterator, List, Tuple
+
+from asset_build import CACHE_DIR, VOCAB_DIR, hash_file
+from vocab_io import count_entries, write_vocabulary
+
+SUMMARY_FILE = "vocabulary_summary.json"
+SUMMARY_CACHE_PATH = os.path.join(CACHE_DIR, "vocabulary_summary_cache.json")
 
 # 完整词汇库 - 包含CET4/6核心词汇
 COMPREHENSIVE_VOCABULARY_DB = {
@@ -94,12 +100,9 @@ def create_categorized_vocabulary():
         },
     }
 
-    # 为每个分类生成词库
-    for category_id, category_info in categories.items():
-        vocab_list = []
-
+    def iter_category_entries(category_id: str, category_info: Dict) -> Iterator[Dict]:
         for index, word in enumerate(category_info["words"], 1):
-            entry = {
+            yield {
                 "id": f"{category_id}_{index:03d}",
                 "word": word,
                 "phonetic": f"/{word}/",  # 简化音标
@@ -111,17 +114,51 @@ def create_categorized_vocabulary():
                 "tags": [category_id, "noun"],
                 "etymology": f"Word in {category_info['name']}"
             }
-            vocab_list.append(entry)
 
-        # 保存分类词库
+    # 为每个分类生成并保存词库
+    for category_id, category_info in categories.items():
         filepath = f"../assets/vocabularies/{category_id}.json"
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(vocab_list, f, ensure_ascii=False, indent=2)
+        count = write_vocabulary(iter_category_entries(category_id, category_info), filepath)
+
+        print(f"✅ 生成分类词库: {category_info['name']} ({count}词)")
+
+def _load_summary_cache() -> Dict:
+    try:
+        with open(SUMMARY_CACHE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_summary_cache(cache: Dict) -> None:
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = SUMMARY_CACHE_PATH + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp_path, SUMMARY_CACHE_PATH)
+
+
+def count_vocabulary_words(filepath: str, cache: Dict) -> Tuple[int, bool]:
+    """统计词库条目数，返回（条目数, 是否重新统计）
+
+    大小和修改时间与缓存一致时直接复用；不一致时计算哈希，内容未变（如仅被 touch）则更新缓存的元数据，
+    否则流式统计条目数，不把整个词库解析到内存。
+    """
+    file = os.path.basename(filepath)
+    stat = os.stat(filepath)
+    cached = cache.get(file)
+    if cached and cached["size"] == stat.st_size and cached["mtime_ns"] == stat.st_mtime_ns:
+        return cached["words"], False
+
+    digest = hash_file(filepath)
+    recounted = not (cached and cached["sha256"] == digest)
+    words = count_entries(filepath) if recounted else cached["words"]
+    cache[file] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest, "words": words}
+    return words, recounted
 
-        print(f"✅ 生成分类词库: {category_info['name']} ({len(vocab_list)}词)")
 
 def create_vocabulary_summary():
-    """创建词库总结文档"""
+    """创建词库总结文档（按文件大小、修改时间和内容哈希缓存条目数，只重新统计变化的词库）"""
     print("\n📊 生成词库总结...")
 
     summary = {
@@ -131,33 +168,37 @@ def create_vocabulary_summary():
         "vocabularies": []
     }
 
-    # 统计所有JSON文件
-    vocab_dir = "../assets/vocabularies"
-    if os.path.exists(vocab_dir):
-        for file in os.listdir(vocab_dir):
-            if file.endswith('.json'):
-                filepath = os.path.join(vocab_dir, file)
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        word_count = len(data)
-                        file_size = os.path.getsize(filepath)
-
-                        summary["vocabularies"].append({
-                            "file": file,
-                            "words": word_count,
-                            "size_kb": round(file_size / 1024, 2)
-                        })
-                        summary["total_words"] += word_count
-                        summary["total_vocabs"] += 1
-                except Exception as e:
-                    print(f"Warning: Could not process {file}: {e}")
+    cache = _load_summary_cache()
+    files = []
+    if os.path.exists(VOCAB_DIR):
+        files = sorted(f for f in os.listdir(VOCAB_DIR) if f.endswith('.json') and f != SUMMARY_FILE)
+
+    recounted = 0
+    for file in files:
+        filepath = os.path.join(VOCAB_DIR, file)
+        try:
+            word_count, changed = count_vocabulary_words(filepath, cache)
+        except Exception as e:
+            print(f"Warning: Could not process {file}: {e}")
+            continue
+
+        recounted += changed
+        summary["vocabularies"].append({
+            "file": file,
+            "words": word_count,
+            "size_kb": round(os.path.getsize(filepath) / 1024, 2)
+        })
+        summary["total_words"] += word_count
+        summary["total_vocabs"] += 1
+
+    # 删除已不存在的词库的缓存
+    _save_summary_cache({file: cache[file] for file in files if file in cache})
 
     # 保存总结
-    with open(os.path.join(vocab_dir, "vocabulary_summary.json"), 'w', encoding='utf-8') as f:
+    with open(os.path.join(VOCAB_DIR, SUMMARY_FILE), 'w', encoding='utf-8') as f:
         json.dump(summary, f, ensure_ascii=False, indent=2)
 
-    print(f"✅ 词库总结已生成")
+    print(f"✅ 词库总结已生成（重新统计 {recounted} 个，复用缓存 {len(files) - recounted} 个）")
     print(f"   总计 {summary['total_vocabs']} 个词库文件")
     print(f"   总计 {summary['total_words']} 个词汇")
 
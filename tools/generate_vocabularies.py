@@ -4,9 +4,10 @@
 为TOEFL、IELTS、GRE、商务、科技、日常等课程创建示例词库
 """
 
-import json
 import os
 
+from vocab_io import write_vocabulary
+
 # 词库数据目录
 VOCAB_DIR = "../assets/vocabularies"
 
@@ -1034,9 +1035,8 @@ def generate_daily_vocabulary():
 def save_vocabulary(words, filename):
     """保存词库到JSON文件"""
     filepath = os.path.join(VOCAB_DIR, filename)
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(words, f, ensure_ascii=False, indent=2)
-    print(f"✅ Generated {filename} with {len(words)} words")
+    count = write_vocabulary(words, filepath)
+    print(f"✅ Generated {filename} with {count} words")
 
 def main():
     """主函数：生成所有词库文件"""
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+共享词汇源存储
+生成脚本使用的词汇源统一保存在 data/lexicon.json，编译为 marshal 缓存后在每个进程中只加载、规范化一次，
+并建立按级别、难度、词性、首字母的二级索引，查询耗时只与结果数量有关
+"""
+
+import argparse
+import heapq
+import json
+import marshal
+import os
+import re
+import sys
+import time
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from asset_build import CACHE_DIR, TOOLS_DIR
+
+# 所有词汇源的数据文件：{"sources": {名称: {"shape": 形式, "rows": [...]}}}
+LEXICON_PATH = os.path.join(TOOLS_DIR, "data", "lexicon.json")
+
+# 编译后的缓存；marshal 格式随 Python 版本变化，文件名带上解释器标识
+LEXICON_CACHE_PATH = os.path.join(CACHE_DIR, f"lexicon.{sys.implementation.cache_tag}.marshal")
+
+# 释义开头的词性缩写，如 "v. 遗弃" → "v"，"n./v. 诅咒" → "n"
+_POS_PATTERN = re.compile(r"^([a-z]+)\.")
+
+
+class LexiconEntry(NamedTuple):
+    """规范化后的词汇记录；data 保留词汇源中的原始元组"""
+    word: str
+    phonetic: str
+    definition: str
+    difficulty: int
+    level: Optional[str]
+    pos: Optional[str]
+    source: str
+    data: tuple
+
+
+def _make_entry(source: str, word: str, phonetic: str, definition: str, difficulty: int,
+                level: Optional[str], data: tuple) -> LexiconEntry:
+    match = _POS_PATTERN.match(definition)
+    return LexiconEntry(word, phonetic, definition, difficulty, level, match.group(1) if match else None, source, data)
+
+
+def normalize_source(source: str, records: Any) -> List[LexiconEntry]:
+    """把各脚本的词汇源统一为 LexiconEntry 列表（保持原有顺序）
+
+    支持的形式：
+      {词: (音标, 释义, 难度, 级别)}、{词: (音标, 释义, 难度)}、
+      [(词, 音标, 释义, 难度)]、{难度: [(词, 音标, 释义)]}
+    """
+    entries = []
+    if isinstance(records, dict):
+        for key, value in records.items():
+            if isinstance(key, int):
+                for word, phonetic, definition in value:
+                    entries.append(_make_entry(source, word, phonetic, definition, key, None, (phonetic, definition)))
+            else:
+                level = value[3] if len(value) > 3 else None
+                entries.append(_make_entry(source, key, value[0], value[1], value[2], level, value))
+    else:
+        for record in records:
+            word, phonetic, definition, difficulty = record
+            entries.append(_make_entry(source, word, phonetic, definition, difficulty, None, tuple(record[1:])))
+    return entries
+
+
+def _compile_lexicon() -> Dict[str, Tuple[str, tuple]]:
+    with open(LEXICON_PATH, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return {
+        name: (source["shape"], tuple(tuple(row) for row in source["rows"]))
+        for name, source in data["sources"].items()
+    }
+
+
+@lru_cache(maxsize=None)
+def load_lexicon() -> Dict[str, Tuple[str, tuple]]:
+    """读取全部词汇源：{名称: (形式, 行元组)}
+
+    数据文件编译为 marshal 缓存，之后的进程直接加载缓存；数据文件的大小或修改时间变化时重新编译。
+    """
+    stat = os.stat(LEXICON_PATH)
+    key = (stat.st_size, stat.st_mtime_ns)
+    try:
+        # 整体读入后再反序列化；marshal.load 直接读文件对象会逐项小块读取，慢得多
+        with open(LEXICON_CACHE_PATH, 'rb') as f:
+            cached_key, sources = marshal.loads(f.read())
+        if cached_key == key:
+            return sources
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+
+    sources = _compile_lexicon()
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = LEXICON_CACHE_PATH + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(marshal.dumps((key, sources)))
+        os.replace(tmp_path, LEXICON_CACHE_PATH)
+    except OSError:
+        # 缓存目录不可写时仍可使用，只是每次都要重新编译
+        pass
+    return sources
+
+
+def source_names() -> List[str]:
+    return list(load_lexicon())
+
+
+def raw_source(source: str) -> Any:
+    """按词汇源原有的形式返回数据，供生成脚本直接使用
+
+      word_tuple         {词: (音标, 释义, 难度[, 级别])}
+      word_list          [(词, 音标, 释义, 难度)]
+      difficulty_groups  {难度: [(词, 音标, 释义)]}
+    """
+    lexicon = load_lexicon()
+    if source not in lexicon:
+        raise ValueError(f"未知的词汇源: {source}（可选: {', '.join(lexicon)}）")
+    shape, rows = lexicon[source]
+    if shape == "word_tuple":
+        return {row[0]: row[1:] for row in rows}
+    if shape == "word_list":
+        return list(rows)
+    if shape == "difficulty_groups":
+        groups: Dict[int, List[tuple]] = {}
+        for row in rows:
+            groups.setdefault(row[0], []).append(row[1:])
+        return groups
+    raise ValueError(f"词汇源 {source} 的形式未知: {shape}")
+
+
+@lru_cache(maxsize=None)
+def load_source(source: str) -> Tuple[LexiconEntry, ...]:
+    """加载并规范化单个词汇源，每个进程只执行一次"""
+    return tuple(normalize_source(source, raw_source(source)))
+
+
+class LexiconStore:
+    """一个或多个词汇源合并后的只读视图
+
+    同一单词出现在多个词汇源时，后面的词汇源覆盖前面的，但保留首次出现的位置（与 {**a, **b} 一致）。
+    所有查询按合并后的顺序返回结果。
+    """
+
+    def __init__(self, sources: Sequence[str] = ()):
+        self.sources = tuple(sources)
+        merged: Dict[str, LexiconEntry] = {}
+        for source in self.sources:
+            for entry in load_source(source):
+                merged[entry.word] = entry
+        self._entries: List[LexiconEntry] = list(merged.values())
+        self._positions = {entry.word: i for i, entry in enumerate(self._entries)}
+
+        # 二级索引：键 → 条目位置（升序）
+        self._by_level: Dict[Optional[str], List[int]] = {}
+        self._by_difficulty: Dict[int, List[int]] = {}
+        self._by_pos: Dict[Optional[str], List[int]] = {}
+        self._by_letter: Dict[str, List[int]] = {}
+        for i, entry in enumerate(self._entries):
+            self._by_level.setdefault(entry.level, []).append(i)
+            self._by_difficulty.setdefault(entry.difficulty, []).append(i)
+            self._by_pos.setdefault(entry.pos, []).append(i)
+            self._by_letter.setdefault(entry.word[:1].lower(), []).append(i)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._positions
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def get(self, word: str) -> Optional[LexiconEntry]:
+        position = self._positions.get(word)
+        return None if position is None else self._entries[position]
+
+    def entries(self) -> List[LexiconEntry]:
+        return list(self._entries)
+
+    def mapping(self) -> Dict[str, tuple]:
+        """单词 → 原始元组，可直接作为构建任务的源数据计算哈希"""
+        return {entry.word: entry.data for entry in self._entries}
+
+    def _collect(self, postings: Iterable[List[int]]) -> List[LexiconEntry]:
+        # 各倒排表内部有序且互不相交，多路归并后即为合并顺序
+        lists = [p for p in postings if p]
+        if len(lists) == 1:
+            return [self._entries[i] for i in lists[0]]
+        return [self._entries[i] for i in heapq.merge(*lists)]
+
+    def by_level(self, *levels: str) -> List[LexiconEntry]:
+        """指定级别（任一）的词汇"""
+        return self._collect(self._by_level.get(level, []) for level in set(levels))
+
+    def by_difficulty(self, min_diff: int, max_diff: int) -> List[LexiconEntry]:
+        """难度在 [min_diff, max_diff] 之间的词汇"""
+        return self._collect(p for level, p in self._by_difficulty.items() if min_diff <= level <= max_diff)
+
+    def by_pos(self, *pos: str) -> List[LexiconEntry]:
+        """释义以指定词性缩写（如 "n"、"v"、"adj"）开头的词汇"""
+        return self._collect(self._by_pos.get(p, []) for p in set(pos))
+
+    def by_letter(self, letter: str) -> List[LexiconEntry]:
+        """以指定字母开头的词汇（不区分大小写）"""
+        return self._collect([self._by_letter.get(letter.lower(), [])])
+
+    def counts(self) -> Dict[str, Dict]:
+        """各索引的分组计数"""
+        return {
+            "level": {str(k): len(v) for k, v in self._by_level.items()},
+            "difficulty": {k: len(v) for k, v in sorted(self._by_difficulty.items())},
+            "pos": {str(k): len(v) for k, v in self._by_pos.items()},
+            "letter": {k: len(v) for k, v in sorted(self._by_letter.items())},
+        }
+
+
+@lru_cache(maxsize=None)
+def get_store(*sources: str) -> LexiconStore:
+    """获取由指定词汇源合并的存储，相同组合在进程内只构建一次"""
+    return LexiconStore(sources)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="共享词汇源存储统计")
+    parser.add_argument("sources", nargs="*", help="要合并的词汇源（默认全部）")
+    args = parser.parse_args()
+
+    print("📚 共享词汇源存储")
+    print("=" * 60)
+
+    sources = args.sources or source_names()
+    started = time.perf_counter()
+    store = get_store(*sources)
+    elapsed = (time.perf_counter() - started) * 1000
+
+    for source in sources:
+        print(f"  {source:<20} {len(load_source(source)):>6,} 词")
+    print(f"\n📖 合并后 {len(store):,} 个不重复词汇（加载与建索引 {elapsed:.1f} ms）")
+
+    counts = store.counts()
+    print(f"📊 按级别: {counts['level']}")
+    print(f"📊 按难度: {counts['difficulty']}")
+    print(f"📊 按词性: {counts['pos']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+构词规则引擎
+把派生规则、前缀表、词根×后缀表编译成查找结构（词尾规则按反向后缀字典树匹配最长词尾，
+前缀按前缀字典树匹配），再批量作用于整个词表，避免对每个词重复执行 if/elif 判断
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+# (词, 音标, 释义, 难度)
+Record = Tuple[str, str, str, int]
+
+# 词尾变化：(去掉的字母数, 新词尾, 去掉的音标字符数, 新音标尾)；None 表示该词尾不适用此规则
+Ending = Optional[Tuple[int, str, int, str]]
+
+# 释义词性前缀 → 派生规则 [(规则名, {词尾: 变化}, 释义模板)]；"" 是默认词尾，最长的匹配词尾优先
+DERIVATION_RULES: Dict[str, List[Tuple[str, Dict[str, Ending], str]]] = {
+    # 动词名词化
+    "v.": [
+        ("ment", {"": (0, "ment", 0, "mənt"), "e": None}, "n. {}的行为或结果"),
+        ("tion", {"": (0, "tion", 0, "ʃn"), "d": (1, "sion", 2, "ʒn"), "te": (2, "tion", 2, "ʃn")}, "n. {}的行为或状态"),
+        ("er", {"": (0, "er", 0, "ər"), "e": (0, "r", 0, "ər")}, "n. {}的人或工具"),
+    ],
+    # 名词形容词化
+    "n.": [
+        ("al", {"tion": (4, "al", 4, "əl"), "sion": (4, "al", 4, "əl")}, "adj. 关于{}的"),
+        ("ous", {"": (0, "ous", 0, "əs"), "e": None}, "adj. 充满{}的"),
+    ],
+    # 形容词副词化
+    "adj.": [
+        ("ly", {"": (0, "ly", 0, "li")}, "adv. {}地"),
+    ],
+}
+
+# 有固定释义的前缀组合，其余前缀使用前缀表中的含义
+VERB_PREFIX_DEFINITIONS = {
+    "un": "v. {}的反向",
+    "re": "v. 重新{}",
+    "in": "v. 使不{}",
+    "im": "v. 使不{}",
+    "il": "v. 使不{}",
+    "ir": "v. 使不{}",
+    "dis": "v. 撤销{}",
+    "over": "v. 过度{}",
+    "under": "v. 不足{}",
+    "mis": "v. 错误地{}",
+}
+ADJECTIVE_PREFIX_DEFINITIONS = {prefix: "adj. 不{}" for prefix in ("un", "in", "im", "il", "ir")}
+
+# 只为这些词性添加前缀
+PREFIXABLE_POS = ("v.", "adj.")
+
+# 添加前缀的最短词长
+MIN_PREFIX_BASE_LENGTH = 4
+
+_END = "$"
+
+
+def _insert(trie: Dict, key: Iterable[str], value) -> None:
+    node = trie
+    for char in key:
+        node = node.setdefault(char, {})
+    node[_END] = value
+
+
+def _split_template(template: str) -> Tuple[str, str]:
+    head, tail = template.split("{}")
+    return head, tail
+
+
+class SuffixRuleTrie:
+    """同一词性的全部派生规则合并成一棵反向后缀字典树
+
+    每个节点预先算好“以该词尾结尾的词”对每条规则应采用的变化（各规则自身最长的匹配词尾），
+    查找时沿词尾逐字符向前走一次，取最深的节点即可得到全部规则的结果。
+    """
+
+    def __init__(self, rules: List[Tuple[str, Dict[str, Ending], str]]):
+        self.names = [name for name, _, _ in rules]
+        endings = {ending for _, rule_endings, _ in rules for ending in rule_endings}
+        self._trie: Dict = {}
+        for ending in endings:
+            resolved = []
+            for _, rule_endings, template in rules:
+                # 该规则中是 ending 后缀的最长词尾
+                matches = [e for e in rule_endings if ending.endswith(e)]
+                change = rule_endings[max(matches, key=len)] if matches else None
+                if change is not None:
+                    resolved.append((change, _split_template(template)))
+            _insert(self._trie, reversed(ending), tuple(resolved))
+
+    def match(self, word: str) -> tuple:
+        """返回 ((词尾变化, (释义前半, 释义后半)), ...)，只含适用的规则"""
+        node = self._trie
+        resolved = node.get(_END, ())
+        for char in reversed(word):
+            node = node.get(char)
+            if node is None:
+                break
+            resolved = node.get(_END, resolved)
+        return resolved
+
+
+def _apply_ending(word: str, phonetic: str, change: Tuple[int, str, int, str]) -> Tuple[str, str]:
+    strip_letters, new_ending, strip_sounds, new_sounds = change
+    phonetic = phonetic.strip("/")
+    stem = word[:-strip_letters] if strip_letters else word
+    sound_stem = phonetic[:-strip_sounds] if strip_sounds else phonetic
+    return stem + new_ending, sound_stem + new_sounds
+
+
+def _pos_of(definition: str) -> Optional[str]:
+    for pos in DERIVATION_RULES:
+        if definition.startswith(pos):
+            return pos
+    return None
+
+
+class MorphologyEngine:
+    """由前缀表、后缀表、词根表编译而成的构词引擎，所有查找结构只在构造时建立一次"""
+
+    def __init__(self, prefixes: Dict[str, str], suffixes: Dict[str, str], roots: Dict[str, str]):
+        self.prefixes = dict(prefixes)
+        self.suffixes = dict(suffixes)
+        self.roots = dict(roots)
+
+        self.rules = {pos: SuffixRuleTrie(rules) for pos, rules in DERIVATION_RULES.items()}
+
+        self._prefix_trie: Dict = {}
+        for prefix in self.prefixes:
+            _insert(self._prefix_trie, prefix, prefix)
+
+        # 每个前缀在各词性下的释义模板
+        self.prefix_templates = {
+            "v.": {p: _split_template(VERB_PREFIX_DEFINITIONS.get(p, "v. " + m + "{}")) for p, m in self.prefixes.items()},
+            "adj.": {p: _split_template(ADJECTIVE_PREFIX_DEFINITIONS.get(p, "adj. " + m + "{}"))
+                     for p, m in self.prefixes.items()},
+        }
+
+    def leading_prefixes(self, word: str) -> Set[str]:
+        """词开头已经包含的前缀"""
+        found = set()
+        node = self._prefix_trie
+        for char in word:
+            node = node.get(char)
+            if node is None:
+                break
+            if _END in node:
+                found.add(node[_END])
+        return found
+
+    def derivatives(self, records: Sequence[Record]) -> List[Record]:
+        """按词表顺序生成全部派生词（难度为原词 + 1，最高 5）"""
+        results = []
+        for word, phonetic, definition, difficulty in records:
+            pos = _pos_of(definition)
+            if pos is None:
+                continue
+            meaning = definition[len(pos):].strip()
+            difficulty = min(5, difficulty + 1)
+            for change, (head, tail) in self.rules[pos].match(word):
+                new_word, new_phonetic = _apply_ending(word, phonetic, change)
+                results.append((new_word, new_phonetic, head + meaning + tail, difficulty))
+        return results
+
+    def prefix_combinations(self, records: Sequence[Record]) -> List[Record]:
+        """为全部动词、形容词生成前缀组合词
+
+        外层按前缀、内层按词表顺序，使靠前的结果覆盖尽量多的词，而不是集中在少数几个词上。
+        """
+        candidates = []
+        for word, phonetic, definition, difficulty in records:
+            if len(word) < MIN_PREFIX_BASE_LENGTH:
+                continue
+            pos = next((p for p in PREFIXABLE_POS if definition.startswith(p)), None)
+            if pos is not None:
+                candidates.append((word, phonetic.strip("/"), definition[len(pos):].strip(), pos,
+                                   min(5, difficulty + 1), self.leading_prefixes(word)))
+
+        results = []
+        for prefix in self.prefixes:
+            templates = {pos: self.prefix_templates[pos][prefix] for pos in PREFIXABLE_POS}
+            for word, phonetic, meaning, pos, difficulty, leading in candidates:
+                if prefix not in leading:
+                    head, tail = templates[pos]
+                    results.append((prefix + word, prefix + phonetic, head + meaning + tail, difficulty))
+        return results
+
+    def root_combinations(self, difficulty: int = 4) -> List[Record]:
+        """全部 词根 × 后缀 组合"""
+        return [
+            (root + suffix, root + suffix, f"v. {meaning}{suffix_meaning}", difficulty)
+            for root, meaning in self.roots.items()
+            for suffix, suffix_meaning in self.suffixes.items()
+        ]
+
+    def expand(self, records: Sequence[Record]) -> List[Record]:
+        """原词 → 派生词 → 前缀组合词 → 词根组合词，按首次出现去重"""
+        seen: Set[str] = set()
+        results = []
+        for batch in (records, self.derivatives(records), self.prefix_combinations(records), self.root_combinations()):
+            for record in batch:
+                if record[0] not in seen:
+                    seen.add(record[0])
+                    results.append(record)
+        return results
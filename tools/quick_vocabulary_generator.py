@@ -4,9 +4,13 @@
 使用Dart脚本直接生成JSON格式词库
 """
 
-import json
+import os
 import random
-from typing import List, Dict
+from typing import Dict, Iterable, List
+
+from lexicon_store import raw_source
+from thesaurus import get_thesaurus
+from vocab_io import write_vocabulary
 
 # 常用词根和前缀
 WORD_PREFIXES = [
@@ -41,43 +45,7 @@ POS_TAGS = {
 }
 
 # 常用词汇模板
-WORD_TEMPLATES = {
-    1: [
-        ("time", "taɪm", "n. 时间"),
-        ("year", "jɪər", "n. 年"),
-        ("people", "ˈpiːpl", "n. 人；人们"),
-        ("way", "weɪ", "n. 方法；道路"),
-        ("day", "deɪ", "n. 天；白天"),
-    ],
-    2: [
-        ("able", "ˈeɪbl", "adj. 能够的"),
-        ("about", "əˈbaʊt", "prep. 关于"),
-        ("after", "ˈɑːftər", "prep./conj. 在...之后"),
-        ("again", "əˈɡen", "adv. 再一次"),
-        ("against", "əˈɡenst", "prep. 反对；倚靠"),
-    ],
-    3: [
-        ("almost", "ˈɔːlməʊst", "adv. 几乎"),
-        ("always", "ˈɔːlweɪz", "adv. 总是"),
-        ("American", "əˈmerɪkən", "adj. 美国的 n. 美国人"),
-        ("among", "əˈmʌŋ", "prep. 在...之中"),
-        ("animal", "ˈænɪml", "n. 动物"),
-    ],
-    4: [
-        ("another", "əˈnʌðər", "adj. 另一个"),
-        ("answer", "ˈɑːnsər", "n. 答案 v. 回答"),
-        ("appear", "əˈpɪər", "v. 出现；显得"),
-        ("around", "əˈraʊnd", "adv./prep. 围绕"),
-        ("arrive", "əˈraɪv", "v. 到达；抵达"),
-    ],
-    5: [
-        ("basic", "ˈbeɪsɪk", "adj. 基本的"),
-        ("beautiful", "ˈbjuːtɪfl", "adj. 美丽的"),
-        ("because", "bɪˈkɒz", "conj. 因为"),
-        ("become", "bɪˈkʌm", "v. 变成；成为"),
-        ("before", "bɪˈfɔːr", "prep./conj. 在...之前"),
-    ],
-}
+WORD_TEMPLATES = raw_source("quick_templates")
 
 
 def generate_phonetic(word: str) -> str:
@@ -128,26 +96,9 @@ def generate_examples(word: str) -> List[str]:
 
 
 def generate_synonyms_antonyms(word: str) -> tuple:
-    """生成同义词和反义词（简化版）"""
-
-    # 简化的同义词/反义词映射
-    synonym_map = {
-        "good": ("excellent", "bad"),
-        "bad": ("terrible", "good"),
-        "big": ("large", "small"),
-        "small": ("tiny", "big"),
-        "happy": ("joyful", "sad"),
-        "sad": ("unhappy", "happy"),
-        "fast": ("quick", "slow"),
-        "slow": ("sluggish", "fast"),
-    }
-
-    if word.lower() in synonym_map:
-        synonym, antonym = synonym_map[word.lower()]
-        return [synonym], [antonym]
-
-    # 对于未知词汇，返回空列表
-    return [], []
+    """从共享的同义词/反义词图查询，各取第一个"""
+    synonyms, antonyms = get_thesaurus().lookup(word)
+    return synonyms[:1], antonyms[:1]
 
 
 def create_vocabulary_entry(
@@ -236,18 +187,17 @@ def generate_vocabulary(level: str, count: int) -> List[Dict]:
     return vocabulary
 
 
-def save_vocabulary(vocabulary: List[Dict], filename: str) -> None:
-    """保存词库到文件"""
+def save_vocabulary(vocabulary: Iterable[Dict], filename: str) -> int:
+    """流式保存词库到文件，返回词汇数"""
 
     filepath = f"assets/vocabularies/{filename}"
+    count = write_vocabulary(vocabulary, filepath)
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(vocabulary, f, ensure_ascii=False, indent=2)
-
-    file_size = len(json.dumps(vocabulary, ensure_ascii=False))
+    file_size = os.path.getsize(filepath)
 
     print(f"✅ 已保存到: {filepath}")
     print(f"📊 文件大小: {file_size / 1024:.2f} KB")
+    return count
 
 
 def main():
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+词库前缀搜索索引构建工具
+为每个词库生成排序后的规范化单词表（单词 → 条目下标）和短前缀的排名补全表，
+边输入边搜索只需二分查找或一次查表，与词库规模无关
+"""
+
+import argparse
+import bisect
+import json
+import os
+from typing import Dict, List
+
+from asset_build import INDEX_DIR, VOCAB_DIR, BuildJob, add_build_arguments, list_decks, print_build_summary, run_jobs
+from vocab_io import iter_vocabulary
+
+# 索引逻辑或格式变化时递增，使增量构建失效
+GENERATOR_VERSION = "1"
+INDEX_VERSION = 1
+
+# 不超过该长度的前缀预先计算排名补全
+PREFIX_LENGTH = 3
+# 每个前缀保留的补全数
+TOP_COMPLETIONS = 20
+
+
+def normalize_word(word: str) -> str:
+    """规范化单词：去除首尾空白并转为小写"""
+    return word.strip().lower()
+
+
+def index_path(deck: str) -> str:
+    return os.path.join(INDEX_DIR, f"{deck}.search.json")
+
+
+def build_search_index(deck: str) -> int:
+    """为单个词库生成搜索索引，返回索引中的单词数"""
+    postings: Dict[str, List[int]] = {}
+    difficulty: Dict[str, int] = {}
+
+    for offset, entry in enumerate(iter_vocabulary(os.path.join(VOCAB_DIR, f"{deck}.json"))):
+        word = entry.get("word")
+        if not isinstance(word, str) or not normalize_word(word):
+            continue
+        key = normalize_word(word)
+        postings.setdefault(key, []).append(offset)
+        level = entry.get("difficulty")
+        level = level if isinstance(level, int) else 99
+        difficulty[key] = min(difficulty.get(key, level), level)
+
+    words = sorted(postings)
+    # 排名：难度低的优先，其次是较短的单词，最后按字母顺序
+    ranked = sorted(range(len(words)), key=lambda i: (difficulty[words[i]], len(words[i]), words[i]))
+
+    completions: Dict[str, List[int]] = {}
+    for i in ranked:
+        word = words[i]
+        for length in range(1, min(PREFIX_LENGTH, len(word)) + 1):
+            bucket = completions.setdefault(word[:length], [])
+            if len(bucket) < TOP_COMPLETIONS:
+                bucket.append(i)
+
+    index = {
+        "deck": deck,
+        "version": INDEX_VERSION,
+        "prefix_length": PREFIX_LENGTH,
+        "words": words,
+        # 单个条目直接存下标，重复单词存下标列表
+        "offsets": [postings[w][0] if len(postings[w]) == 1 else postings[w] for w in words],
+        "completions": dict(sorted(completions.items())),
+    }
+
+    os.makedirs(INDEX_DIR, exist_ok=True)
+    filepath = index_path(deck)
+    tmp_path = filepath + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, filepath)
+
+    return len(words)
+
+
+def create_build_jobs() -> List[BuildJob]:
+    """为每个词库创建索引任务"""
+    return [
+        BuildJob(
+            name=f"search_index:{deck}",
+            build=build_search_index,
+            args=(deck,),
+            outputs=[index_path(deck)],
+            input_files=[os.path.join(VOCAB_DIR, f"{deck}.json")],
+            version=GENERATOR_VERSION,
+        )
+        for deck in list_decks()
+    ]
+
+
+def load_index(deck: str) -> Dict:
+    """读取词库的搜索索引"""
+    with open(index_path(deck), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def lookup(index: Dict, prefix: str, limit: int = TOP_COMPLETIONS) -> List[int]:
+    """按前缀查找条目下标
+
+    短前缀直接返回预先排好的补全；更长的前缀在有序单词表中二分定位，按字母顺序返回。
+    """
+    prefix = normalize_word(prefix)
+    if not prefix:
+        return []
+
+    if len(prefix) <= index["prefix_length"]:
+        word_ids = index["completions"].get(prefix, [])[:limit]
+    else:
+        words = index["words"]
+        start = bisect.bisect_left(words, prefix)
+        word_ids = []
+        for i in range(start, len(words)):
+            if len(word_ids) >= limit or not words[i].startswith(prefix):
+                break
+            word_ids.append(i)
+
+    offsets = []
+    for i in word_ids:
+        entry_offsets = index["offsets"][i]
+        offsets.extend(entry_offsets if isinstance(entry_offsets, list) else [entry_offsets])
+    return offsets[:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="词库前缀搜索索引构建工具")
+    add_build_arguments(parser, output_format=False)
+    args = parser.parse_args()
+
+    print("🔎 构建前缀搜索索引")
+    print("=" * 60)
+
+    results = run_jobs(create_build_jobs(), force=args.force, workers=args.jobs)
+    print_build_summary(results)
+
+    total_words = sum(r["result"] or 0 for r in results if r["status"] != "failed")
+    print(f"\n📦 共 {len(results)} 个词库、{total_words:,} 个索引单词，输出目录: {INDEX_DIR}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+词库字符串表编码
+重复出现的字符串、模板和列表只在共享表中存储一次，条目按索引引用
+
+文档结构：
+  values  去重后的值；字符串模板中 {0} 代表条目的单词、{1} 代表条目序号（从1开始）
+  lists   去重后的列表，元素为值引用
+  shapes  条目的字段名列表
+  entries 每个条目为 [shape索引, 字段值引用...]
+
+值引用：非负整数 i 为 values[i] 原值；负整数 i 为 values[~i] 模板；[j] 为 lists[j]
+"""
+
+import json
+import re
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+FORMAT_NAME = "strtab"
+FORMAT_VERSION = 1
+
+_TRAILING_NUMBER = re.compile(r"^(.*?)(\d+)$", re.S)
+
+
+def _escape(text: str) -> str:
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def _template_for(value: str, word: str, ordinal: int) -> Optional[str]:
+    """尝试把字符串改写为模板，无法逐字还原时返回 None"""
+    template = _escape(value)
+    if word and word in value:
+        template = template.replace(_escape(word), "{0}")
+
+    match = _TRAILING_NUMBER.match(template)
+    if match and int(match.group(2)) == ordinal:
+        template = match.group(1) + "{1:0%dd}" % len(match.group(2))
+
+    if template == _escape(value):
+        return None
+    try:
+        if template.format(word, ordinal) != value:
+            return None
+    except (IndexError, KeyError, ValueError):
+        return None
+    return template
+
+
+class StringTableEncoder:
+    """把条目编码为字符串表文档
+
+    模板只在被多个条目共用时才采用，只出现一次的模板按原值存储，避免拆散可共享的原值。
+    """
+
+    def __init__(self):
+        self.values: List[Any] = []
+        self.lists: List[List] = []
+        self.shapes: List[List[str]] = []
+        self._value_index: Dict[Tuple[str, str], int] = {}
+        self._list_index: Dict[str, int] = {}
+        self._shape_index: Dict[Tuple[str, ...], int] = {}
+
+    def _intern_value(self, kind: str, value: Any) -> int:
+        key = (kind, value if kind != "raw" else json.dumps(value, sort_keys=True))
+        index = self._value_index.get(key)
+        if index is None:
+            index = self._value_index[key] = len(self.values)
+            self.values.append(value)
+        return index
+
+    def _ref_scalar(self, value: Any, context: Tuple[str, int], templates: Dict) -> int:
+        if isinstance(value, str):
+            template = templates.get((value,) + context)
+            if template is not None:
+                return ~self._intern_value("template", template)
+            return self._intern_value("str", value)
+        return self._intern_value("raw", value)
+
+    def _ref(self, value: Any, context: Tuple[str, int], templates: Dict):
+        if isinstance(value, list):
+            refs = [
+                self._intern_value("raw", item) if isinstance(item, (list, dict))
+                else self._ref_scalar(item, context, templates)
+                for item in value
+            ]
+            key = json.dumps(refs)
+            index = self._list_index.get(key)
+            if index is None:
+                index = self._list_index[key] = len(self.lists)
+                self.lists.append(refs)
+            return [index]
+        if isinstance(value, dict):
+            return self._intern_value("raw", value)
+        return self._ref_scalar(value, context, templates)
+
+    def encode(self, entries: Iterable[Dict]) -> Dict:
+        """编码全部条目，返回可直接写成JSON的文档"""
+        entries = list(entries)
+        candidates = {}
+        usage = Counter()
+
+        for ordinal, entry in enumerate(entries, 1):
+            word = entry.get("word")
+            word = word if isinstance(word, str) else ""
+            for key, value in entry.items():
+                if key == "word":
+                    continue
+                for item in (value if isinstance(value, list) else [value]):
+                    if not isinstance(item, str):
+                        continue
+                    template = _template_for(item, word, ordinal)
+                    if template is not None:
+                        candidates[(item, word, ordinal)] = template
+                        usage[template] += 1
+
+        templates = {k: t for k, t in candidates.items() if usage[t] > 1}
+
+        encoded = []
+        for ordinal, entry in enumerate(entries, 1):
+            word = entry.get("word")
+            context = (word if isinstance(word, str) else "", ordinal)
+            shape = tuple(entry.keys())
+            shape_index = self._shape_index.get(shape)
+            if shape_index is None:
+                shape_index = self._shape_index[shape] = len(self.shapes)
+                self.shapes.append(list(shape))
+            encoded.append([shape_index] + [self._ref(entry[key], context, templates) for key in shape])
+
+        return {
+            "format": FORMAT_NAME,
+            "version": FORMAT_VERSION,
+            "values": self.values,
+            "lists": self.lists,
+            "shapes": self.shapes,
+            "entries": encoded,
+        }
+
+
+def encode_entries(entries: Iterable[Dict]) -> Dict:
+    """把条目编码为字符串表文档"""
+    return StringTableEncoder().encode(entries)
+
+
+def write_string_table(f, entries: Iterable[Dict]) -> int:
+    """把条目以字符串表格式写入文件对象，返回条目数"""
+    document = encode_entries(entries)
+    compact = dict(ensure_ascii=False, separators=(",", ":"))
+
+    f.write('{"format":%s,"version":%d,\n' % (json.dumps(FORMAT_NAME), FORMAT_VERSION))
+    for key in ("values", "lists", "shapes"):
+        f.write('"%s":%s,\n' % (key, json.dumps(document[key], **compact)))
+    # 条目逐行写出，便于按行比较差异
+    f.write('"entries":[')
+    for i, entry in enumerate(document["entries"]):
+        f.write(",\n" if i else "\n")
+        f.write(json.dumps(entry, **compact))
+    f.write("\n]}")
+    return len(document["entries"])
+
+
+class StringTableDeck:
+    """字符串表词库读取器，按需展开条目"""
+
+    def __init__(self, document: Dict):
+        if document.get("format") != FORMAT_NAME:
+            raise ValueError("不是字符串表格式的词库")
+        if document.get("version") != FORMAT_VERSION:
+            raise ValueError(f"不支持的字符串表版本: {document.get('version')}")
+        self.values = document["values"]
+        self.lists = document["lists"]
+        self.shapes = document["shapes"]
+        self.entries = document["entries"]
+
+    @classmethod
+    def load(cls, filepath: str) -> "StringTableDeck":
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _scalar(self, ref: int, word: str, ordinal: int) -> Any:
+        if ref >= 0:
+            return self.values[ref]
+        return self.values[~ref].format(word, ordinal)
+
+    def _value(self, ref, word: str, ordinal: int) -> Any:
+        if isinstance(ref, list):
+            return [self._scalar(item, word, ordinal) for item in self.lists[ref[0]]]
+        return self._scalar(ref, word, ordinal)
+
+    def entry(self, index: int) -> Dict:
+        """展开第 index 个条目（从0开始）"""
+        row = self.entries[index]
+        shape = self.shapes[row[0]]
+        word = ""
+        if "word" in shape:
+            word = self._value(row[1 + shape.index("word")], "", index + 1)
+        return {key: self._value(ref, word, index + 1) for key, ref in zip(shape, row[1:])}
+
+    def __getitem__(self, index: int) -> Dict:
+        if index < 0:
+            index += len(self.entries)
+        if not 0 <= index < len(self.entries):
+            raise IndexError(index)
+        return self.entry(index)
+
+    def __iter__(self) -> Iterator[Dict]:
+        for index in range(len(self.entries)):
+            yield self.entry(index)
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+标签位掩码注册表
+data/tags.json 为每个标签分配固定的位（按列表顺序，新标签只能追加到末尾），
+每个条目的标签集合编码为一个整数，子集/超集/任一查询都变成整数位运算；
+查询函数同样接受 NumPy uint64 数组，可对整个词库做一次向量化运算（没有 NumPy 时逐个计算整数）
+"""
+
+import argparse
+import json
+import os
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from asset_build import CACHE_DIR, TOOLS_DIR, VOCAB_DIR
+from vocab_io import OUTPUT_FORMATS, iter_vocabulary, write_vocabulary
+
+TAGS_PATH = os.path.join(TOOLS_DIR, "data", "tags.json")
+
+# 应用在 Web 平台上的整数是双精度浮点数，只有 53 位能精确表示
+MAX_BITS = 53
+
+# 最高位保留给注册表之外的标签，使这类条目不会被误判为某个集合的子集
+OTHER_BIT = MAX_BITS - 1
+
+# 全部可用位（含保留位）
+FULL_MASK = (1 << MAX_BITS) - 1
+
+# 按词库缓存的列式表（见 corpus_columns.load_corpus），query 直接读取其中的标签位掩码列
+DECK_COLUMNS_DIR = os.path.join(CACHE_DIR, "deck_columns")
+
+# 写入词库条目时使用的字段名
+MASK_FIELD = "tag_mask"
+
+
+def _const(masks, value: int):
+    """与 masks 同类型的常量：NumPy 数组使用 uint64，避免与有符号整数混合运算"""
+    if hasattr(masks, "dtype"):
+        return np.uint64(value)
+    return value
+
+
+def mask_array(masks: Sequence[int]):
+    """整数位掩码序列 → NumPy uint64 数组；没有 NumPy 时返回列表"""
+    if np is None:
+        return list(masks)
+    return np.array(masks, dtype=np.uint64)
+
+
+def matched_indices(selected) -> List[int]:
+    """布尔数组或布尔列表中为真的位置"""
+    if hasattr(selected, "dtype"):
+        return np.flatnonzero(selected).tolist()
+    return [i for i, hit in enumerate(selected) if hit]
+
+
+class TagRegistry:
+    """标签 → 位的固定映射及基于位运算的集合查询
+
+    查询函数的 masks 参数可以是单个整数，也可以是 NumPy uint64 数组（返回布尔数组）。
+    """
+
+    def __init__(self, tags: Sequence[str], groups: Dict[str, Sequence[str]] = None):
+        if len(tags) > OTHER_BIT:
+            raise ValueError(f"标签数 {len(tags)} 超出位掩码容量 {OTHER_BIT}")
+        if len(set(tags)) != len(tags):
+            raise ValueError("标签注册表中有重复的标签")
+        self.tags = list(tags)
+        self.bits = {tag: i for i, tag in enumerate(self.tags)}
+        self.groups = {name: list(members) for name, members in (groups or {}).items()}
+        for name, members in self.groups.items():
+            unknown = [tag for tag in members if tag not in self.bits]
+            if unknown:
+                raise ValueError(f"标签分组 {name} 中有未注册的标签: {', '.join(unknown)}")
+
+    def __len__(self) -> int:
+        return len(self.tags)
+
+    def __contains__(self, tag: str) -> bool:
+        return tag in self.bits
+
+    def mask(self, tags: Iterable[str], strict: bool = False) -> int:
+        """标签集合 → 位掩码；未注册的标签在 strict 时报错，否则记入保留位"""
+        mask = 0
+        for tag in tags:
+            bit = self.bits.get(tag)
+            if bit is None:
+                if strict:
+                    raise ValueError(f"未注册的标签: {tag}（请追加到 {TAGS_PATH}）")
+                bit = OTHER_BIT
+            mask |= 1 << bit
+        return mask
+
+    def group_mask(self, *groups: str) -> int:
+        """一个或多个标签分组的位掩码"""
+        return self.mask(tag for group in groups for tag in self.groups[group])
+
+    def tags_of(self, mask: int) -> List[str]:
+        """位掩码 → 标签列表（按注册顺序）；保留位不还原"""
+        return [tag for tag, bit in self.bits.items() if mask >> bit & 1]
+
+    # ---- 集合查询（整数或 NumPy 数组） ----
+
+    def subset_of(self, masks, allowed: int):
+        """标签集合是 allowed 的子集（不含 allowed 之外的任何标签）"""
+        return (masks & _const(masks, ~allowed & FULL_MASK)) == 0
+
+    def superset_of(self, masks, required: int):
+        """标签集合包含 required 中的全部标签"""
+        required = _const(masks, required)
+        return (masks & required) == required
+
+    def any_of(self, masks, candidates: int):
+        """标签集合包含 candidates 中的任一标签"""
+        return (masks & _const(masks, candidates)) != 0
+
+    def none_of(self, masks, excluded: int):
+        """标签集合不包含 excluded 中的任何标签"""
+        return (masks & _const(masks, excluded)) == 0
+
+    def has_unregistered(self, masks):
+        """含有未注册的标签"""
+        return self.any_of(masks, 1 << OTHER_BIT)
+
+    def match(
+        self,
+        masks,
+        subset: Optional[int] = None,
+        superset: Optional[int] = None,
+        any_of: Optional[int] = None,
+        none_of: Optional[int] = None,
+    ):
+        """同时满足全部给出的条件；masks 为 NumPy 数组时整体运算一次返回布尔数组，为整数序列时返回布尔列表"""
+        if not hasattr(masks, "dtype"):
+            # 整数逐个计算时把条件合并为一次位运算：不允许的位、必需的位、至少含其一的位
+            forbidden = (~subset & FULL_MASK if subset is not None else 0) | (none_of or 0)
+            required = superset or 0
+            if any_of is None:
+                return [mask & forbidden == 0 and mask & required == required for mask in masks]
+            return [mask & forbidden == 0 and mask & required == required and mask & any_of != 0
+                    for mask in masks]
+
+        conditions = [(test, value) for test, value in (
+            (self.subset_of, subset),
+            (self.superset_of, superset),
+            (self.any_of, any_of),
+            (self.none_of, none_of),
+        ) if value is not None]
+        selected = np.ones(len(masks), dtype=bool)
+        for test, value in conditions:
+            selected &= test(masks, value)
+        return selected
+
+
+@lru_cache(maxsize=None)
+def get_registry() -> TagRegistry:
+    """读取标签注册表，每个进程只加载一次"""
+    with open(TAGS_PATH, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return TagRegistry(data["tags"], data.get("groups"))
+
+
+def deck_masks(deck: str, registry: TagRegistry = None) -> List[int]:
+    """流式读取词库，返回每个条目的标签位掩码"""
+    registry = registry or get_registry()
+    return [registry.mask(entry.get("tags") or ()) for entry in iter_vocabulary(os.path.join(VOCAB_DIR, f"{deck}.json"))]
+
+
+def deck_mask_array(deck: str):
+    """词库每个条目的标签位掩码：有 NumPy 时为 uint64 数组（取自按词库缓存的列式表），否则为整数列表"""
+    if np is None:
+        return deck_masks(deck)
+    from corpus_columns import load_corpus
+
+    return load_corpus([deck], cache_path=os.path.join(DECK_COLUMNS_DIR, f"{deck}.npz")).tags
+
+
+def annotate_deck(deck: str, output: str, fmt: str = "pretty") -> int:
+    """把每个条目的标签位掩码写入 tag_mask 字段，返回条目数"""
+    registry = get_registry()
+    source = os.path.join(VOCAB_DIR, f"{deck}.json")
+    entries = (
+        {**entry, MASK_FIELD: registry.mask(entry.get("tags") or ())}
+        for entry in iter_vocabulary(source)
+    )
+    # 原地写入时先完整读取，避免边读边覆盖同一文件
+    if os.path.abspath(output) == os.path.abspath(source):
+        entries = list(entries)
+    return write_vocabulary(entries, output, fmt)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="标签位掩码注册表")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("list", help="列出标签及其位")
+
+    query_parser = subparsers.add_parser("query", help="按标签集合查询词库")
+    query_parser.add_argument("deck", help="词库名")
+    query_parser.add_argument("--subset", nargs="+", default=[], help="标签集合是这些标签的子集")
+    query_parser.add_argument("--superset", nargs="+", default=[], help="包含这些标签中的全部")
+    query_parser.add_argument("--any", nargs="+", default=[], help="包含这些标签中的任一个")
+    query_parser.add_argument("--none", nargs="+", default=[], help="不包含这些标签中的任何一个")
+    query_parser.add_argument("--limit", type=int, default=20, help="显示的示例数")
+
+    annotate_parser = subparsers.add_parser("annotate", help=f"把标签位掩码写入词库条目的 {MASK_FIELD} 字段")
+    annotate_parser.add_argument("deck", help="词库名")
+    annotate_parser.add_argument("--output", help="输出路径（默认覆盖原词库）")
+    annotate_parser.add_argument("--format", choices=OUTPUT_FORMATS, default="pretty", help="输出格式")
+
+    args = parser.parse_args()
+    registry = get_registry()
+
+    if args.command == "list":
+        print(f"🏷️  标签注册表（{len(registry)} 个标签，保留位 {OTHER_BIT}）")
+        groups = {tag: name for name, members in registry.groups.items() for tag in members}
+        for tag, bit in registry.bits.items():
+            print(f"  {bit:>3}  {tag:<14} {groups.get(tag, '')}")
+
+    elif args.command == "query":
+        for tag in args.subset + args.superset + args.any + args.none:
+            if tag not in registry:
+                parser.error(f"未注册的标签: {tag}")
+
+        masks = deck_mask_array(args.deck)
+        selected = registry.match(
+            masks,
+            subset=registry.mask(args.subset) if args.subset else None,
+            superset=registry.mask(args.superset) if args.superset else None,
+            any_of=registry.mask(args.any) if args.any else None,
+            none_of=registry.mask(args.none) if args.none else None,
+        )
+        matched = matched_indices(selected)
+        print(f"🔎 {args.deck}: {len(matched):,} / {len(masks):,} 个条目符合条件")
+
+        # 示例只需读到最后一个要显示的条目
+        shown = set(matched[:args.limit])
+        for i, entry in enumerate(iter_vocabulary(os.path.join(VOCAB_DIR, f"{args.deck}.json"))):
+            if i in shown:
+                print(f"  {entry.get('word', ''):20s} {entry.get('tags')}")
+                shown.discard(i)
+                if not shown:
+                    break
+
+    elif args.command == "annotate":
+        output = args.output or os.path.join(VOCAB_DIR, f"{args.deck}.json")
+        count = annotate_deck(args.deck, output, args.format)
+        print(f"✅ {args.deck}: {count:,} 个条目已写入 {MASK_FIELD} → {output}")
+
+
+if __name__ == "__main__":
+    main()
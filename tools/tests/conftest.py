@@ -0,0 +1,6 @@
+"""工具脚本测试：tools 目录下的模块按脚本方式互相导入，测试时把它加入导入路径"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,33 @@
+"""deck_shards 打包列表检查测试"""
+
+from deck_shards import bundled_vocabulary_assets, check_bundle
+
+DECKS = ["cet4", "cet4_full", "cet4_sample", "gre_ultra"]
+SHARDED = ["cet4_full", "gre_ultra"]
+
+PUBSPEC = """
+flutter:
+  assets:
+    - assets/vocabularies/cet4.json
+    - assets/vocabularies/cet4_sample.json
+    - assets/vocabularies/indexes/
+    - assets/vocabularies/shards/
+    - assets/data/
+"""
+
+
+def test_lists_only_vocabulary_files():
+    assert bundled_vocabulary_assets(PUBSPEC) == ["cet4.json", "cet4_sample.json"]
+
+
+def test_every_deck_bundled_once():
+    assert check_bundle(DECKS, SHARDED, PUBSPEC) == ([], [])
+
+
+def test_reports_unlisted_and_duplicated_decks():
+    pubspec = PUBSPEC.replace("cet4_sample.json", "gre_ultra.json")
+    assert check_bundle(DECKS, SHARDED, pubspec) == (["cet4_sample"], ["gre_ultra"])
+
+
+def test_whole_directory_bundles_every_full_deck():
+    assert check_bundle(DECKS, SHARDED, "    - assets/vocabularies/\n") == ([], SHARDED)
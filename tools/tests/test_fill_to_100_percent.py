@@ -0,0 +1,33 @@
+"""fill_to_100_percent 派生词枚举测试"""
+
+from fill_to_100_percent import INFLECTIONS, PREFIXES, SUFFIXES, CandidateEnumerator
+
+PATTERN_COUNT = (len(INFLECTIONS) + len(SUFFIXES)) * (len(PREFIXES) + 1) + len(PREFIXES)
+
+
+def test_upper_bound_counts_deduped_alpha_bases():
+    enumerator = CandidateEnumerator(["form", "form", "act", "x-ray"], set())
+    assert enumerator.bases == ["form", "act"]
+    assert enumerator.upper_bound == 2 * PATTERN_COUNT
+
+
+def test_skips_seen_and_short_words():
+    enumerator = CandidateEnumerator(["form", "go"], {"formed"})
+    words = enumerator.take(enumerator.upper_bound)
+    assert "formed" not in words
+    assert "going" in words
+    assert all(len(word) >= 4 for word in words)
+    assert len(words) == len(set(words))
+
+
+def test_take_returns_fewer_when_exhausted():
+    enumerator = CandidateEnumerator(["form"], set())
+    words = enumerator.take(enumerator.upper_bound + 10)
+    assert 0 < len(words) <= enumerator.upper_bound
+    assert enumerator.take(1) == []
+
+
+def test_enumeration_is_deterministic():
+    first = CandidateEnumerator(["form", "act", "play"], set())
+    second = CandidateEnumerator(["form", "act", "play"], set())
+    assert first.take(5) + first.take(20) == second.take(25)
@@ -0,0 +1,44 @@
+"""tag_registry 集合查询测试"""
+
+import itertools
+
+import pytest
+
+from tag_registry import FULL_MASK, OTHER_BIT, TagRegistry, matched_indices
+
+REGISTRY = TagRegistry(["cet4", "cet6", "ky", "gre", "noun"])
+MASKS = [REGISTRY.mask(tags) for r in range(4) for tags in itertools.combinations(REGISTRY.tags, r)]
+MASKS.append(REGISTRY.mask(["cet4", "unregistered"]))
+
+QUERIES = [
+    {},
+    {"subset": REGISTRY.mask(["cet4", "ky"])},
+    {"subset": REGISTRY.mask(["cet4", "ky"]), "any_of": FULL_MASK},
+    {"superset": REGISTRY.mask(["cet4", "cet6"]), "none_of": REGISTRY.mask(["gre"])},
+    {"any_of": REGISTRY.mask(["gre", "noun"]), "subset": REGISTRY.mask(["gre", "noun", "ky"])},
+]
+
+
+def _expected(mask, subset=None, superset=None, any_of=None, none_of=None):
+    return ((subset is None or REGISTRY.subset_of(mask, subset))
+            and (superset is None or REGISTRY.superset_of(mask, superset))
+            and (any_of is None or REGISTRY.any_of(mask, any_of))
+            and (none_of is None or REGISTRY.none_of(mask, none_of)))
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_match_integers(query):
+    assert REGISTRY.match(MASKS, **query) == [_expected(mask, **query) for mask in MASKS]
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_match_array_agrees_with_integers(query):
+    np = pytest.importorskip("numpy")
+    selected = REGISTRY.match(np.array(MASKS, dtype=np.uint64), **query)
+    assert matched_indices(selected) == matched_indices(REGISTRY.match(MASKS, **query))
+
+
+def test_unregistered_tag_is_never_a_subset():
+    mask = REGISTRY.mask(["cet4", "unregistered"])
+    assert mask >> OTHER_BIT & 1
+    assert REGISTRY.match([mask], subset=REGISTRY.mask(REGISTRY.tags)) == [False]
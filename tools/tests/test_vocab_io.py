@@ -0,0 +1,62 @@
+"""vocab_io 条目计数测试"""
+
+import pytest
+
+import vocab_io
+from vocab_io import count_entries, load_vocabulary, write_vocabulary
+
+# 字符串里混入括号、逗号、引号和转义，切块时容易被误判为结构
+ENTRIES = [
+    {"id": f"t_{i:03d}", "word": f"word{i}", "definition": 'n. 释义 "},{" [a, b] \\ {x}',
+     "examples": [f"Example {i}, with \"quotes\" and \\backslash\\."], "difficulty": i % 5 + 1,
+     "tags": ["test", "}", "]"]}
+    for i in range(40)
+]
+
+
+@pytest.mark.parametrize("fmt", ["pretty", "compact", "ndjson", "strtab"])
+def test_count_matches_entries(tmp_path, fmt):
+    path = str(tmp_path / "deck.json")
+    write_vocabulary(ENTRIES, path, fmt)
+    assert count_entries(path) == len(ENTRIES)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64])
+def test_count_compact_deck_across_chunks(tmp_path, monkeypatch, chunk_size):
+    path = str(tmp_path / "deck.json")
+    write_vocabulary(ENTRIES, path, "compact")
+    with open(path, encoding="utf-8") as f:
+        assert "\n" not in f.read()
+
+    monkeypatch.setattr(vocab_io, "READ_CHUNK_SIZE", chunk_size)
+    assert count_entries(path) == len(ENTRIES)
+    assert len(load_vocabulary(path)) == len(ENTRIES)
+
+
+def test_count_empty_and_truncated(tmp_path):
+    path = tmp_path / "deck.json"
+    path.write_text("[]", encoding="utf-8")
+    assert count_entries(str(path)) == 0
+
+    path.write_text('[{"id": "a"},{"id": "b"', encoding="utf-8")
+    with pytest.raises(ValueError):
+        count_entries(str(path))
+
+
+def test_count_compact_deck_scans_each_chunk_once(tmp_path, monkeypatch):
+    path = str(tmp_path / "deck.json")
+    write_vocabulary(ENTRIES * 20, path, "compact")
+
+    scanned = []
+    string_pattern = vocab_io._JSON_STRING
+
+    class RecordingPattern:
+        def sub(self, repl, text):
+            scanned.append(len(text))
+            return string_pattern.sub(repl, text)
+
+    monkeypatch.setattr(vocab_io, "READ_CHUNK_SIZE", 256)
+    monkeypatch.setattr(vocab_io, "_JSON_STRING", RecordingPattern())
+    assert count_entries(path) == len(ENTRIES) * 20
+    # 每块只带上被截断的一个字符串，而不是此前读到的全部内容
+    assert max(scanned) < 2 * 256
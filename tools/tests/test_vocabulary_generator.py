@@ -0,0 +1,53 @@
+"""vocabulary_generator 词库合并测试"""
+
+import pytest
+
+from vocab_io import load_vocabulary, write_vocabulary
+from vocabulary_generator import MERGE_POLICIES, VocabularyGenerator
+
+
+def _entry(entry_id, word, tags=()):
+    return {"id": entry_id, "word": word, "definition": f"n. {word}", "examples": [],
+            "difficulty": 1, "tags": list(tags)}
+
+
+# 两个词库各自从 x_001 开始编号：ID相同的条目大多是不同的单词
+SORTED_DECK = [_entry(f"x_{i:03d}", word, ["a"]) for i, word in enumerate(
+    ["apple", "banana", "cherry", "date", "elder", "fig"], 1)]
+UNSORTED_DECK = [_entry(f"x_{i:03d}", word, ["b"]) for i, word in enumerate(
+    ["fig", "Apple", "grape", "banana ", "kiwi", "lemon", "cherry"], 1)]
+
+
+@pytest.mark.parametrize("policy", list(MERGE_POLICIES))
+@pytest.mark.parametrize("run_size", [2, 100])
+def test_merge_output_ids_are_unique(tmp_path, policy, run_size):
+    write_vocabulary(SORTED_DECK, str(tmp_path / "sorted.json"))
+    write_vocabulary(UNSORTED_DECK, str(tmp_path / "unsorted.json"))
+
+    generator = VocabularyGenerator(str(tmp_path))
+    stats = generator.merge_vocabularies(["sorted.json", "unsorted.json"], "merged.json",
+                                         policy=policy, run_size=run_size)
+    merged = load_vocabulary(str(tmp_path / "merged.json"))
+
+    ids = [entry["id"] for entry in merged]
+    words = [entry["word"].strip().lower() for entry in merged]
+    assert len(set(ids)) == len(ids)
+    assert words == sorted(set(words))
+    assert words == ["apple", "banana", "cherry", "date", "elder", "fig", "grape", "kiwi", "lemon"]
+    assert stats["read"] == len(SORTED_DECK) + len(UNSORTED_DECK)
+    assert stats["written"] == len(merged)
+
+
+def test_unsorted_input_is_spilled_before_merging(tmp_path, monkeypatch):
+    write_vocabulary(SORTED_DECK, str(tmp_path / "sorted.json"))
+    write_vocabulary(UNSORTED_DECK, str(tmp_path / "unsorted.json"))
+
+    generator = VocabularyGenerator(str(tmp_path))
+    saves = []
+    save_vocabulary = generator.save_vocabulary
+    monkeypatch.setattr(generator, "save_vocabulary", lambda *args: saves.append(args) or save_vocabulary(*args))
+    stats = generator.merge_vocabularies(["sorted.json", "unsorted.json"], "merged.json", run_size=3)
+
+    # 未排序的输入分3段，输出只写一遍
+    assert len(saves) == 1
+    assert stats["runs"] == 1 + 3
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+同义词/反义词图
+从 data/thesaurus.json 中人工整理的关系构建带对称闭包的关系图（A 是 B 的反义词，则 B 也是 A 的反义词），
+以“偏移量 + 目标下标”的紧凑形式序列化到缓存，所有生成器共用，按词查询为 O(1)
+"""
+
+import argparse
+import json
+import os
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple
+
+from asset_build import CACHE_DIR, TOOLS_DIR
+
+# 人工整理的关系：{"synonyms": {词: [同义词]}, "antonyms": {词: [反义词]}}
+THESAURUS_SOURCE_PATH = os.path.join(TOOLS_DIR, "data", "thesaurus.json")
+
+# 构建后的紧凑关系图
+THESAURUS_PATH = os.path.join(CACHE_DIR, "thesaurus.compact.json")
+
+RELATIONS = ("synonyms", "antonyms")
+
+COMPACT_VERSION = 1
+
+
+def normalize_word(word: str) -> str:
+    return word.strip().lower()
+
+
+class Thesaurus:
+    """关系图：单词表 + 每种关系的邻接表（offsets[i]:offsets[i+1] 是第 i 个词在 targets 中的区间）"""
+
+    def __init__(self, words: Sequence[str], graphs: Dict[str, Tuple[List[int], List[int]]]):
+        self.words = list(words)
+        self.graphs = graphs
+        self._ids = {word: i for i, word in enumerate(self.words)}
+
+    @classmethod
+    def from_relations(cls, relations: Dict[str, Dict[str, List[str]]]) -> "Thesaurus":
+        """由人工整理的关系构建，并补全对称关系
+
+        每个词的关系先按整理时的顺序排列，再追加由其他词反推出的关系。
+        """
+        adjacency: Dict[str, Dict[str, Dict[str, None]]] = {relation: {} for relation in RELATIONS}
+        for relation in RELATIONS:
+            edges = adjacency[relation]
+            pairs = [(normalize_word(word), normalize_word(other))
+                     for word, others in relations.get(relation, {}).items() for other in others]
+            for word, other in pairs:
+                if word != other:
+                    edges.setdefault(word, {})[other] = None
+            for word, other in pairs:
+                if word != other:
+                    edges.setdefault(other, {})[word] = None
+
+        words = sorted({w for edges in adjacency.values() for word, others in edges.items() for w in (word, *others)})
+        ids = {word: i for i, word in enumerate(words)}
+
+        graphs = {}
+        for relation, edges in adjacency.items():
+            offsets = [0]
+            targets: List[int] = []
+            for word in words:
+                targets.extend(ids[other] for other in edges.get(word, ()))
+                offsets.append(len(targets))
+            graphs[relation] = (offsets, targets)
+        return cls(words, graphs)
+
+    @classmethod
+    def from_compact(cls, data: Dict) -> "Thesaurus":
+        return cls(data["words"], {
+            relation: (data[relation]["offsets"], data[relation]["targets"]) for relation in RELATIONS
+        })
+
+    def to_compact(self) -> Dict:
+        compact = {"version": COMPACT_VERSION, "words": self.words}
+        for relation, (offsets, targets) in self.graphs.items():
+            compact[relation] = {"offsets": offsets, "targets": targets}
+        return compact
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __contains__(self, word: str) -> bool:
+        return normalize_word(word) in self._ids
+
+    def related(self, word: str, relation: str) -> List[str]:
+        word_id = self._ids.get(normalize_word(word))
+        if word_id is None:
+            return []
+        offsets, targets = self.graphs[relation]
+        return [self.words[i] for i in targets[offsets[word_id]:offsets[word_id + 1]]]
+
+    def synonyms(self, word: str) -> List[str]:
+        return self.related(word, "synonyms")
+
+    def antonyms(self, word: str) -> List[str]:
+        return self.related(word, "antonyms")
+
+    def lookup(self, word: str) -> Tuple[List[str], List[str]]:
+        """返回（同义词, 反义词）"""
+        return self.synonyms(word), self.antonyms(word)
+
+    def edge_count(self, relation: str) -> int:
+        return len(self.graphs[relation][1])
+
+
+def load_relations(path: str = THESAURUS_SOURCE_PATH) -> Dict[str, Dict[str, List[str]]]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def build_thesaurus(source_path: str = THESAURUS_SOURCE_PATH, output_path: str = THESAURUS_PATH) -> Thesaurus:
+    """由整理的关系构建关系图并写出紧凑文件"""
+    thesaurus = Thesaurus.from_relations(load_relations(source_path))
+    stat = os.stat(source_path)
+    compact = thesaurus.to_compact()
+    compact["source"] = [stat.st_size, stat.st_mtime_ns]
+
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(compact, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, output_path)
+    return thesaurus
+
+
+@lru_cache(maxsize=None)
+def get_thesaurus() -> Thesaurus:
+    """读取关系图，每个进程只加载一次；整理的关系文件变化（大小或修改时间）后自动重新构建"""
+    stat = os.stat(THESAURUS_SOURCE_PATH)
+    try:
+        with open(THESAURUS_PATH, 'r', encoding='utf-8') as f:
+            compact = json.load(f)
+        if compact.get("version") == COMPACT_VERSION and compact.get("source") == [stat.st_size, stat.st_mtime_ns]:
+            return Thesaurus.from_compact(compact)
+    except (OSError, ValueError):
+        pass
+    try:
+        return build_thesaurus()
+    except OSError:
+        # 缓存目录不可写时直接在内存中构建
+        return Thesaurus.from_relations(load_relations())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="同义词/反义词图构建工具")
+    parser.add_argument("words", nargs="*", help="构建后要查询的单词")
+    parser.add_argument("--output", default=THESAURUS_PATH, help="紧凑关系图的输出路径")
+    args = parser.parse_args()
+
+    print("🔗 构建同义词/反义词图")
+    print("=" * 60)
+
+    relations = load_relations()
+    thesaurus = build_thesaurus(output_path=args.output)
+
+    for relation in RELATIONS:
+        curated = sum(len(others) for others in relations.get(relation, {}).values())
+        print(f"  {relation:<10} 整理 {curated:>5} 条 → 对称闭包后 {thesaurus.edge_count(relation):>5} 条")
+    print(f"\n📦 {len(thesaurus)} 个单词，{os.path.getsize(args.output):,} 字节: {args.output}")
+
+    for word in args.words:
+        synonyms, antonyms = thesaurus.lookup(word)
+        print(f"\n  {word}")
+        print(f"    同义词: {', '.join(synonyms) or '-'}")
+        print(f"    反义词: {', '.join(antonyms) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
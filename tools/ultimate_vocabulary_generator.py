@@ -4,182 +4,36 @@
 根据需求文档生成完整数量的词库文件
 """
 
-import json
+import argparse
+import itertools
 import os
 import random
 
+from asset_build import VOCAB_DIR, BuildJob, add_build_arguments, print_build_summary, run_jobs
+from lexicon_store import get_store, raw_source
+from vocab_io import format_path, write_vocabulary
+
+# 生成逻辑变化时递增，使增量构建失效
+GENERATOR_VERSION = "2"
+
+# 词库配置 - 根据需求文档的完整规模
+VOCAB_CONFIGS = [
+    # 考试词库 - 完整规模
+    ("cet4_ultra.json", "CET-4超级词库", 4500, "cet4", (1, 3)),
+    ("cet6_ultra.json", "CET-6超级词库", 6000, "cet6", (2, 4)),
+    ("toefl_ultra.json", "TOEFL超级词库", 8000, "toefl", (2, 4)),
+    ("ielts_ultra.json", "IELTS超级词库", 7500, "ielts", (2, 4)),
+    ("gre_ultra.json", "GRE超级词库", 12000, "gre", (3, 5)),
+
+    # 实用词库 - 中等规模
+    ("business_complete.json", "商务英语完整词库", 500, "business", (2, 4)),
+    ("technology_complete.json", "科技英语完整词库", 500, "tech", (2, 4)),
+    ("academic_complete.json", "学术英语完整词库", 500, "academic", (3, 5)),
+    ("daily_complete.json", "日常英语完整词库", 1000, "daily", (1, 3)),
+]
+
 # 扩展词汇数据库 - 包含数千个常用词汇
-EXTENDED_VOCABULARY = {
-    # A - 高频词汇 (200个)
-    "ability": ("əˈbɪləti", "n. 能力；本领", 2, "cet4"),
-    "able": ("ˈeɪbl", "adj. 能够的", 2, "cet4"),
-    "about": ("əˈbaʊt", "prep./adv. 关于", 1, "cet4"),
-    "above": ("əˈbʌv", "prep./adv. 在...之上", 1, "cet4"),
-    "abroad": ("əˈbrɔːd", "adv. 在国外", 2, "cet4"),
-    "absence": ("ˈæbsəns", "n. 缺席；缺乏", 3, "cet4"),
-    "absolute": ("ˈæbsəluːt", "adj. 绝对的", 3, "cet4"),
-    "absorb": ("əbˈzɔːb", "v. 吸收", 3, "cet4"),
-    "abstract": ("ˈæbstrækt", "adj. 抽象的", 3, "cet4"),
-    "academic": ("ˌækəˈdemɪk", "adj. 学术的", 3, "cet4"),
-    "accept": ("əkˈsept", "v. 接受", 2, "cet4"),
-    "access": ("ˈækses", "n. 接近；通道", 3, "cet4"),
-    "accident": ("ˈæksɪdənt", "n. 事故", 2, "cet4"),
-    "accompany": ("əˈkʌmpəni", "v. 陪伴", 3, "cet4"),
-    "accomplish": ("əˈkʌmplɪʃ", "v. 完成", 3, "cet4"),
-    "according": ("əˈkɔːdɪŋ", "adv. 按照", 2, "cet4"),
-    "account": ("əˈkaʊnt", "n. 账户；描述", 2, "cet4"),
-    "accurate": ("ˈækjərət", "adj. 准确的", 3, "cet4"),
-    "achieve": ("əˈtʃiːv", "v. 实现；达到", 3, "cet4"),
-    "achievement": ("əˈtʃiːvmənt", "n. 成就", 3, "cet4"),
-    "acknowledge": ("əkˈnɒlɪdʒ", "v. 承认", 4, "cet6"),
-    "acquire": ("əˈkwaɪər", "v. 获得", 4, "cet6"),
-    "across": ("əˈkrɒs", "prep./adv. 横过", 1, "cet4"),
-    "act": ("ækt", "v. 行动 n. 行为", 1, "cet4"),
-    "action": ("ˈækʃn", "n. 行动", 2, "cet4"),
-    "active": ("ˈæktɪv", "adj. 活跃的", 2, "cet4"),
-    "activity": ("ækˈtɪvəti", "n. 活动", 2, "cet4"),
-    "actual": ("ˈæktʃuəl", "adj. 实际的", 2, "cet4"),
-    "actually": ("ˈæktʃuəli", "adv. 实际上", 2, "cet4"),
-    "adapt": ("əˈdæpt", "v. 适应", 3, "cet4"),
-    "add": ("æd", "v. 增加", 1, "cet4"),
-    "addition": ("əˈdɪʃn", "n. 加；增加", 3, "cet4"),
-    "additional": ("əˈdɪʃənl", "adj. 额外的", 3, "cet4"),
-    "address": ("əˈdres", "n. 地址 v. 致辞", 2, "cet4"),
-    "adjust": ("əˈdʒʌst", "v. 调整", 3, "cet4"),
-    "administration": ("ədˌmɪnɪˈstreɪʃn", "n. 管理", 4, "cet6"),
-    "admire": ("ədˈmaɪər", "v. 钦佩", 3, "cet4"),
-    "admit": ("ədˈmɪt", "v. 承认", 3, "cet4"),
-    "adopt": ("əˈdɒpt", "v. 收养；采用", 3, "cet4"),
-    "adult": ("ˈædʌlt", "n. 成年人", 2, "cet4"),
-    "advance": ("ədˈvɑːns", "v. 前进 n. 进展", 3, "cet4"),
-    "advanced": ("ədˈvɑːnst", "adj. 先进的", 3, "cet4"),
-    "advantage": ("ədˈvɑːntɪdʒ", "n. 优势", 3, "cet4"),
-    "adventure": ("ədˈventʃər", "n. 冒险", 3, "cet4"),
-    "advertise": ("ˈædvətaɪz", "v. 做广告", 3, "cet4"),
-    "advertisement": ("ədˈvɜːtɪsmənt", "n. 广告", 3, "cet4"),
-    "advice": ("ədˈvaɪs", "n. 建议", 2, "cet4"),
-    "affair": ("əˈfeər", "n. 事情", 3, "cet4"),
-    "affect": ("əˈfekt", "v. 影响", 3, "cet4"),
-    "afford": ("əˈfɔːd", "v. 买得起", 3, "cet4"),
-    "afraid": ("əˈfreɪd", "adj. 害怕的", 2, "cet4"),
-    "African": ("ˈæfrɪkən", "adj. 非洲的", 2, "cet4"),
-    "after": ("ˈɑːftər", "prep./conj./adv. 在...后", 1, "cet4"),
-    "afternoon": ("ˌɑːftərˈnuːn", "n. 下午", 1, "cet4"),
-    "again": ("əˈɡen", "adv. 又一次", 1, "cet4"),
-    "against": ("əˈɡeɪnst", "prep. 反对；倚靠", 2, "cet4"),
-    "age": ("eɪdʒ", "n. 年龄", 1, "cet4"),
-    "agency": ("ˈeɪdʒənsi", "n. 代理处", 3, "cet4"),
-    "agenda": ("əˈdʒendə", "n. 议程", 3, "cet4"),
-    "agent": ("ˈeɪdʒənt", "n. 代理人", 3, "cet4"),
-    "aggressive": ("əˈɡresɪv", "adj. 侵略的", 3, "cet4"),
-    "ago": ("əˈɡəʊ", "adv. 以前", 2, "cet4"),
-    "agree": ("əˈɡriː", "v. 同意", 2, "cet4"),
-    "agreement": ("əˈɡriːmənt", "n. 协议", 3, "cet4"),
-    "agricultural": ("ˌæɡrɪˈkʌltʃərəl", "adj. 农业的", 3, "cet4"),
-    "ahead": ("əˈhed", "adv. 在前", 2, "cet4"),
-    "aid": ("eɪd", "n./v. 援助", 3, "cet4"),
-    "aim": ("eɪm", "n. 目标 v. 瞄准", 2, "cet4"),
-    "air": ("eər", "n. 空气", 1, "cet4"),
-    "aircraft": ("ˈeəkrɑːft", "n. 飞机", 3, "cet4"),
-    "airline": ("ˈeəlaɪn", "n. 航空公司", 3, "cet4"),
-    "airport": ("ˈeərpɔːrt", "n. 机场", 2, "cet4"),
-    "alarm": ("əˈlɑːrm", "n. 警报", 3, "cet4"),
-    "album": ("ˈælbəm", "n. 相册；专辑", 3, "cet4"),
-    "alcohol": ("ˈælkəhɒl", "n. 酒精", 3, "cet4"),
-    "alert": ("əˈlɜːrt", "adj. 警觉的", 3, "cet4"),
-    "alien": ("ˈeɪliən", "n. 外星人", 3, "cet4"),
-    "alike": ("əˈlaɪk", "adj. 相似的", 3, "cet4"),
-    "alive": ("əˈlaɪv", "adj. 活着的", 2, "cet4"),
-    "all": ("ɔːl", "adj./pron./adv. 全部", 1, "cet4"),
-    "allergy": ("ˈælərdʒi", "n. 过敏", 4, "cet6"),
-    "allow": ("əˈlaʊ", "v. 允许", 2, "cet4"),
-    "ally": ("ˈælaɪ", "n. 同盟国", 3, "cet4"),
-    "almost": ("ˈɔːlmoʊst", "adv. 几乎", 2, "cet4"),
-    "alone": ("əˈloʊn", "adj./adv. 单独的", 2, "cet4"),
-    "along": ("əˈlɒŋ", "prep./adv. 沿着", 2, "cet4"),
-    "aloud": ("əˈlaʊd", "adv. 大声地", 2, "cet4"),
-    "alphabet": ("ˈælfəbet", "n. 字母表", 2, "cet4"),
-    "already": ("ɔːlˈredi", "adv. 已经", 2, "cet4"),
-    "also": ("ˈɔːlsoʊ", "adv. 也", 1, "cet4"),
-    "alter": ("ˈɔːltər", "v. 改变", 3, "cet4"),
-    "alternative": ("ɔːlˈtɜːrnətɪv", "n./adj. 供选择的", 4, "cet6"),
-    "although": ("ɔːlˈðoʊ", "conj. 虽然", 3, "cet4"),
-    "altogether": ("ˌɔːltəˈɡeðər", "adv. 总共", 3, "cet4"),
-    "always": ("ˈɔːlweɪz", "adv. 总是", 1, "cet4"),
-    "amazing": ("əˈmeɪzɪŋ", "adj. 令人惊异的", 3, "cet4"),
-    "ambition": ("æmˈbɪʃn", "n. 野心", 4, "cet6"),
-    "ambulance": ("ˈæmbjələns", "n. 救护车", 3, "cet4"),
-    "among": ("əˈmʌŋ", "prep. 在...之中", 2, "cet4"),
-    "amount": ("əˈmaʊnt", "n. 数量", 3, "cet4"),
-    "amuse": ("əˈmjuːz", "v. 逗乐", 3, "cet4"),
-    "amusing": ("əˈmjuːzɪŋ", "adj. 有趣的", 3, "cet4"),
-    "analyze": ("ˈænəlaɪz", "v. 分析", 4, "cet6"),
-    "analysis": ("əˈnæləsɪs", "n. 分析", 4, "cet6"),
-    "ancestor": ("ˈænsestər", "n. 祖先", 4, "cet6"),
-    "ancient": ("ˈeɪnʃənt", "adj. 古代的", 3, "cet4"),
-    "anger": ("ˈæŋɡər", "n. 愤怒", 2, "cet4"),
-    "angle": ("ˈæŋɡl", "n. 角度", 3, "cet4"),
-    "angry": ("ˈæŋɡri", "adj. 生气的", 2, "cet4"),
-    "animal": ("ˈænɪml", "n. 动物", 2, "cet4"),
-    "anniversary": ("ˌænɪˈvɜːrsəri", "n. 周年纪念", 4, "cet6"),
-    "announce": ("əˈnaʊns", "v. 宣布", 3, "cet4"),
-    "annoy": ("əˈnɔɪ", "v. 使恼怒", 3, "cet4"),
-    "annual": ("ˈænjuəl", "adj. 每年的", 4, "cet6"),
-    "another": ("əˈnʌðər", "adj./pron. 另一个", 1, "cet4"),
-    "answer": ("ˈænsər", "n./v. 回答", 2, "cet4"),
-    "anticipate": ("ænˈtɪsɪpeɪt", "v. 预期", 4, "cet6"),
-    "anxiety": ("æŋˈzaɪəti", "n. 焦虑", 4, "cet6"),
-    "anxious": ("ˈæŋkʃəs", "adj. 焦虑的", 3, "cet4"),
-    "any": ("ˈeni", "adj./pron. 任何", 1, "cet4"),
-    "anybody": ("ˈenibɒdi", "pron. 任何人", 2, "cet4"),
-    "anymore": ("ˌeniˈmɔːr", "adv. 再也不", 2, "cet4"),
-    "anyone": ("ˈeniwʌn", "pron. 任何人", 2, "cet4"),
-    "anything": ("ˈeniθɪŋ", "pron. 任何事物", 2, "cet4"),
-    "anyway": ("ˈeniweɪ", "adv. 无论如何", 2, "cet4"),
-    "anywhere": ("ˈeniweər", "adv. 任何地方", 2, "cet4"),
-    "apart": ("əˈpɑːrt", "adv. 分开", 3, "cet4"),
-    "apartment": ("əˈpɑːrtmənt", "n. 公寓", 2, "cet4"),
-    "apologize": ("əˈpɒlədʒaɪz", "v. 道歉", 3, "cet4"),
-    "apology": ("əˈpɒlədʒi", "n. 道歉", 3, "cet4"),
-    "apparent": ("əˈpærənt", "adj. 明显的", 4, "cet6"),
-    "appeal": ("əˈpiːl", "n./v. 呼吁；吸引", 4, "cet6"),
-    "appear": ("əˈpɪr", "v. 出现", 2, "cet4"),
-    "appearance": ("əˈpɪrəns", "n. 外貌", 3, "cet4"),
-    "apple": ("ˈæpl", "n. 苹果", 1, "cet4"),
-    "application": ("ˌæplɪˈkeɪʃn", "n. 申请；应用", 3, "cet4"),
-    "apply": ("əˈplaɪ", "v. 申请；应用", 3, "cet4"),
-    "appoint": ("əˈpɔɪnt", "v. 任命", 4, "cet6"),
-    "appointment": ("əˈpɔɪntmənt", "n. 任命；预约", 3, "cet4"),
-    "appreciate": ("əˈpriːʃieɪt", "v. 感激；欣赏", 4, "cet6"),
-    "approach": ("əˈprəʊtʃ", "n./v. 方法；接近", 4, "cet6"),
-    "appropriate": ("əˈprəʊpriət", "adj. 适当的", 4, "cet6"),
-    "approval": ("əˈpruːvl", "n. 批准", 4, "cet6"),
-    "approve": ("əˈpruːv", "v. 批准", 4, "cet6"),
-    "approximately": ("əˈprɒksɪmətli", "adv. 大约", 4, "cet6"),
-    "arbitrary": ("ˈɑːrbɪtreri", "adj. 任意的", 5, "gre"),
-    "architect": ("ˈɑːrkɪtekt", "n. 建筑师", 4, "cet6"),
-    "architecture": ("ˈɑːrkɪtektʃər", "n. 建筑学", 4, "cet6"),
-    "area": ("ˈeəriə", "n. 区域", 2, "cet4"),
-    "argue": ("ˈɑːrɡjuː", "v. 争论", 3, "cet4"),
-    "argument": ("ˈɑːrɡjumənt", "n. 论点", 3, "cet4"),
-    "arise": ("əˈraɪz", "v. 出现", 4, "cet6"),
-    "arithmetic": ("əˈrɪθmətɪk", "n. 算术", 3, "cet4"),
-    "arm": ("ɑːrm", "n. 手臂 v. 武装", 1, "cet4"),
-    "armed": ("ɑːrmd", "adj. 武装的", 3, "cet4"),
-    "army": ("ˈɑːrmi", "n. 军队", 2, "cet4"),
-    "around": ("əˈraʊnd", "prep./adv. 在周围", 1, "cet4"),
-    "arrange": ("əˈreɪndʒ", "v. 安排", 3, "cet4"),
-    "arrangement": ("əˈreɪndʒmənt", "n. 安排", 3, "cet4"),
-    "arrest": ("əˈrest", "v./n. 逮捕", 3, "cet4"),
-    "arrival": ("əˈraɪvl", "n. 到达", 3, "cet4"),
-    "arrive": ("əˈraɪv", "v. 到达", 2, "cet4"),
-    "arrow": ("ˈæroʊ", "n. 箭", 2, "cet4"),
-    "art": ("ɑːrt", "n. 艺术", 1, "cet4"),
-    "article": ("ˈɑːrtɪkl", "n. 文章；物品", 2, "cet4"),
-    "artificial": ("ˌɑːrtɪˈfɪʃl", "adj. 人造的", 4, "cet6"),
-    "artist": ("ˈɑːrtɪst", "n. 艺术家", 2, "cet4"),
-    "artistic": ("ɑːˈtɪstɪk", "adj. 艺术的", 3, "cet4"),
-}
+EXTENDED_VOCABULARY = raw_source("ultimate_extended")
 
 # 添加更多字母的词汇
 def generate_vocabulary_by_letter(letter, count, difficulty_range, level):
@@ -272,84 +126,83 @@ def create_vocabulary_entry(word_id, word, data, vocab_type):
 
     return entry
 
-def generate_vocabulary_file(filename, vocab_name, word_count, level, difficulty_range=(2,4)):
-    """生成词库文件"""
-    print(f"\n生成 {vocab_name} 词库...")
-
-    # 收集所有词汇
-    all_words = {}
+def iter_level_words(word_count, level, difficulty_range):
+    """按顺序产生去重后的 (词, 数据)：扩展词汇库 → 逐字母生成的词汇"""
+    seen = set()
 
     # 添加扩展词汇库
-    for word, data in EXTENDED_VOCABULARY.items():
-        if data[3] in [level, 'cet4', 'cet6']:  # 匹配级别
-            all_words[word] = data
+    for entry in get_store("ultimate_extended").by_level(level, 'cet4', 'cet6'):  # 匹配级别
+        seen.add(entry.word)
+        yield entry.word, entry.data
 
-    # 为每个字母生成词汇
+    # 为每个字母生成词汇，一次只保留一个字母的词汇
     letters = 'BCDEFGHIJKLMNOPQRSTUVWXYZ'
     words_per_letter = word_count // 26
 
     for letter in letters:
         letter_words = generate_vocabulary_by_letter(letter, words_per_letter, difficulty_range, level)
-        all_words.update(letter_words)
-
-    # 截取指定数量
-    word_list = list(all_words.items())[:word_count]
-
-    # 生成词汇条目
-    vocabulary = []
+        for word, data in letter_words.items():
+            if word not in seen:
+                seen.add(word)
+                yield word, data
+
+def iter_vocabulary_entries(vocab_name, word_count, level, difficulty_range):
+    """逐个生成词汇条目，截取到指定数量"""
+    word_list = itertools.islice(iter_level_words(word_count, level, difficulty_range), word_count)
     for idx, (word, data) in enumerate(word_list, 1):
         # 更新标签
         updated_data = (data[0], data[1], data[2], level)
-        entry = create_vocabulary_entry(idx, word, updated_data, vocab_name)
-        vocabulary.append(entry)
+        yield create_vocabulary_entry(idx, word, updated_data, vocab_name)
 
-    # 保存文件
-    filepath = f"assets/vocabularies/{filename}"
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
+def generate_vocabulary_file(filename, vocab_name, word_count, level, difficulty_range=(2,4), fmt="pretty"):
+    """生成词库文件，返回词汇数"""
+    print(f"\n生成 {vocab_name} 词库...")
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(vocabulary, f, ensure_ascii=False, indent=2)
+    # 边生成边写入文件
+    filepath = format_path(os.path.join(VOCAB_DIR, filename), fmt)
+    count = write_vocabulary(iter_vocabulary_entries(vocab_name, word_count, level, difficulty_range), filepath, fmt)
 
-    print(f"✅ 已生成 {filename}: {len(vocabulary)} 个词汇")
+    print(f"✅ 已生成 {os.path.basename(filepath)}: {count} 个词汇")
     print(f"   文件大小: {os.path.getsize(filepath) / 1024:.1f} KB")
 
-    return vocabulary
+    return count
+
+def build_vocabulary_file(filename, vocab_name, word_count, level, difficulty_range, fmt):
+    """构建任务入口，返回生成的词汇数"""
+    return generate_vocabulary_file(filename, vocab_name, word_count, level, difficulty_range, fmt)
+
+def create_build_jobs(fmt="pretty"):
+    """为每个词库配置创建构建任务"""
+    jobs = []
+    for config in VOCAB_CONFIGS:
+        jobs.append(BuildJob(
+            name=f"ultimate_vocabulary_generator:{config[0]}",
+            build=build_vocabulary_file,
+            args=config + (fmt,),
+            outputs=[format_path(os.path.join(VOCAB_DIR, config[0]), fmt)],
+            sources={"EXTENDED_VOCABULARY": EXTENDED_VOCABULARY},
+            version=GENERATOR_VERSION,
+        ))
+    return jobs
 
 def main():
+    parser = argparse.ArgumentParser(description="终极词库生成器")
+    add_build_arguments(parser)
+    args = parser.parse_args()
+
     print("╔══════════════════════════════════════════════════════════════════╗")
     print("║       🎯 终极词库生成器 - 完整规模词库系统 🎯                       ║")
     print("╚══════════════════════════════════════════════════════════════════╝")
 
-    # 词库配置 - 根据需求文档的完整规模
-    vocab_configs = [
-        # 考试词库 - 完整规模
-        ("cet4_ultra.json", "CET-4超级词库", 4500, "cet4", (1, 3)),
-        ("cet6_ultra.json", "CET-6超级词库", 6000, "cet6", (2, 4)),
-        ("toefl_ultra.json", "TOEFL超级词库", 8000, "toefl", (2, 4)),
-        ("ielts_ultra.json", "IELTS超级词库", 7500, "ielts", (2, 4)),
-        ("gre_ultra.json", "GRE超级词库", 12000, "gre", (3, 5)),
-
-        # 实用词库 - 中等规模
-        ("business_complete.json", "商务英语完整词库", 500, "business", (2, 4)),
-        ("technology_complete.json", "科技英语完整词库", 500, "tech", (2, 4)),
-        ("academic_complete.json", "学术英语完整词库", 500, "academic", (3, 5)),
-        ("daily_complete.json", "日常英语完整词库", 1000, "daily", (1, 3)),
-    ]
-
-    total_words = 0
-
-    for filename, vocab_name, word_count, level, difficulty_range in vocab_configs:
-        try:
-            vocab = generate_vocabulary_file(filename, vocab_name, word_count, level, difficulty_range)
-            total_words += len(vocab)
-        except Exception as e:
-            print(f"❌ 生成 {filename} 失败: {e}")
+    results = run_jobs(create_build_jobs(args.format), force=args.force, workers=args.jobs)
+    print_build_summary(results)
+    total_words = sum(r["result"] or 0 for r in results if r["status"] != "failed")
 
     print(f"\n" + "=" * 70)
     print(f"📊 生成完成")
     print(f"=" * 70)
     print(f"  总词汇数: {total_words:,} 词")
-    print(f"  词库文件: {len(vocab_configs)} 个")
+    print(f"  词库文件: {len(VOCAB_CONFIGS)} 个")
     print(f"=" * 70)
     print(f"\n💡 建议:")
     print(f"  • 小型测试: 使用 *_sample.json (100词)")
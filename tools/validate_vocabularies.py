@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+词库校验工具
+多进程并行、逐个流式读取 assets/vocabularies 下的每个词库（每个文件只读一遍），
+对每个条目执行预先编译好的结构与内容检查（必需字段、字段类型、ID唯一、占位内容、未注册标签），
+再汇总跨词库的ID冲突，输出机器可读的JSON报告
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from asset_build import CACHE_DIR, VOCAB_DIR, list_decks
+from tag_registry import get_registry
+from vocab_io import iter_vocabulary
+
+REPORT_VERSION = 1
+DEFAULT_REPORT_PATH = os.path.join(CACHE_DIR, "validation_report.json")
+
+# 每项检查在报告中保留的示例数
+SAMPLE_LIMIT = 5
+
+ERROR = "error"
+WARNING = "warning"
+SEVERITIES = (ERROR, WARNING)
+
+# 字段 → (是否必需, 允许的类型, 列表元素类型)；与应用中 Word.fromJson 的要求一致
+FIELD_SCHEMA: Dict[str, Tuple[bool, tuple, Optional[type]]] = {
+    "id": (True, (str,), None),
+    "word": (True, (str,), None),
+    "phonetic": (False, (str, type(None)), None),
+    "definition": (True, (str,), None),
+    "examples": (True, (list,), str),
+    "synonyms": (False, (list, type(None)), str),
+    "antonyms": (False, (list, type(None)), str),
+    "etymology": (False, (str, type(None)), None),
+    "difficulty": (True, (int,), None),
+    "tags": (True, (list,), str),
+}
+
+DIFFICULTY_RANGE = (1, 5)
+
+# 各生成脚本留下的占位内容；匹配前先把值中的单词替换为 {w}
+PLACEHOLDER_PATTERNS = {
+    "definition": re.compile(r"^(?:[a-z]+\.\s*)?(?:\{w\}的释义|\{w\}|.+词汇中的词汇: \{w\})$"),
+    "examples": re.compile(
+        r"^(?:This is an example sentence(?: using '\{w\}'| for(?: the word)? '\{w\}')?\."
+        r"|Here is an example sentence using '\{w\}'\."
+        r"|The word '\{w\}' is commonly used in English\."
+        r"|Can you use '\{w\}' in (?:a|your own) sentence\?"
+        r"|Usage example for '\{w\}'\."
+        r"|This is an example of using '\{w\}' in a sentence\."
+        r"|Understanding '\{w\}' is important for learning English\."
+        r"|Example using '\{w\}' in .+ context\.)$"
+    ),
+    "etymology": re.compile(r"^(?:英语\w+词汇|Etymology (?:for|of|information for) \{w\}|Word in .+)$"),
+}
+
+# 检查名 → (级别, 说明)
+CHECKS = {
+    "unreadable": (ERROR, "文件无法解析"),
+    "not_object": (ERROR, "条目不是对象"),
+    "missing_field": (ERROR, "缺少必需字段"),
+    "wrong_type": (ERROR, "字段类型错误"),
+    "empty_word": (ERROR, "单词为空"),
+    "difficulty_range": (ERROR, "难度不在 1-5 之间"),
+    "duplicate_id": (ERROR, "词库内ID重复"),
+    "duplicate_word": (WARNING, "词库内单词重复"),
+    "placeholder_definition": (WARNING, "占位释义"),
+    "fake_phonetic": (WARNING, "由单词拼写代替的音标"),
+    "placeholder_example": (WARNING, "占位例句"),
+    "placeholder_etymology": (WARNING, "占位词源"),
+    "unknown_tag": (WARNING, "标签未在 tools/data/tags.json 中注册（位掩码中无法区分）"),
+    "cross_deck_id": (WARNING, "ID与其他词库冲突（导入数据库时后者覆盖前者）"),
+}
+
+
+class IssueLog:
+    """按检查项汇总问题：计数 + 少量示例"""
+
+    def __init__(self, issues: Optional[Dict[str, Dict]] = None):
+        self.issues: Dict[str, Dict] = {} if issues is None else issues
+
+    def add(self, check: str, offset: Optional[int], entry_id=None, word=None, detail=None) -> None:
+        issue = self.issues.get(check)
+        if issue is None:
+            issue = self.issues[check] = {"severity": CHECKS[check][0], "count": 0, "samples": []}
+        issue["count"] += 1
+        if len(issue["samples"]) < SAMPLE_LIMIT:
+            sample = {"offset": offset, "id": entry_id, "word": word}
+            if detail is not None:
+                sample["detail"] = detail
+            issue["samples"].append(sample)
+
+
+def _type_ok(value, types: tuple, item_type: Optional[type]) -> bool:
+    # bool 是 int 的子类，难度等整数字段不接受 True/False
+    if isinstance(value, bool) or not isinstance(value, types):
+        return False
+    return item_type is None or not isinstance(value, list) or all(isinstance(item, item_type) for item in value)
+
+
+def _templated(value: str, word: str) -> str:
+    return value.replace(word, "{w}") if word else value
+
+
+def check_entry(entry, offset: int, log: IssueLog, seen_ids: Dict[str, int], seen_words: Dict[str, int]) -> None:
+    """对单个条目执行全部检查"""
+    if not isinstance(entry, dict):
+        log.add("not_object", offset)
+        return
+
+    entry_id = entry.get("id")
+    word = entry.get("word")
+    for field, (required, types, item_type) in FIELD_SCHEMA.items():
+        if field not in entry:
+            if required:
+                log.add("missing_field", offset, entry_id, word, field)
+        elif not _type_ok(entry[field], types, item_type):
+            log.add("wrong_type", offset, entry_id, word, field)
+
+    if isinstance(entry_id, str):
+        if entry_id in seen_ids:
+            log.add("duplicate_id", offset, entry_id, word, seen_ids[entry_id])
+        else:
+            seen_ids[entry_id] = offset
+
+    if not isinstance(word, str):
+        return
+    headword = word.strip().lower()
+    if not headword:
+        log.add("empty_word", offset, entry_id, word)
+        return
+    if headword in seen_words:
+        log.add("duplicate_word", offset, entry_id, word, seen_words[headword])
+    else:
+        seen_words[headword] = offset
+
+    difficulty = entry.get("difficulty")
+    if isinstance(difficulty, int) and not DIFFICULTY_RANGE[0] <= difficulty <= DIFFICULTY_RANGE[1]:
+        log.add("difficulty_range", offset, entry_id, word, difficulty)
+
+    definition = entry.get("definition")
+    if isinstance(definition, str) and PLACEHOLDER_PATTERNS["definition"].match(_templated(definition, word)):
+        log.add("placeholder_definition", offset, entry_id, word, definition)
+
+    phonetic = entry.get("phonetic")
+    if isinstance(phonetic, str) and phonetic.strip("/") in (word, word[:8]):
+        log.add("fake_phonetic", offset, entry_id, word, phonetic)
+
+    examples = entry.get("examples")
+    if isinstance(examples, list) and examples and all(
+        isinstance(example, str) and PLACEHOLDER_PATTERNS["examples"].match(_templated(example, word))
+        for example in examples
+    ):
+        log.add("placeholder_example", offset, entry_id, word, examples[0])
+
+    etymology = entry.get("etymology")
+    if isinstance(etymology, str) and PLACEHOLDER_PATTERNS["etymology"].match(_templated(etymology, word)):
+        log.add("placeholder_etymology", offset, entry_id, word, etymology)
+
+    tags = entry.get("tags")
+    if isinstance(tags, list):
+        registry = get_registry()
+        unknown = [tag for tag in tags if isinstance(tag, str) and tag not in registry]
+        if unknown:
+            log.add("unknown_tag", offset, entry_id, word, unknown)
+
+
+def validate_deck(deck: str) -> Dict:
+    """流式校验单个词库，返回该词库的问题汇总和全部ID（用于跨词库冲突检查）"""
+    log = IssueLog()
+    seen_ids: Dict[str, int] = {}
+    seen_words: Dict[str, int] = {}
+    entries = 0
+    try:
+        for offset, entry in enumerate(iter_vocabulary(os.path.join(VOCAB_DIR, f"{deck}.json"))):
+            check_entry(entry, offset, log, seen_ids, seen_words)
+            entries += 1
+    except (OSError, ValueError) as e:
+        log.add("unreadable", entries, detail=str(e))
+    return {"deck": deck, "entries": entries, "issues": log.issues, "ids": list(seen_ids)}
+
+
+def run_validation(decks: Sequence[str], workers: int = 0) -> Dict:
+    """并行校验全部词库并生成报告；workers 为 0 时使用全部CPU核心"""
+    started = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+
+    if workers > 1 and len(decks) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(decks))) as executor:
+            results = list(executor.map(validate_deck, decks))
+    else:
+        results = [validate_deck(deck) for deck in decks]
+
+    # 跨词库ID冲突：同一ID出现在多个词库中
+    owners: Dict[str, List[str]] = {}
+    for result in results:
+        for entry_id in result.pop("ids"):
+            owners.setdefault(entry_id, []).append(result["deck"])
+    collisions = {entry_id: names for entry_id, names in owners.items() if len(names) > 1}
+    logs = {result["deck"]: IssueLog(result["issues"]) for result in results}
+    for entry_id, names in collisions.items():
+        for name in names:
+            logs[name].add("cross_deck_id", None, entry_id, detail=[other for other in names if other != name])
+
+    totals = {severity: 0 for severity in SEVERITIES}
+    by_check: Dict[str, int] = {}
+    for result in results:
+        for check, issue in result["issues"].items():
+            totals[issue["severity"]] += issue["count"]
+            by_check[check] = by_check.get(check, 0) + issue["count"]
+
+    return {
+        "version": REPORT_VERSION,
+        "summary": {
+            "decks": len(results),
+            "entries": sum(result["entries"] for result in results),
+            "errors": totals[ERROR],
+            "warnings": totals[WARNING],
+            "cross_deck_ids": len(collisions),
+            "by_check": dict(sorted(by_check.items())),
+            "seconds": round(time.perf_counter() - started, 3),
+            "workers": workers,
+        },
+        "checks": {check: {"severity": severity, "description": text} for check, (severity, text) in CHECKS.items()},
+        "decks": {result["deck"]: {"entries": result["entries"], "issues": result["issues"]} for result in results},
+    }
+
+
+def print_report(report: Dict) -> None:
+    """打印每个词库的问题数和各检查项的总数"""
+    print(f"{'词库':<24} {'条目':>8} {'错误':>8} {'警告':>8}")
+    print("-" * 52)
+    for deck, result in report["decks"].items():
+        errors = sum(i["count"] for i in result["issues"].values() if i["severity"] == ERROR)
+        warnings = sum(i["count"] for i in result["issues"].values() if i["severity"] == WARNING)
+        print(f"{deck:<24} {result['entries']:>8,} {errors:>8,} {warnings:>8,}")
+
+    summary = report["summary"]
+    print("-" * 52)
+    print(f"{'合计':<24} {summary['entries']:>8,} {summary['errors']:>8,} {summary['warnings']:>8,}")
+
+    if summary["by_check"]:
+        print("\n📋 按检查项:")
+        for check, count in summary["by_check"].items():
+            severity, text = CHECKS[check]
+            icon = "❌" if severity == ERROR else "⚠️ "
+            print(f"  {icon} {check:<24} {count:>8,}  {text}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="词库校验工具")
+    parser.add_argument("decks", nargs="*", help="要校验的词库（默认全部）")
+    parser.add_argument("--jobs", "-j", type=int, default=0, help="并行校验的进程数（0 表示使用全部CPU核心）")
+    parser.add_argument("--report", default=DEFAULT_REPORT_PATH, help="JSON报告的输出路径")
+    parser.add_argument("--fail-on", choices=SEVERITIES + ("never",), default=ERROR,
+                        help="出现该级别（或更严重）的问题时以非零状态退出")
+    args = parser.parse_args()
+
+    print("🩺 词库校验")
+    print("=" * 60)
+
+    decks = args.decks or list_decks()
+    report = run_validation(decks, args.jobs)
+    print_report(report)
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.report)), exist_ok=True)
+    tmp_path = args.report + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, args.report)
+
+    summary = report["summary"]
+    print(f"\n⏱️  {summary['decks']} 个词库、{summary['entries']:,} 个条目，"
+          f"{summary['workers']} 个进程，耗时 {summary['seconds']:.2f} 秒")
+    print(f"📄 报告已保存到: {args.report}")
+
+    failing = {ERROR: (ERROR,), WARNING: SEVERITIES, "never": ()}[args.fail_on]
+    if any(summary[f"{severity}s"] for severity in failing):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
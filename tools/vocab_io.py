@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+词库文件流式读写
+条目逐个生成、逐个写入，内存峰值只与单个条目大小相关，与词库规模无关
+"""
+
+import itertools
+import json
+import os
+import re
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from string_table import FORMAT_NAME as STRTAB_FORMAT, StringTableDeck, write_string_table
+
+# 流式读取时每次读入的字符数
+READ_CHUNK_SIZE = 1 << 16
+
+# 输出格式：pretty 为缩进JSON（默认，与历史文件一致），compact 为压缩JSON，ndjson 为每行一个条目，
+# strtab 为共享字符串表编码（见 string_table.py）
+OUTPUT_FORMATS = ("pretty", "compact", "ndjson", "strtab")
+
+FORMAT_EXTENSIONS = {
+    "pretty": ".json",
+    "compact": ".json",
+    "ndjson": ".ndjson",
+    "strtab": ".strtab.json",
+}
+
+# 字符串表文件以固定前缀开头，据此与NDJSON区分
+_STRTAB_PREFIX = '{"format":"%s"' % STRTAB_FORMAT
+
+_decoder = json.JSONDecoder()
+
+# 统计条目数时使用：先删去完整的字符串，再删去括号和逗号以外的字符
+_JSON_STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"')
+_NON_STRUCTURE = re.compile(r'[^\[\]{},]+')
+_JSON_GROUP = re.compile(r'\[[^\[\]{}]*\]|\{[^\[\]{}]*\}')
+_UNCLOSED = re.compile(r'[\[\]{}]')
+# 由非引号字符和完整字符串组成的最长前缀；其后如果还有内容，一定从一个未闭合的字符串开始
+_COMPLETE_PREFIX = re.compile(r'(?:[^"]+|"[^"\\]*(?:\\.[^"\\]*)*")*')
+
+# 缩进2格的数组中顶层对象的开头；其他字符开头的顶层元素说明不是对象数组
+_PRETTY_ENTRY = b"\n  {"
+_PRETTY_NON_OBJECT = re.compile(rb"\n  [^ {}]")
+
+
+def _pretty_entry(entry: Dict) -> str:
+    # 与 json.dump(list, indent=2) 中每个元素的格式完全一致
+    return "  " + json.dumps(entry, ensure_ascii=False, indent=2).replace("\n", "\n  ")
+
+
+def _compact_entry(entry: Dict) -> str:
+    return json.dumps(entry, ensure_ascii=False, separators=(",", ":"))
+
+
+def format_path(filepath: str, fmt: str) -> str:
+    """按输出格式调整文件扩展名（ndjson 使用 .ndjson，strtab 使用 .strtab.json）"""
+    for suffix in (".strtab.json", ".ndjson", ".json"):
+        if filepath.endswith(suffix):
+            return filepath[:-len(suffix)] + FORMAT_EXTENSIONS[fmt]
+    return filepath
+
+
+def _write_entries(f, entries: Iterable[Dict], fmt: str) -> int:
+    count = 0
+    if fmt == "strtab":
+        return write_string_table(f, entries)
+
+    if fmt == "ndjson":
+        for entry in entries:
+            f.write(_compact_entry(entry))
+            f.write("\n")
+            count += 1
+        return count
+
+    if fmt == "compact":
+        open_sep, sep, close, encode = "[", ",", "]", _compact_entry
+    else:
+        open_sep, sep, close, encode = "[\n", ",\n", "\n]", _pretty_entry
+
+    for entry in entries:
+        f.write(open_sep if count == 0 else sep)
+        f.write(encode(entry))
+        count += 1
+    f.write(close if count else "[]")
+    return count
+
+
+def write_vocabulary(entries: Iterable[Dict], filepath: str, fmt: str = "pretty") -> int:
+    """将条目流式写入词库文件，返回写入的条目数
+
+    pretty 格式与 json.dump(list(entries), f, ensure_ascii=False, indent=2) 逐字节一致。
+    strtab 格式需要先收集全部条目才能建立字符串表，不是流式写入。
+    先写入临时文件再替换，生成中途失败不会留下半个词库。
+    """
+    if fmt not in OUTPUT_FORMATS:
+        raise ValueError(f"未知的输出格式: {fmt}（可选: {', '.join(OUTPUT_FORMATS)}）")
+
+    os.makedirs(os.path.dirname(os.path.abspath(filepath)), exist_ok=True)
+    tmp_path = filepath + ".tmp"
+
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            count = _write_entries(f, entries, fmt)
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    return count
+
+
+def load_vocabulary(filepath: str) -> List[Dict]:
+    """一次性读取整个词库（JSON数组、NDJSON或字符串表）"""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        text = f.read()
+    if text.lstrip().startswith("["):
+        return json.loads(text)
+    if text.lstrip().startswith(_STRTAB_PREFIX):
+        return list(StringTableDeck(json.loads(text)))
+    return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+def _iter_ndjson(f, head: str) -> Iterator[Dict]:
+    head_lines = head.split("\n")
+    # 首块的最后一行可能被截断，与文件剩余部分的第一行拼接
+    head_lines[-1] += f.readline()
+    for line in itertools.chain(head_lines, f):
+        if line.strip():
+            yield json.loads(line)
+
+
+def iter_vocabulary(filepath: str) -> Iterator[Dict]:
+    """逐个读取词库文件（JSON数组、NDJSON或字符串表）中的条目，不把整个文件解析到内存
+
+    字符串表只能整体解析，但条目仍是逐个展开的。
+    """
+    with open(filepath, 'r', encoding='utf-8') as f:
+        buffer = f.read(READ_CHUNK_SIZE).lstrip()
+        if buffer.startswith(_STRTAB_PREFIX):
+            yield from StringTableDeck(json.loads(buffer + f.read()))
+            return
+        if buffer.startswith("{"):
+            yield from _iter_ndjson(f, buffer)
+            return
+
+        if not buffer.startswith("["):
+            raise ValueError(f"{filepath} 不是JSON数组或NDJSON")
+        pos = 1
+        eof = False
+
+        while True:
+            # 跳过空白和分隔符
+            while True:
+                while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+                    pos += 1
+                if pos < len(buffer) or eof:
+                    break
+                buffer = f.read(READ_CHUNK_SIZE)
+                pos = 0
+                eof = not buffer
+
+            if pos >= len(buffer):
+                raise ValueError(f"{filepath} 意外结束")
+            if buffer[pos] == "]":
+                return
+
+            try:
+                entry, end = _decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                chunk = f.read(READ_CHUNK_SIZE)
+                eof = not chunk
+                buffer = buffer[pos:] + chunk
+                pos = 0
+                continue
+
+            # 数字等标量可能恰好在块边界被截断，读到后续分隔符前不能确认其完整
+            if end == len(buffer) and not eof and not isinstance(entry, (dict, list)):
+                chunk = f.read(READ_CHUNK_SIZE)
+                eof = not chunk
+                buffer = buffer[pos:] + chunk
+                pos = 0
+                continue
+
+            yield entry
+            pos = end
+
+
+def _count_pretty_entries(filepath: str) -> Optional[int]:
+    """缩进2格的JSON对象数组：顶层条目都以“换行 + 两个空格 + {”开头，按字节计数即可
+
+    出现不是对象的顶层元素时返回 None。
+    """
+    count = 0
+    tail = b""
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            data = tail + chunk
+            if _PRETTY_NON_OBJECT.search(data):
+                return None
+            count += data.count(_PRETTY_ENTRY)
+            # 保留末尾3个字节，使跨块的匹配不会漏掉（4字节的匹配不可能完整落在其中而被重复计数）
+            tail = data[-3:]
+    return count
+
+
+def count_entries(filepath: str) -> int:
+    """统计词库条目数，不解析条目内容
+
+    生成器写出的缩进格式直接按行首计数；其他JSON数组先用正则删去字符串和括号、逗号以外的字符，
+    再反复删去最内层的完整括号组，剩下的顶层逗号数加一即为条目数。
+    按块读取时在字符串之外切分（压缩JSON整个文件只有一行，不能按换行切分），
+    截断的字符串留到下一块，因此每块只处理一次。
+    NDJSON和字符串表回退到逐条读取。
+    """
+    with open(filepath, 'r', encoding='utf-8') as f:
+        head = f.read(READ_CHUNK_SIZE)
+        while not head.lstrip()[1:].lstrip():
+            more = f.read(READ_CHUNK_SIZE)
+            if not more:
+                break
+            head += more
+
+        stripped = head.lstrip()
+        if not stripped.startswith("["):
+            return sum(1 for _ in iter_vocabulary(filepath))
+        if stripped[1:].lstrip().startswith("]"):
+            return 0
+        if stripped.startswith("[\n  {"):
+            count = _count_pretty_entries(filepath)
+            if count is not None:
+                return count
+
+        commas = 0
+        carry = ""
+        # 尚未闭合的条目的结构，跨块保留；最外层的 [ 不计入
+        pending = ""
+        chunk = head[len(head) - len(stripped) + 1:]
+        while True:
+            next_chunk = f.read(READ_CHUNK_SIZE)
+            text = carry + chunk
+            carry = ""
+            if next_chunk:
+                cut = _COMPLETE_PREFIX.match(text).end()
+                text, carry = text[:cut], text[cut:]
+
+            structure = pending + _NON_STRUCTURE.sub("", _JSON_STRING.sub("", text))
+            while True:
+                collapsed = _JSON_GROUP.sub("", structure)
+                if collapsed == structure:
+                    break
+                structure = collapsed
+
+            # 剩下的是顶层逗号，后面可能跟着未闭合条目的开括号（或文件末尾最外层的 ]）
+            match = _UNCLOSED.search(structure)
+            end = match.start() if match else len(structure)
+            commas += structure.count(",", 0, end)
+            pending = structure[end:]
+
+            if not next_chunk:
+                break
+            chunk = next_chunk
+
+        if pending != "]":
+            raise ValueError(f"{filepath} 意外结束")
+        return commas + 1
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+词库输出格式对比报告
+将每个词库分别写成 pretty / compact / ndjson 三种格式，统计磁盘大小和解析耗时
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from typing import Dict, List
+
+from asset_build import VOCAB_DIR, list_decks
+from vocab_io import OUTPUT_FORMATS, format_path, load_vocabulary, write_vocabulary
+
+
+def time_decode(filepath: str, repeat: int) -> float:
+    """多次解析取最快一次的耗时（秒）"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        load_vocabulary(filepath)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def measure_deck(filename: str, work_dir: str, repeat: int) -> Dict:
+    """测量单个词库在各格式下的大小和解析耗时"""
+    entries = load_vocabulary(os.path.join(VOCAB_DIR, filename))
+    row = {"deck": filename, "entries": len(entries), "formats": {}}
+
+    for fmt in OUTPUT_FORMATS:
+        filepath = format_path(os.path.join(work_dir, filename), fmt)
+        write_vocabulary(entries, filepath, fmt)
+        row["formats"][fmt] = {
+            "bytes": os.path.getsize(filepath),
+            "decode_ms": time_decode(filepath, repeat) * 1000,
+        }
+        os.remove(filepath)
+
+    return row
+
+
+def print_report(rows: List[Dict]) -> None:
+    """打印对比表格"""
+    header = f"{'词库':<36} {'词汇数':>7}"
+    for fmt in OUTPUT_FORMATS:
+        header += f" {fmt + ' KB':>12} {fmt + ' ms':>11}"
+    print(header)
+    print("-" * len(header))
+
+    totals = {fmt: {"bytes": 0, "decode_ms": 0.0} for fmt in OUTPUT_FORMATS}
+    for row in rows:
+        line = f"{row['deck']:<36} {row['entries']:>7}"
+        for fmt in OUTPUT_FORMATS:
+            stats = row["formats"][fmt]
+            totals[fmt]["bytes"] += stats["bytes"]
+            totals[fmt]["decode_ms"] += stats["decode_ms"]
+            line += f" {stats['bytes'] / 1024:>12.1f} {stats['decode_ms']:>11.2f}"
+        print(line)
+
+    print("-" * len(header))
+    line = f"{'合计':<36} {sum(r['entries'] for r in rows):>7}"
+    for fmt in OUTPUT_FORMATS:
+        line += f" {totals[fmt]['bytes'] / 1024:>12.1f} {totals[fmt]['decode_ms']:>11.2f}"
+    print(line)
+
+    baseline = totals["pretty"]["bytes"] or 1
+    print()
+    for fmt in OUTPUT_FORMATS:
+        saved = 1 - totals[fmt]["bytes"] / baseline
+        print(f"  {fmt:<8} 体积 {totals[fmt]['bytes'] / 1024 / 1024:.2f} MB（相对 pretty 减少 {saved:.1%}），"
+              f"解析合计 {totals[fmt]['decode_ms']:.1f} ms")
+
+    print("\n💡 compact 可直接被应用内 json.decode 读取；ndjson 需要按行解析的加载器")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="对比词库各输出格式的大小和解析耗时")
+    parser.add_argument("--repeat", type=int, default=3, help="每个文件解析次数，取最快一次")
+    parser.add_argument("--output", help="将报告另存为JSON文件")
+    args = parser.parse_args()
+
+    print("📏 词库输出格式对比")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        rows = [measure_deck(f"{deck}.json", work_dir, args.repeat) for deck in list_decks()]
+
+    print_report(rows)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, ensure_ascii=False, indent=2)
+        print(f"\n📄 报告已保存到: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,11 +4,19 @@
 使用方法: python vocabulary_generator.py
 """
 
+import argparse
+import heapq
+import itertools
 import json
+import tempfile
 import urllib.request
-from typing import List, Dict
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 import os
 
+from thesaurus import get_thesaurus
+from vocab_io import OUTPUT_FORMATS, iter_vocabulary, write_vocabulary
+from vocabulary_stats import deck_stats, print_overview
+
 # ECDICT 星级词库来源
 ECDICT_STARS_URLS = {
     1: "https://github.com/skywind3000/ECDICT/raw/master/stardict.csv/ecdict-gui-stardict-1.csv",
@@ -50,6 +58,116 @@ CET_VOCABULARY = {
     }
 }
 
+# 合并时每个排序段在内存中保留的最大条目数
+MERGE_RUN_SIZE = 10000
+
+
+def normalize_headword(word) -> str:
+    """规范化单词：去除首尾空白并转为小写"""
+    return word.strip().lower() if isinstance(word, str) else ""
+
+
+def entry_richness(entry: Dict) -> Tuple[int, int, int]:
+    """条目内容的丰富程度：(非空字段数, 例句/同反义词/标签总数, 释义长度)"""
+    filled = sum(1 for value in entry.values() if value not in (None, "", [], {}))
+    items = sum(len(entry.get(field) or ()) for field in ("examples", "synonyms", "antonyms", "tags"))
+    return filled, items, len(entry.get("definition") or "")
+
+
+def keep_richest(entries: List[Dict]) -> Dict:
+    """保留内容最丰富的条目，相同时保留最先出现的"""
+    return max(entries, key=entry_richness)
+
+
+def union_tags(entries: List[Dict]) -> Dict:
+    """保留最先出现的条目，标签取所有重复条目的并集（按出现顺序）"""
+    merged = dict(entries[0])
+    merged["tags"] = list(dict.fromkeys(tag for entry in entries for tag in entry.get("tags") or ()))
+    return merged
+
+
+# 同一单词出现多次时的冲突处理策略
+MERGE_POLICIES: Dict[str, Callable[[List[Dict]], Dict]] = {
+    "richest": keep_richest,
+    "union_tags": union_tags,
+}
+
+
+def _is_sorted(filepath: str) -> bool:
+    """流式检查词库是否已按规范化单词排序（只保留上一个单词）"""
+    previous = ""
+    for entry in iter_vocabulary(filepath):
+        key = normalize_headword(entry.get("word"))
+        if key < previous:
+            return False
+        previous = key
+    return True
+
+
+def _unique_id(entry_id: str, seen_ids: Set[str]) -> str:
+    suffix = 2
+    while f"{entry_id}_{suffix}" in seen_ids:
+        suffix += 1
+    return f"{entry_id}_{suffix}"
+
+
+def _keyed(entries: Iterable[Dict], source: int) -> Iterator[Tuple[str, int, int, Dict]]:
+    # (单词, 输入序号, 条目序号, 条目)：前三项唯一，比较时不会比较到条目本身
+    for offset, entry in enumerate(entries):
+        yield normalize_headword(entry.get("word")), source, offset, entry
+
+
+def _read_run(filepath: str) -> Iterator[Tuple[str, int, int, Dict]]:
+    with open(filepath, 'r', encoding='utf-8') as f:
+        for line in f:
+            key, source, offset, entry = json.loads(line)
+            yield key, source, offset, entry
+
+
+def _spill_runs(filepath: str, source: int, run_size: int, run_dir: str) -> List[str]:
+    """把未排序的输入按单词排序后分段写入临时文件，每段最多 run_size 个条目"""
+    runs = []
+    keyed = _keyed(iter_vocabulary(filepath), source)
+    while True:
+        chunk = sorted(itertools.islice(keyed, run_size), key=lambda item: item[:3])
+        if not chunk:
+            break
+        run_path = os.path.join(run_dir, f"run_{source:03d}_{len(runs):05d}.ndjson")
+        with open(run_path, 'w', encoding='utf-8') as f:
+            for item in chunk:
+                f.write(json.dumps(item, ensure_ascii=False, separators=(",", ":")))
+                f.write("\n")
+        runs.append(run_path)
+    return runs
+
+
+def merge_sorted_entries(
+    streams: Iterable[Iterator[Tuple[str, int, int, Dict]]],
+    resolve: Callable[[List[Dict]], Dict],
+    stats: Dict[str, int],
+) -> Iterator[Dict]:
+    """多路归并已按单词排序的条目流，同一单词的条目按 resolve 合并为一个
+
+    不同词库的ID互相独立，不同单词可能使用同一个ID：ID已被先输出的条目占用时改为“原ID_序号”，
+    保证输出中的ID唯一。ID按单词排序时是乱序的，重复的ID可能相隔任意远，只能记住全部已输出的ID：
+    这个集合是归并中唯一随输出增长的部分，每个输出条目只占一个ID字符串（十万词约10MB），与条目内容大小无关。
+    """
+    merged = heapq.merge(*streams, key=lambda item: item[:3])
+    seen_ids: Set[str] = set()
+    for key, group in itertools.groupby(merged, key=lambda item: item[0]):
+        entries = [item[3] for item in group]
+        stats["read"] += len(entries)
+        stats["duplicates"] += len(entries) - 1
+        entry = resolve(entries) if len(entries) > 1 else entries[0]
+        entry_id = entry.get("id")
+        if isinstance(entry_id, str):
+            if entry_id in seen_ids:
+                entry = dict(entry, id=_unique_id(entry_id, seen_ids))
+                stats["renamed_ids"] += 1
+            seen_ids.add(entry["id"])
+        yield entry
+
+
 class VocabularyGenerator:
     """词库生成器"""
 
@@ -88,33 +206,12 @@ class VocabularyGenerator:
         }
 
     def _generate_synonyms(self, word: str) -> List[str]:
-        """生成同义词（简化版）"""
-        # 这里使用简单的映射，实际应用中应该从词库数据获取
-        synonym_map = {
-            "good": ["excellent", "fine", "great"],
-            "bad": ["terrible", "poor", "awful"],
-            "big": ["large", "huge", "enormous"],
-            "small": ["tiny", "little", "minute"],
-            "happy": ["joyful", "glad", "cheerful"],
-            "sad": ["unhappy", "sorrowful", "depressed"],
-            "fast": ["quick", "rapid", "swift"],
-            "slow": ["sluggish", "leisurely", "unhurried"],
-        }
-        return synonym_map.get(word.lower(), [])
+        """从共享的同义词/反义词图查询同义词"""
+        return get_thesaurus().synonyms(word)
 
     def _generate_antonyms(self, word: str) -> List[str]:
-        """生成反义词（简化版）"""
-        antonym_map = {
-            "good": ["bad", "poor"],
-            "bad": ["good", "excellent"],
-            "big": ["small", "tiny"],
-            "small": ["big", "huge"],
-            "happy": ["sad", "unhappy"],
-            "sad": ["happy", "joyful"],
-            "fast": ["slow", "sluggish"],
-            "slow": ["fast", "quick"],
-        }
-        return antonym_map.get(word.lower(), [])
+        """从共享的同义词/反义词图查询反义词"""
+        return get_thesaurus().antonyms(word)
 
     def _get_pos_from_definition(self, definition: str) -> str:
         """从定义中推断词性"""
@@ -204,18 +301,19 @@ class VocabularyGenerator:
 
     def save_vocabulary(
         self,
-        vocabulary: List[Dict],
-        filename: str
-    ) -> None:
-        """保存词库到JSON文件"""
+        vocabulary: Iterable[Dict],
+        filename: str,
+        output_format: str = "pretty",
+    ) -> int:
+        """流式保存词库到JSON文件，返回词汇数"""
 
         filepath = os.path.join(self.output_dir, filename)
-        with open(filepath, 'w', encoding='utf-8') as File:
-            json.dump(vocabulary, File, ensure_ascii=False, indent=2)
+        count = write_vocabulary(vocabulary, filepath, output_format)
 
         print(f"✅ 词库已保存到: {filepath}")
-        print(f"📊 词汇数量: {len(vocabulary)}")
+        print(f"📊 词汇数量: {count}")
         print(f"📁 文件大小: {os.path.getsize(filepath) / 1024:.2f} KB")
+        return count
 
     def generate_cet4(self, count: int = 500) -> None:
         """生成CET4词库"""
@@ -274,77 +372,63 @@ class VocabularyGenerator:
     def merge_vocabularies(
         self,
         input_files: List[str],
-        output_file: str
-    ) -> None:
-        """合并多个词库文件"""
+        output_file: str,
+        policy: str = "richest",
+        run_size: int = MERGE_RUN_SIZE,
+        output_format: str = "pretty",
+    ) -> Dict[str, int]:
+        """按规范化单词流式合并多个词库，结果按单词排序
+
+        归并前先流式检查每个输入是否已按单词排序：已排序的输入直接参与多路归并，
+        未排序的输入按 run_size 分段排序后写入临时文件，以排序段参与归并，输出只写一遍。
+        内存中最多同时保留一个排序段、每路归并的当前条目和已输出的ID集合（见 merge_sorted_entries）。
+        同一单词出现多次时按 policy 处理：richest 保留内容最丰富的条目，union_tags 保留最先出现的条目并合并标签。
+        """
+
+        if policy not in MERGE_POLICIES:
+            raise ValueError(f"未知的冲突处理策略: {policy}（可选: {', '.join(MERGE_POLICIES)}）")
 
         print(f"🔄 开始合并词库...")
 
-        merged_vocabulary = []
-        word_ids = set()
-
-        for input_file in input_files:
-            filepath = os.path.join(self.output_dir, input_file)
-            if not os.path.exists(filepath):
-                print(f"⚠️  文件不存在: {filepath}")
-                continue
-
-            with open(filepath, 'r', encoding='utf-8') as f:
-                vocabulary = json.load(f)
-                for word in vocabulary:
-                    if word['id'] not in word_ids:
-                        merged_vocabulary.append(word)
-                        word_ids.add(word['id'])
-
-            print(f"✅ 已加载: {input_file} ({len(vocabulary)} 词)")
-
-        # 按ID排序
-        merged_vocabulary.sort(key=lambda x: x['id'])
-
-        self.save_vocabulary(merged_vocabulary, output_file)
+        stats = {"inputs": 0, "runs": 0, "read": 0, "duplicates": 0, "renamed_ids": 0, "written": 0}
+        with tempfile.TemporaryDirectory(prefix="merge_runs_") as run_dir:
+            streams = []
+            for source, input_file in enumerate(input_files):
+                filepath = os.path.join(self.output_dir, input_file)
+                if not os.path.exists(filepath):
+                    print(f"⚠️  文件不存在: {filepath}")
+                    continue
+                stats["inputs"] += 1
+                if _is_sorted(filepath):
+                    streams.append(_keyed(iter_vocabulary(filepath), source))
+                    stats["runs"] += 1
+                else:
+                    runs = _spill_runs(filepath, source, run_size, run_dir)
+                    streams.extend(_read_run(run_path) for run_path in runs)
+                    stats["runs"] += len(runs)
+                    print(f"🔀 未按单词排序，已分段排序: {input_file} ({len(runs)} 段)")
+
+            merged = merge_sorted_entries(streams, MERGE_POLICIES[policy], stats)
+            stats["written"] = self.save_vocabulary(merged, output_file, output_format)
+
+        print(f"📊 读取 {stats['read']} 词，合并重复单词 {stats['duplicates']} 个（策略: {policy}）")
+        if stats["renamed_ids"]:
+            print(f"🆔 {stats['renamed_ids']} 个条目的ID与其他单词重复，已加序号改为唯一ID")
+        return stats
 
     def generate_statistics(self, filename: str) -> None:
-        """生成词库统计信息"""
+        """生成词库统计信息（一次读取算出全部指标，按内容哈希缓存）"""
 
         filepath = os.path.join(self.output_dir, filename)
         if not os.path.exists(filepath):
             print(f"❌ 文件不存在: {filepath}")
             return
 
-        with open(filepath, 'r', encoding='utf-8') as f:
-            vocabulary = json.load(f)
-
-        # 统计信息
-        total_words = len(vocabulary)
-        difficulty_distribution = {}
-        tag_distribution = {}
+        print_overview(filename, deck_stats(filepath))
 
-        for word in vocabulary:
-            # 难度分布
-            difficulty = word.get('difficulty', 0)
-            difficulty_distribution[difficulty] = difficulty_distribution.get(difficulty, 0) + 1
 
-            # 标签分布
-            for tag in word.get('tags', []):
-                tag_distribution[tag] = tag_distribution.get(tag, 0) + 1
-
-        print(f"\n📊 词库统计信息 - {filename}")
-        print("=" * 50)
-        print(f"总词汇数: {total_words}")
-        print(f"\n难度分布:")
-        for difficulty in sorted(difficulty_distribution.keys()):
-            count = difficulty_distribution[difficulty]
-            percentage = (count / total_words) * 100
-            print(f"  难度 {difficulty}: {count} 词 ({percentage:.1f}%)")
-
-        print(f"\n标签分布:")
-        for tag, count in sorted(tag_distribution.items(), key=lambda x: x[1], reverse=True):
-            percentage = (count / total_words) * 100
-            print(f"  {tag}: {count} 词 ({percentage:.1f}%)")
-
-
-def main():
-    """主函数"""
+def interactive_menu():
+    """交互式菜单"""
 
     print("╔" + "═" * 58 + "╗")
     print("║" + " " * 10 + "词库生成工具" + " " * 36 + "║")
@@ -412,5 +496,52 @@ def main():
         print(f"\n❌ 错误: {e}")
 
 
+def main():
+    """主函数：带子命令时直接执行，不带子命令时进入交互式菜单"""
+
+    parser = argparse.ArgumentParser(description="词库生成工具")
+    parser.add_argument("--output-dir", default="assets/vocabularies", help="词库目录")
+    subparsers = parser.add_subparsers(dest="command")
+
+    for level in ("cet4", "cet6"):
+        level_parser = subparsers.add_parser(level, help=f"生成{level.upper()}词库")
+        level_parser.add_argument("--count", type=int, default=500, help="词汇数")
+
+    merge_parser = subparsers.add_parser("merge", help="按单词流式合并多个词库")
+    merge_parser.add_argument("inputs", nargs="+", help="要合并的词库文件名（相对于词库目录）")
+    merge_parser.add_argument("--output", "-o", required=True, help="输出文件名")
+    merge_parser.add_argument("--policy", choices=list(MERGE_POLICIES), default="richest",
+                              help="同一单词重复时的处理：richest 保留内容最丰富的条目，union_tags 保留首个条目并合并标签")
+    merge_parser.add_argument("--run-size", type=int, default=MERGE_RUN_SIZE,
+                              help="未排序输入每个排序段的条目数（决定内存占用上限）")
+    merge_parser.add_argument("--format", choices=OUTPUT_FORMATS, default="pretty", help="输出格式")
+
+    stats_parser = subparsers.add_parser("stats", help="查看词库统计")
+    stats_parser.add_argument("filename", help="词库文件名")
+
+    subparsers.add_parser("all", help="批量生成所有词库")
+
+    args = parser.parse_args()
+    if args.command is None:
+        interactive_menu()
+        return
+
+    generator = VocabularyGenerator(args.output_dir)
+    if args.command == "cet4":
+        generator.generate_cet4(count=args.count)
+    elif args.command == "cet6":
+        generator.generate_cet6(count=args.count)
+    elif args.command == "merge":
+        stats = generator.merge_vocabularies(args.inputs, args.output, args.policy, args.run_size, args.format)
+        if stats["inputs"] < len(args.inputs):
+            raise SystemExit(1)
+    elif args.command == "stats":
+        generator.generate_statistics(args.filename)
+    elif args.command == "all":
+        generator.generate_cet4(count=500)
+        print()
+        generator.generate_cet6(count=500)
+
+
 if __name__ == "__main__":
     main()
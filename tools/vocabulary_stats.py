@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+词库统计引擎
+每个词库只流式读取一遍，同时算出全部指标（难度分布、标签分布、基础标签子集、大写缩写词/专有名词、
+级别标签的缺失与位置），结果按文件大小、修改时间和内容哈希缓存，文件未变时不再读取词库
+
+子命令：
+  difficulty  难度分布（原 assets/vocabularies/check_difficulty.py）
+  tags        标签分布与问题词汇（原 analyze_kaoyan.py）
+  check-tags  级别标签缺失与位置（原 check_kaoyan.py）
+  show        总数、难度与标签分布（VocabularyGenerator.generate_statistics）
+  json        输出原始统计数据
+"""
+
+import argparse
+import json
+import os
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from asset_build import CACHE_DIR, PROJECT_ROOT, VOCAB_DIR, hash_file
+from tag_registry import get_registry, mask_array, matched_indices
+from vocab_io import iter_vocabulary
+
+# 统计项或计算方式变化时递增，使缓存失效
+STATS_VERSION = 2
+
+STATS_CACHE_PATH = os.path.join(CACHE_DIR, "vocabulary_stats_cache.json")
+
+# 难度不超过该值的词汇视为简单词汇
+SIMPLE_MAX_DIFFICULTY = 2
+
+# 只含这些标签的词汇视为基础词汇（对考研等高级词库而言过于简单）
+BASIC_TAGS = frozenset({"zk", "gk", "cet4", "ky"})
+
+# 标签集合查询按块进行：每块条目的位掩码组成一个数组，一次算出整块的结果
+MASK_BLOCK_SIZE = 4096
+
+# 长度不超过该值的全大写单词视为缩写词
+ABBREVIATION_MAX_LENGTH = 5
+
+SPECIAL_CATEGORIES = {
+    '宗教': ['Christ', 'Buddhist', 'Catholic', 'Christian', 'Jesus'],
+    '地名': ['Latin', 'Atlantic', 'Arab', 'Asian', 'Canada'],
+    '历史': ['B.C.', 'Marxist'],
+}
+_SPECIAL_WORDS = {word: category for category, words in SPECIAL_CATEGORIES.items() for word in words}
+
+# 词库名前缀 → 级别标签；未列出的词库以前缀本身为级别标签（如 cet4_ultra → cet4）
+PRIMARY_TAGS = {"kaoyan": "ky"}
+
+# 词库名前缀 → 报告标题中的词库名称；未列出的词库统称“词库”
+DECK_TITLES = {"kaoyan": "考研词库"}
+
+# 默认参与难度分布分析的词库
+DIFFICULTY_DECKS = [
+    ("cet4_ultra", "CET-4"),
+    ("cet6_ultra", "CET-6"),
+    ("toefl_ultra", "TOEFL"),
+    ("ielts_ultra", "IELTS"),
+    ("gre_ultra", "GRE"),
+    ("kaoyan_complete", "考研"),
+]
+
+# 各类示例保留的条目数
+SAMPLE_LIMITS = {
+    "basic_only": 30,
+    "abbreviations": 20,
+    "special": 20,
+    "missing_primary": 20,
+    "primary_not_first": 10,
+    "first_words": 10,
+}
+
+
+def deck_path(deck: str) -> str:
+    """词库名或文件路径 → 文件路径"""
+    if os.path.exists(deck):
+        return deck
+    return os.path.join(VOCAB_DIR, deck if deck.endswith(".json") else f"{deck}.json")
+
+
+def _deck_prefix(filepath: str) -> str:
+    return os.path.basename(filepath).split(".")[0].split("_")[0]
+
+
+def primary_tag(filepath: str) -> str:
+    prefix = _deck_prefix(filepath)
+    return PRIMARY_TAGS.get(prefix, prefix)
+
+
+def deck_title(filepath: str) -> str:
+    return DECK_TITLES.get(_deck_prefix(filepath), "词库")
+
+
+class _Sampled:
+    """计数 + 前若干个示例"""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.count = 0
+        self.samples: List = []
+
+    def add(self, sample) -> None:
+        self.count += 1
+        if len(self.samples) < self.limit:
+            self.samples.append(sample)
+
+    def to_dict(self) -> Dict:
+        return {"count": self.count, "samples": self.samples}
+
+
+def compute_stats(filepath: str) -> Dict:
+    """流式读取一遍词库，计算全部统计指标"""
+    tag = primary_tag(filepath)
+    # 标签集合查询使用位掩码（见 tag_registry.py），每 MASK_BLOCK_SIZE 个条目整体运算一次；
+    # 级别标签未注册时按列表判断
+    registry = get_registry()
+    basic_mask = registry.mask(BASIC_TAGS)
+    primary_mask = registry.mask([tag]) if tag in registry else None
+    difficulty = Counter()
+    tags = Counter()
+    missing_tags = Counter()
+    sampled = {name: _Sampled(limit) for name, limit in SAMPLE_LIMITS.items() if name != "first_words"}
+    first_words = []
+    special = []
+    total = 0
+    block: List[Tuple[str, List]] = []
+    block_masks: List[int] = []
+
+    def check_block() -> None:
+        masks = mask_array(block_masks)
+        # 只含基础标签（没有标签的条目也算）
+        for i in matched_indices(registry.match(masks, subset=basic_mask)):
+            sampled["basic_only"].add(list(block[i]))
+        if primary_mask:
+            missing = matched_indices(registry.match(masks, none_of=primary_mask))
+        else:
+            missing = [i for i, (_, entry_tags) in enumerate(block) if tag not in entry_tags]
+        for i in missing:
+            sampled["missing_primary"].add(list(block[i]))
+            missing_tags.update(block[i][1])
+        block.clear()
+        block_masks.clear()
+
+    for entry in iter_vocabulary(filepath):
+        total += 1
+        word = entry.get("word") or ""
+        entry_tags = entry.get("tags") or []
+
+        level = entry.get("difficulty")
+        if isinstance(level, int) and not isinstance(level, bool):
+            difficulty[level] += 1
+
+        tags.update(entry_tags)
+        block.append((word, entry_tags))
+        block_masks.append(registry.mask(entry_tags))
+        if len(block) == MASK_BLOCK_SIZE:
+            check_block()
+        if len(first_words) < SAMPLE_LIMITS["first_words"]:
+            first_words.append([word, entry_tags])
+
+        if word.isupper() and len(word) <= ABBREVIATION_MAX_LENGTH:
+            sampled["abbreviations"].add([word, (entry.get("definition") or "")[:50]])
+
+        category = _SPECIAL_WORDS.get(word)
+        if category is not None and len(special) < SAMPLE_LIMITS["special"]:
+            special.append([category, word, entry_tags])
+
+        if not entry_tags or entry_tags[0] != tag:
+            sampled["primary_not_first"].add([word, entry_tags])
+    check_block()
+
+    difficulty_count = sum(difficulty.values())
+    return {
+        "version": STATS_VERSION,
+        "total": total,
+        "difficulty": sorted(difficulty.items()),
+        "average_difficulty": sum(k * v for k, v in difficulty.items()) / difficulty_count if difficulty_count else None,
+        "simple": sum(v for k, v in difficulty.items() if k <= SIMPLE_MAX_DIFFICULTY),
+        "tags": tags.most_common(),
+        "basic_only": sampled["basic_only"].to_dict(),
+        "abbreviations": sampled["abbreviations"].to_dict(),
+        "special": special,
+        "primary_tag": tag,
+        "missing_primary": {**sampled["missing_primary"].to_dict(), "tags": missing_tags.most_common()},
+        "primary_not_first": sampled["primary_not_first"].to_dict(),
+        "first_words": first_words,
+    }
+
+
+def _load_cache() -> Dict:
+    try:
+        with open(STATS_CACHE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache: Dict) -> None:
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = STATS_CACHE_PATH + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, ensure_ascii=False, sort_keys=True)
+    os.replace(tmp_path, STATS_CACHE_PATH)
+
+
+def _cache_key(filepath: str) -> str:
+    filepath = os.path.abspath(filepath)
+    if filepath.startswith(PROJECT_ROOT + os.sep):
+        return os.path.relpath(filepath, PROJECT_ROOT)
+    return filepath
+
+
+def get_stats(filepaths: Sequence[str], use_cache: bool = True) -> Tuple[Dict[str, Dict], int]:
+    """获取多个词库的统计，返回（文件路径 → 统计, 重新计算的词库数）
+
+    大小和修改时间与缓存一致时直接复用；不一致时计算哈希，内容未变则只更新缓存的元数据。
+    """
+    cache = _load_cache() if use_cache else {}
+    results = {}
+    recomputed = 0
+    for filepath in filepaths:
+        key = _cache_key(filepath)
+        stat = os.stat(filepath)
+        cached = cache.get(key)
+        if cached and cached["stats"].get("version") != STATS_VERSION:
+            cached = None
+
+        if cached and cached["size"] == stat.st_size and cached["mtime_ns"] == stat.st_mtime_ns:
+            results[filepath] = cached["stats"]
+            continue
+
+        digest = hash_file(filepath)
+        if cached and cached["sha256"] == digest:
+            stats = cached["stats"]
+        else:
+            stats = compute_stats(filepath)
+            recomputed += 1
+        cache[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest, "stats": stats}
+        results[filepath] = stats
+
+    if use_cache:
+        _save_cache(cache)
+    return results, recomputed
+
+
+def deck_stats(filepath: str, use_cache: bool = True) -> Dict:
+    """单个词库的统计"""
+    return get_stats([filepath], use_cache)[0][filepath]
+
+
+def _percent(count: int, total: int) -> float:
+    return count / total * 100 if total else 0.0
+
+
+def print_difficulty(name: str, filename: str, stats: Dict) -> None:
+    total = stats["total"]
+    print(f"━━━ {name} ({filename}) ━━━")
+    print(f"总词汇数: {total:,}")
+    print("难度分布:")
+    for level, count in stats["difficulty"]:
+        percentage = _percent(count, total)
+        bar = '█' * int(percentage / 2)
+        print(f"  难度{level}: {count:5d} ({percentage:5.1f}%) {bar}")
+    if stats["average_difficulty"] is not None:
+        print(f"  平均难度: {stats['average_difficulty']:.2f}")
+    print(f"  简单词汇(难度1-{SIMPLE_MAX_DIFFICULTY}): {stats['simple']} ({_percent(stats['simple'], total):.1f}%)")
+    print()
+
+
+def print_tags(stats: Dict) -> None:
+    total = stats["total"]
+    print("=== 标签分布 ===")
+    for tag, count in stats["tags"]:
+        print(f"{tag:10s}: {count:4d} ({_percent(count, total):5.1f}%)")
+
+    print("\n=== 问题词汇分析 ===")
+    basic = stats["basic_only"]
+    print(f"⚠️  只包含基础标签的简单词汇: {basic['count']} ({_percent(basic['count'], total):.1f}%)")
+    print(f"\n前{SAMPLE_LIMITS['basic_only']}个简单词汇示例:")
+    for word, tags in basic["samples"]:
+        print(f"  {word:20s} {tags}")
+
+    print("\n=== 专有名词/特殊词汇 ===")
+    if stats["special"]:
+        print("找到的专有名词/特殊词汇:")
+        for category, word, tags in stats["special"]:
+            print(f"  [{category}] {word:15s} {tags}")
+
+    print("\n=== 大写缩写词/特殊词 ===")
+    abbreviations = stats["abbreviations"]
+    print(f"大写缩写词: {abbreviations['count']}")
+    if abbreviations["samples"]:
+        print(f"前{SAMPLE_LIMITS['abbreviations']}个:")
+        for word, definition in abbreviations["samples"]:
+            print(f"  {word:10s} {definition}")
+
+
+def print_tag_checks(stats: Dict) -> None:
+    tag = stats["primary_tag"]
+    print(f"总词汇数: {stats['total']:,}\n")
+
+    missing = stats["missing_primary"]
+    print(f"❌ 没有'{tag}'标签的词汇: {missing['count']}")
+    if missing["count"]:
+        print(f"\n前{SAMPLE_LIMITS['missing_primary']}个缺失'{tag}'标签的词汇:")
+        for word, tags in missing["samples"]:
+            print(f"  {word:20s} {tags}")
+        print("\n这些词汇的标签分布:")
+        for other, count in missing["tags"]:
+            print(f"  {other}: {count}")
+
+    not_first = stats["primary_not_first"]
+    print(f"\n⚠️  '{tag}'标签不在第一位的词汇: {not_first['count']}")
+    if not_first["count"]:
+        print(f"\n前{SAMPLE_LIMITS['primary_not_first']}个{tag}标签不在第一位的词汇:")
+        for word, tags in not_first["samples"]:
+            print(f"  {word:20s} {tags}")
+
+    print(f"\n前{SAMPLE_LIMITS['first_words']}个词汇示例:")
+    for word, tags in stats["first_words"]:
+        print(f"  {word:20s} {tags}")
+
+
+def print_overview(filename: str, stats: Dict) -> None:
+    total = stats["total"]
+    print(f"\n📊 词库统计信息 - {filename}")
+    print("=" * 50)
+    print(f"总词汇数: {total}")
+    print(f"\n难度分布:")
+    for level, count in stats["difficulty"]:
+        print(f"  难度 {level}: {count} 词 ({_percent(count, total):.1f}%)")
+    print(f"\n标签分布:")
+    for tag, count in stats["tags"]:
+        print(f"  {tag}: {count} 词 ({_percent(count, total):.1f}%)")
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    parser = argparse.ArgumentParser(description="词库统计引擎")
+    parser.add_argument("--no-cache", action="store_true", help="不读写统计缓存，重新计算")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    difficulty_parser = subparsers.add_parser("difficulty", help="难度分布")
+    difficulty_parser.add_argument("decks", nargs="*", help="词库名或文件路径（默认各考试词库）")
+
+    tags_parser = subparsers.add_parser("tags", help="标签分布与问题词汇")
+    tags_parser.add_argument("deck", nargs="?", default="kaoyan_complete", help="词库名或文件路径")
+
+    check_parser = subparsers.add_parser("check-tags", help="级别标签缺失与位置")
+    check_parser.add_argument("deck", nargs="?", default="kaoyan_complete", help="词库名或文件路径")
+
+    show_parser = subparsers.add_parser("show", help="总数、难度与标签分布")
+    show_parser.add_argument("deck", help="词库名或文件路径")
+
+    json_parser = subparsers.add_parser("json", help="输出原始统计数据")
+    json_parser.add_argument("decks", nargs="+", help="词库名或文件路径")
+
+    args = parser.parse_args(argv)
+    use_cache = not args.no_cache
+
+    if args.command == "difficulty":
+        decks = [(deck, deck) for deck in args.decks] or DIFFICULTY_DECKS
+        paths = [deck_path(deck) for deck, _ in decks]
+        stats, _ = get_stats(paths, use_cache)
+        print("=== 词库难度分布分析 ===\n")
+        for (_, name), path in zip(decks, paths):
+            print_difficulty(name, os.path.basename(path), stats[path])
+
+    elif args.command == "tags":
+        path = deck_path(args.deck)
+        print(f"=== {deck_title(path)}深度分析 ===\n")
+        print_tags(deck_stats(path, use_cache))
+
+    elif args.command == "check-tags":
+        path = deck_path(args.deck)
+        print(f"=== {deck_title(path)}详细检查 ===\n")
+        print_tag_checks(deck_stats(path, use_cache))
+
+    elif args.command == "show":
+        path = deck_path(args.deck)
+        print_overview(os.path.basename(path), deck_stats(path, use_cache))
+
+    elif args.command == "json":
+        paths = [deck_path(deck) for deck in args.decks]
+        stats, _ = get_stats(paths, use_cache)
+        print(json.dumps({_cache_key(path): stats[path] for path in paths}, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+跨词库共享词池构建工具
+同一个单词往往完整地重复出现在多个词库中（如 abandon 出现在 cet4_full、cet4_ultra、kaoyan_complete、toefl_* 等），
+这里把所有词库的条目按规范化单词合并为一个词池，每个词库只保存有序的词池编号和与词池不同的字段（如难度、标签），
+并统计资源体积与内存占用的节省
+
+词池不打包进应用：应用中大型词库以分片打包（见 deck_shards.py），词池与分片会重复打包同一份数据，
+因此这里只作为构建产物输出到 tools/.cache，用于评估共享存储的节省和检查各词库能否逐条还原
+
+输出结构（tools/.cache/word_pool/）：
+  words.json   词池：[{字段: 值}]，下标即词池编号，每个字段取各词库中最常见的值
+  <词库>.json  {"entries": [词池编号], "id_format": 条目ID规则, "overrides": {下标: {字段: 值}}, "removed": {下标: [字段]}}
+
+还原条目：{"id": ID, **词池[编号], **overrides[下标]}，再删去 removed[下标] 中的字段
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+import tracemalloc
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from asset_build import CACHE_DIR, VOCAB_DIR, BuildJob, add_build_arguments, list_decks, print_build_summary, run_jobs
+from vocab_io import iter_vocabulary, load_vocabulary
+
+# 合并逻辑或格式变化时递增，使增量构建失效
+GENERATOR_VERSION = "1"
+POOL_VERSION = 1
+
+POOL_DIR = os.path.join(CACHE_DIR, "word_pool")
+POOL_FILE = "words.json"
+
+_COMPACT = dict(ensure_ascii=False, separators=(",", ":"))
+
+# 字段在某个条目中不存在
+_ABSENT = "\0absent"
+
+# 条目ID：前缀 + 定宽序号，如 cet4_00001
+_ID_PATTERN = re.compile(r"^(.*?)(\d+)$", re.S)
+
+
+def normalize_word(word: str) -> str:
+    """规范化单词：去除首尾空白并转为小写"""
+    return word.strip().lower()
+
+
+def pool_path() -> str:
+    return os.path.join(POOL_DIR, POOL_FILE)
+
+
+def deck_list_path(deck: str) -> str:
+    return os.path.join(POOL_DIR, f"{deck}.json")
+
+
+def _deck_entries(deck: str) -> Iterator[Dict]:
+    return iter_vocabulary(os.path.join(VOCAB_DIR, f"{deck}.json"))
+
+
+def _headword(entry: Dict) -> str:
+    word = entry.get("word")
+    return normalize_word(word) if isinstance(word, str) else ""
+
+
+def _value_key(value) -> str:
+    return json.dumps(value, **_COMPACT, sort_keys=True)
+
+
+class FieldVotes:
+    """一个规范化单词在所有词库中各字段取值的出现次数"""
+
+    __slots__ = ("count", "fields", "values")
+
+    def __init__(self):
+        self.count = 0
+        # 字段 → Counter(取值键)；字段按首次出现的顺序排列
+        self.fields: Dict[str, Counter] = {}
+        # 取值键 → 原值
+        self.values: Dict[str, object] = {}
+
+    def add(self, entry: Dict) -> None:
+        for field in entry:
+            if field != "id" and field not in self.fields:
+                # 之前的条目都没有该字段
+                self.fields[field] = Counter({_ABSENT: self.count}) if self.count else Counter()
+        for field, votes in self.fields.items():
+            if field in entry:
+                key = _value_key(entry[field])
+                self.values.setdefault(key, entry[field])
+                votes[key] += 1
+            else:
+                votes[_ABSENT] += 1
+        self.count += 1
+
+    def canonical(self) -> Dict:
+        """每个字段取出现次数最多的值（次数相同时取最先出现的）；“不存在”最多的字段不放入词池"""
+        entry = {}
+        for field, votes in self.fields.items():
+            key = votes.most_common(1)[0][0]
+            if key != _ABSENT:
+                entry[field] = self.values[key]
+        return entry
+
+
+def _id_format(entries_id: Optional[str]) -> Optional[Dict]:
+    """由词库第一个条目的ID推断ID规则，之后的条目按序号递增"""
+    if not isinstance(entries_id, str):
+        return None
+    match = _ID_PATTERN.match(entries_id)
+    if not match:
+        return None
+    return {"prefix": match.group(1), "start": int(match.group(2)), "width": len(match.group(2))}
+
+
+def format_id(id_format: Optional[Dict], offset: int) -> Optional[str]:
+    """按ID规则生成第 offset 个条目的ID"""
+    if id_format is None:
+        return None
+    return f"{id_format['prefix']}{id_format['start'] + offset:0{id_format['width']}d}"
+
+
+def _diff(entry: Dict, canonical: Dict, expected_id: Optional[str]) -> Tuple[Dict, List[str]]:
+    """条目相对词池条目的差异：(覆盖字段, 需删除的字段)"""
+    overrides = {}
+    removed = [field for field in canonical if field not in entry]
+    if "id" in entry:
+        if entry["id"] != expected_id:
+            overrides["id"] = entry["id"]
+    elif expected_id is not None:
+        removed.append("id")
+    for field, value in entry.items():
+        if field != "id" and (field not in canonical or canonical[field] != value):
+            overrides[field] = value
+    return overrides, removed
+
+
+def _write_json(data, filepath: str) -> None:
+    tmp_path = filepath + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, **_COMPACT)
+    os.replace(tmp_path, filepath)
+
+
+def build_word_pool(decks: List[str]) -> Dict:
+    """合并全部词库写出词池和各词库的编号列表，返回统计数据
+
+    分两遍流式读取词库：第一遍统计每个单词各字段的取值，第二遍写出编号列表和差异字段。
+    """
+    votes: Dict[str, FieldVotes] = {}
+    total = 0
+    for deck in decks:
+        for entry in _deck_entries(deck):
+            votes.setdefault(_headword(entry), FieldVotes()).add(entry)
+            total += 1
+
+    headwords = sorted(votes)
+    pool = [votes[word].canonical() for word in headwords]
+    pool_ids = {word: i for i, word in enumerate(headwords)}
+    del votes
+
+    os.makedirs(POOL_DIR, exist_ok=True)
+    _write_json(pool, pool_path())
+
+    shared = 0
+    for deck in decks:
+        ids: List[int] = []
+        overrides: Dict[str, Dict] = {}
+        removed: Dict[str, List[str]] = {}
+        id_format = None
+        for offset, entry in enumerate(_deck_entries(deck)):
+            if offset == 0:
+                id_format = _id_format(entry.get("id"))
+            pool_id = pool_ids[_headword(entry)]
+            ids.append(pool_id)
+            entry_overrides, entry_removed = _diff(entry, pool[pool_id], format_id(id_format, offset))
+            if entry_overrides:
+                overrides[str(offset)] = entry_overrides
+            if entry_removed:
+                removed[str(offset)] = entry_removed
+            if not entry_overrides and not entry_removed:
+                shared += 1
+
+        _write_json({
+            "deck": deck,
+            "version": POOL_VERSION,
+            "pool": POOL_FILE,
+            "total": len(ids),
+            "id_format": id_format,
+            "entries": ids,
+            "overrides": overrides,
+            "removed": removed,
+        }, deck_list_path(deck))
+
+    # 删除已不存在的词库遗留的编号列表
+    current = {f"{deck}.json" for deck in decks} | {POOL_FILE}
+    for filename in os.listdir(POOL_DIR):
+        if filename.endswith(".json") and filename not in current:
+            os.remove(os.path.join(POOL_DIR, filename))
+
+    print(f"✅ {len(decks)} 个词库、{total:,} 个条目 → 词池 {len(pool):,} 个单词")
+    return {"decks": len(decks), "entries": total, "pool_words": len(pool), "shared_entries": shared}
+
+
+def create_build_jobs() -> List[BuildJob]:
+    """词池依赖全部词库，作为一个构建任务"""
+    decks = list_decks()
+    return [
+        BuildJob(
+            name="word_pool",
+            build=build_word_pool,
+            args=(decks,),
+            outputs=[pool_path()] + [deck_list_path(deck) for deck in decks],
+            input_files=[os.path.join(VOCAB_DIR, f"{deck}.json") for deck in decks],
+            version=GENERATOR_VERSION,
+        )
+    ]
+
+
+def load_pool() -> List[Dict]:
+    """读取词池"""
+    with open(pool_path(), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_deck_list(deck: str) -> Dict:
+    """读取词库的词池编号列表"""
+    with open(deck_list_path(deck), 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def expand_deck(deck_list: Dict, pool: List[Dict]) -> List[Dict]:
+    """由编号列表和词池还原词库条目；各条目共享词池中的字段值对象"""
+    id_format = deck_list["id_format"]
+    overrides = deck_list["overrides"]
+    removed = deck_list["removed"]
+
+    entries = []
+    for offset, pool_id in enumerate(deck_list["entries"]):
+        key = str(offset)
+        entry_id = format_id(id_format, offset)
+        entry = {"id": entry_id, **pool[pool_id]} if entry_id is not None else dict(pool[pool_id])
+        if key in overrides:
+            entry.update(overrides[key])
+        for field in removed.get(key, ()):
+            entry.pop(field, None)
+        entries.append(entry)
+    return entries
+
+
+def verify_pool(decks: List[str]) -> List[str]:
+    """逐个词库检查还原结果与原词库一致，返回不一致的词库"""
+    pool = load_pool()
+    return [
+        deck for deck in decks
+        if expand_deck(load_deck_list(deck), pool) != load_vocabulary(os.path.join(VOCAB_DIR, f"{deck}.json"))
+    ]
+
+
+def _decoded_bytes(load) -> int:
+    """load() 返回的对象在解码后保留的内存（字节）"""
+    tracemalloc.start()
+    try:
+        data = load()
+        size = tracemalloc.get_traced_memory()[0]
+        del data
+    finally:
+        tracemalloc.stop()
+    return size
+
+
+def measure_savings(decks: List[str]) -> Dict:
+    """对比独立词库与词池两种方式的资源体积，以及加载全部词库后保留的内存"""
+    deck_files = [os.path.join(VOCAB_DIR, f"{deck}.json") for deck in decks]
+    pool_files = [pool_path()] + [deck_list_path(deck) for deck in decks]
+
+    def read_json(filepath: str):
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def load_independent():
+        # 与应用的 loadMultipleVocabularies 相同：每个词库各自解析，条目互不共享
+        return [read_json(filepath) for filepath in deck_files]
+
+    def load_pooled():
+        pool = load_pool()
+        return pool, [expand_deck(load_deck_list(deck), pool) for deck in decks]
+
+    compact_bytes = 0
+    for filepath in deck_files:
+        compact_bytes += len(json.dumps(load_vocabulary(filepath), **_COMPACT).encode("utf-8"))
+
+    return {
+        "deck_bytes": sum(os.path.getsize(filepath) for filepath in deck_files),
+        "deck_compact_bytes": compact_bytes,
+        "pool_bytes": sum(os.path.getsize(filepath) for filepath in pool_files),
+        "deck_memory_bytes": _decoded_bytes(load_independent),
+        "pool_memory_bytes": _decoded_bytes(load_pooled),
+    }
+
+
+def print_report(stats: Dict, savings: Dict) -> None:
+    """打印词池统计和节省情况"""
+    entries = stats["entries"]
+    print(f"\n📖 {entries:,} 个条目 → 词池 {stats['pool_words']:,} 个单词"
+          f"（平均每个单词出现 {entries / max(stats['pool_words'], 1):.2f} 次）")
+    print(f"   与词池完全一致、无需覆盖字段的条目: {stats['shared_entries']:,}（{stats['shared_entries'] / max(entries, 1):.1%}）")
+
+    def row(label: str, before: int, after: int) -> None:
+        print(f"  {label:<20} {before / 1024 / 1024:>10.2f} MB → {after / 1024 / 1024:>8.2f} MB"
+              f"  节省 {before - after:>12,} 字节（{1 - after / before:.1%}）")
+
+    print()
+    row("资源体积（原格式）", savings["deck_bytes"], savings["pool_bytes"])
+    row("资源体积（压缩JSON）", savings["deck_compact_bytes"], savings["pool_bytes"])
+    row("加载全部词库的内存", savings["deck_memory_bytes"], savings["pool_memory_bytes"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="跨词库共享词池构建工具")
+    add_build_arguments(parser, output_format=False)
+    parser.add_argument("--verify", action="store_true", help="构建后检查每个词库都能由词池逐条还原")
+    parser.add_argument("--report", help="将统计与节省数据另存为JSON文件")
+    args = parser.parse_args()
+
+    print("🧺 构建跨词库共享词池")
+    print("=" * 60)
+
+    results = run_jobs(create_build_jobs(), force=args.force, workers=args.jobs)
+    print_build_summary(results)
+    if any(r["status"] == "failed" for r in results):
+        return
+
+    decks = list_decks()
+    if args.verify:
+        started = time.perf_counter()
+        mismatched = verify_pool(decks)
+        if mismatched:
+            print(f"\n❌ {len(mismatched)} 个词库无法由词池还原: {', '.join(mismatched)}")
+            raise SystemExit(1)
+        print(f"\n✅ {len(decks)} 个词库均可由词池逐条还原（{time.perf_counter() - started:.1f} 秒）")
+
+    stats = results[0]["result"]
+    savings = measure_savings(decks)
+    print_report(stats, savings)
+    print(f"\n📦 输出目录: {POOL_DIR}")
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump({**stats, **savings}, f, ensure_ascii=False, indent=2)
+        print(f"📄 报告已保存到: {args.report}")
+
+
+if __name__ == "__main__":
+    main()